@@ -175,10 +175,11 @@ class BondYStressModel:
         try:
             metrics = self.db.get_transmission_metrics(
                 start_date=str(target_date),
-                end_date=str(target_date)
+                end_date=str(target_date),
+                as_tuples=True
             )
 
-            return {m['metric_name']: m['metric_value'] for m in metrics} if metrics else None
+            return {m.metric_name: m.metric_value for m in metrics} if metrics else None
         except Exception as e:
             logger.error(f"Error fetching transmission metrics: {e}")
             return None
@@ -235,11 +236,12 @@ class BondYStressModel:
             historical_metrics = self.db.get_transmission_metrics(
                 metric_name='slope_10y_2y',
                 start_date=str(target_date - timedelta(days=252)),
-                end_date=str(target_date)
+                end_date=str(target_date),
+                as_tuples=True
             )
 
             if historical_metrics and slope is not None:
-                values = [m['metric_value'] for m in historical_metrics if m['metric_value'] is not None]
+                values = [m.metric_value for m in historical_metrics if m.metric_value is not None]
                 zscore = self._compute_zscore(slope, values) if len(values) > 5 else None
             else:
                 zscore = None
@@ -274,11 +276,12 @@ class BondYStressModel:
             historical_metrics = self.db.get_transmission_metrics(
                 metric_name='auction_bid_to_cover_median_20d',
                 start_date=str(target_date - timedelta(days=252)),
-                end_date=str(target_date)
+                end_date=str(target_date),
+                as_tuples=True
             )
 
             if historical_metrics:
-                values = [2.0 - m['metric_value'] for m in historical_metrics if m['metric_value'] is not None]
+                values = [2.0 - m.metric_value for m in historical_metrics if m.metric_value is not None]
                 zscore = self._compute_zscore(stress_value, values) if len(values) > 5 else None
             else:
                 zscore = None
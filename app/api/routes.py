@@ -1,22 +1,36 @@
 """
 FastAPI routes for data access
 """
+import json
 import logging
 import os
 import sqlite3
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from datetime import date as date_type
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from io import StringIO
 
+import duckdb
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+from app.analytics.alert_engine import AlertEngine
+from app.analytics.snapshot import DailySnapshotGenerator
+from app.analytics.stress_model import BondYStressModel
+from app.analytics.transmission import TransmissionAnalytics
+from app.cache import cached, response_cache
 from app.config import settings
-from app.db.schema import DatabaseManager, db_manager as default_db_manager
+from app.db.schema import COVERAGE_TABLES, DatabaseManager, db_manager as default_db_manager
+from app.ops import OpsManager
+from app.quality import DataQualityRunner
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +42,60 @@ db_manager: DatabaseManager = default_db_manager
 def set_db_manager(manager: DatabaseManager) -> None:
     global db_manager
     db_manager = manager
+    response_cache.clear()
+
+
+# Parsed-statement cache for the fixed SQL issued by admin endpoints.
+# DuckDB's Python API has no `prepare()`, but a parsed `Statement` can be
+# re-executed on any connection, which skips tokenize/parse on every request.
+_PREPARED: dict[str, "duckdb.Statement"] = {}
+_PREPARED_LOCK = threading.Lock()
+
+
+def _prep(sql: str) -> "duckdb.Statement":
+    """Return the cached parsed statement for `sql`, parsing it on first use."""
+    stmt = _PREPARED.get(sql)
+    if stmt is None:
+        with _PREPARED_LOCK:
+            stmt = _PREPARED.get(sql)
+            if stmt is None:
+                stmt = duckdb.extract_statements(sql)[0]
+                _PREPARED[sql] = stmt
+    return stmt
+
+
+# Short-lived per-date presence cache for run records, keyed by
+# (kind, YYYY-MM-DD) where kind is "dq" (dq_runs) or "bondy" (bondy_stress_daily).
+# Dashboards poll the same NOT_RUN dates on every refresh. Entries live in
+# response_cache tagged with their table, so the DB writers' invalidate() calls
+# drop them as soon as a run is written; everything else expires after the TTL.
+_PRESENCE_TTL_SECONDS = 60.0
+_PRESENCE_TABLES = {"dq": "dq_runs", "bondy": "bondy_stress_daily"}
+
+
+def _presence_get(kind: str, day: str) -> Optional[bool]:
+    """Return the cached presence flag, or None when unknown or expired."""
+    return response_cache.get(("presence", kind, day))
+
+
+def _presence_set(kind: str, day: str, present: bool) -> None:
+    response_cache.set(
+        ("presence", kind, day), present, _PRESENCE_TTL_SECONDS, tables=(_PRESENCE_TABLES[kind],)
+    )
+
+
+def _presence_discard(kind: str, day: str) -> None:
+    response_cache.discard(("presence", kind, day))
+
+
+# Coverage and drift aggregates only change when ingest writes; writers
+# invalidate them through app.cache, the TTL bounds writes from other processes.
+_ADMIN_AGGREGATE_TTL_SECONDS = 300.0
+
+
+def _db_scope() -> str:
+    """Cache scope for the active database, so swapped managers never share entries."""
+    return str(getattr(db_manager, "db_path", ""))
 
 
 # Create router
@@ -1085,7 +1153,7 @@ async def trigger_daily_ingest(
         pipeline = IngestionPipeline(db_manager=db_manager)
         selected = providers or list(getattr(pipeline, "DEFAULT_DAILY_PROVIDERS", []))
         # Validate provider names to avoid surprises / typos.
-        selected = [p for p in selected if p in getattr(pipeline, "PROVIDERS", {})]
+        selected = [p for p in selected if p in getattr(pipeline, "PROVIDER_PATHS", {})]
         results = pipeline.run_daily(providers=selected)
 
         return {"status": "completed", "providers": selected, "results": results}
@@ -3081,9 +3149,6 @@ async def compute_transmission_metrics(
     target_date: str = Query(..., description="Target date in YYYY-MM-DD format")
 ):
     """Compute transmission metrics for a specific date"""
-    from app.analytics.transmission import TransmissionAnalytics
-    from datetime import datetime
-
     try:
         target = datetime.strptime(target_date, "%Y-%m-%d").date()
 
@@ -3120,8 +3185,6 @@ async def compute_transmission_metrics_range(
     actually exist in source tables (union of dates across core datasets).
     This maximizes reuse of historical data even if a provider (e.g., interbank) lacks backfill.
     """
-    from app.analytics.transmission import TransmissionAnalytics
-    from datetime import datetime
 
     try:
         # Validate dates
@@ -3234,9 +3297,6 @@ async def get_today_snapshot_json(
     target_date: Optional[str] = Query(None, description="Target date in YYYY-MM-DD format (default: today)")
 ):
     """Get daily snapshot as JSON"""
-    from app.analytics.snapshot import DailySnapshotGenerator
-    from datetime import datetime
-
     try:
         if target_date:
             target = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -3313,7 +3373,6 @@ async def get_stress_drivers(
             raise HTTPException(status_code=404, detail="No stress data found for this date")
 
         record = records[0]
-        import json
         drivers = json.loads(record['driver_json']) if record.get('driver_json') else []
 
         return {
@@ -3351,17 +3410,21 @@ async def get_global_rates(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_iso_date(value: str) -> date:
+    """Parse a YYYY-MM-DD query parameter, mapping bad input to HTTP 400."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format, expected YYYY-MM-DD")
+
+
 @router.post("/api/admin/stress/compute")
 async def compute_stress_metrics(
     target_date: str = Query(..., description="Target date in YYYY-MM-DD format")
 ):
     """Compute BondY stress metrics for a specific date"""
-    from app.analytics.stress_model import BondYStressModel
-    from datetime import datetime
-    import json
-
     try:
-        target = datetime.strptime(target_date, "%Y-%m-%d").date()
+        target = _parse_iso_date(target_date)
 
         stress_model = BondYStressModel(db_manager)
         stress_index, regime_bucket, components = stress_model.compute_stress_index(target)
@@ -3374,6 +3437,7 @@ async def compute_stress_metrics(
             regime_bucket,
             driver_json
         )
+        _presence_set("bondy", str(target), True)
 
         return {
             "status": "completed",
@@ -3382,11 +3446,44 @@ async def compute_stress_metrics(
             "regime_bucket": regime_bucket,
             "drivers_count": len(components.get('drivers', []))
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error computing stress metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_SQL_STRESS_CANDIDATE_DATES = """
+SELECT DISTINCT date
+FROM transmission_daily_metrics
+WHERE metric_name = 'transmission_score'
+  AND metric_value IS NOT NULL
+  AND date >= ? AND date <= ?
+ORDER BY date
+"""
+
+_SQL_STRESS_CANDIDATE_PROBE = """
+SELECT 1
+FROM transmission_daily_metrics
+WHERE metric_name = 'transmission_score'
+  AND metric_value IS NOT NULL
+  AND date = ?
+LIMIT 1
+"""
+
+# Existing dates come back as a single LIST(VARCHAR) value, so the set is
+# built from one Python list instead of boxing and str()-ing every row.
+_SQL_STRESS_EXISTING_DATES = """
+SELECT list(CAST(date AS VARCHAR))
+FROM bondy_stress_daily
+WHERE date >= ? AND date <= ?
+"""
+
+# Up to this many unknown dates are probed with a point `IN (...)` lookup
+# instead of scanning the whole requested range.
+_STRESS_EXISTING_IN_LIST_MAX = 32
+
+
 @router.post("/api/admin/stress/compute-range")
 async def compute_stress_metrics_range(
     start_date: str = Query(..., description="Start date in YYYY-MM-DD format"),
@@ -3402,13 +3499,9 @@ async def compute_stress_metrics_range(
       transmission_daily_metrics available within the range.
     - Designed to be called repeatedly (like transmission compute-range) until pending=0.
     """
-    from app.analytics.stress_model import BondYStressModel
-    from datetime import datetime
-    import json
-
     try:
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start = _parse_iso_date(start_date)
+        end = _parse_iso_date(end_date)
         if start > end:
             raise HTTPException(status_code=400, detail="start_date must be <= end_date")
 
@@ -3417,30 +3510,49 @@ async def compute_stress_metrics_range(
         # - Stress index is defined as a composite anchored by Transmission score.
         # - Without transmission_score, stress computation often returns None and would
         #   remain "pending" forever (since we won't insert a record).
-        cand_rows = db_manager.con.execute(
-            """
-            SELECT DISTINCT date
-            FROM transmission_daily_metrics
-            WHERE metric_name = 'transmission_score'
-              AND metric_value IS NOT NULL
-              AND date >= ? AND date <= ?
-            ORDER BY date
-            """,
-            [start.isoformat(), end.isoformat()],
-        ).fetchall()
-        candidate_dates = [r[0] for r in cand_rows if r and r[0] is not None]
+        if start == end:
+            # Single-date requests only need an existence probe.
+            probe = db_manager.con.execute(
+                _prep(_SQL_STRESS_CANDIDATE_PROBE),
+                [start.isoformat()],
+            ).fetchone()
+            candidate_dates = [start] if probe else []
+        else:
+            # transmission_daily_metrics.date is NOT NULL, so every row is a usable date.
+            cand_rows = db_manager.con.execute(
+                _prep(_SQL_STRESS_CANDIDATE_DATES),
+                [start.isoformat(), end.isoformat()],
+            ).fetchall()
+            candidate_dates = [r[0] for r in cand_rows]
 
         existing_dates: set[str] = set()
         if skip_existing and candidate_dates:
-            rows = db_manager.con.execute(
-                """
-                SELECT date
-                FROM bondy_stress_daily
-                WHERE date >= ? AND date <= ?
-                """,
-                [start.isoformat(), end.isoformat()],
-            ).fetchall()
-            existing_dates = {str(r[0]) for r in rows if r and r[0] is not None}
+            unknown_dates: list[str] = []
+            for d in candidate_dates:
+                d_str = str(d)
+                present = _presence_get("bondy", d_str)
+                if present is None:
+                    unknown_dates.append(d_str)
+                elif present:
+                    existing_dates.add(d_str)
+
+            if unknown_dates:
+                if len(unknown_dates) <= _STRESS_EXISTING_IN_LIST_MAX:
+                    placeholders = ",".join(["?"] * len(unknown_dates))
+                    existing_sql = (
+                        "SELECT list(CAST(date AS VARCHAR)) FROM bondy_stress_daily "
+                        f"WHERE date IN ({placeholders})"
+                    )
+                    existing_params = unknown_dates
+                else:
+                    existing_sql = _SQL_STRESS_EXISTING_DATES
+                    existing_params = [start.isoformat(), end.isoformat()]
+                found = set(db_manager.con.execute(_prep(existing_sql), existing_params).fetchone()[0] or ())
+                for d_str in unknown_dates:
+                    present = d_str in found
+                    _presence_set("bondy", d_str, present)
+                    if present:
+                        existing_dates.add(d_str)
 
         pending = [d for d in candidate_dates if str(d) not in existing_dates]
 
@@ -3450,7 +3562,8 @@ async def compute_stress_metrics_range(
         succeeded = 0
         skipped = 0
         failed = 0
-        failures: list[dict] = []
+        # Keep only the most recent 20 failures; `failed` keeps the full count.
+        failures: deque[dict] = deque(maxlen=20)
 
         for d in to_process:
             d_str = str(d)
@@ -3467,6 +3580,7 @@ async def compute_stress_metrics_range(
                     regime_bucket,
                     driver_json,
                 )
+                _presence_set("bondy", d_str, True)
                 succeeded += 1
             except Exception as e:
                 failed += 1
@@ -3485,7 +3599,7 @@ async def compute_stress_metrics_range(
             "skipped": int(skipped),
             "failed": int(failed),
             "remaining": int(remaining),
-            "failures": failures[:20],
+            "failures": list(failures),
         }
     except HTTPException:
         raise
@@ -3500,9 +3614,6 @@ async def get_daily_pdf_metadata(
     target_date: Optional[str] = Query(None, description="Target date in YYYY-MM-DD format (default: today)")
 ):
     """Get daily PDF report metadata"""
-    from datetime import datetime
-    from pathlib import Path
-
     try:
         if target_date:
             target = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -3512,26 +3623,54 @@ async def get_daily_pdf_metadata(
         # Check if PDF exists
         pdf_path = Path(f"data/reports/daily_{target.strftime('%Y%m%d')}.pdf")
 
-        if pdf_path.exists():
-            return {
-                "date": target_date,
-                "file_exists": True,
-                "file_size": pdf_path.stat().st_size,
-                "generated_at": datetime.fromtimestamp(pdf_path.stat().st_mtime).isoformat()
-            }
-        else:
+        try:
+            st = pdf_path.stat()
+        except FileNotFoundError:
             return {
                 "date": target_date,
                 "file_exists": False,
                 "message": "PDF not yet generated. Generate with GET /report/daily.pdf"
             }
 
+        return {
+            "date": target_date,
+            "file_exists": True,
+            "file_size": st.st_size,
+            "generated_at": datetime.fromtimestamp(st.st_mtime).isoformat()
+        }
+
     except Exception as e:
         logger.error(f"Error getting PDF metadata: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Notification Channels endpoints
+@lru_cache(maxsize=256)
+def _parse_json_cached(json_text: str) -> Any:
+    """
+    Parse a stored JSON config column, memoized on the text itself.
+    Edits produce a different string, so no explicit invalidation is needed.
+    The result is shared between callers and must not be mutated.
+    """
+    return json.loads(json_text)
+
+
+_SQL_INSERT_NOTIFICATION_CHANNEL = """
+INSERT INTO notification_channels (channel_type, enabled, config_json)
+VALUES (?, ?, ?)
+RETURNING id
+"""
+
+_SQL_TOGGLE_NOTIFICATION_CHANNEL = """
+UPDATE notification_channels
+SET enabled = ?,
+    updated_at = CURRENT_TIMESTAMP
+WHERE id = ?
+"""
+
+_SQL_DELETE_NOTIFICATION_CHANNEL = "DELETE FROM notification_channels WHERE id = ?"
+
+
 @router.get("/api/admin/notifications")
 async def get_notification_channels():
     """Get all notification channels"""
@@ -3540,14 +3679,13 @@ async def get_notification_channels():
 
         # Parse config_json for each channel
         for channel in channels:
-            import json
             if channel.get('config_json'):
                 try:
-                    channel['config'] = json.loads(channel['config_json'])
+                    channel['config'] = dict(_parse_json_cached(channel['config_json']))
                     # Remove sensitive fields from response
                     if channel['channel_type'] == 'email' and 'password' in channel['config']:
                         channel['config']['password'] = '******'
-                except json.JSONDecodeError:
+                except (TypeError, ValueError):
                     channel['config'] = {}
             else:
                 channel['config'] = {}
@@ -3572,8 +3710,6 @@ async def create_email_channel(
 ):
     """Create email notification channel"""
     try:
-        import json
-
         config = {
             'smtp_server': smtp_server,
             'smtp_port': smtp_port,
@@ -3585,13 +3721,10 @@ async def create_email_channel(
         if password:
             config['password'] = password
 
-        sql = """
-        INSERT INTO notification_channels (channel_type, enabled, config_json)
-        VALUES ('email', ?, ?)
-        RETURNING id
-        """
-
-        result = db_manager.con.execute(sql, [enabled, json.dumps(config)]).fetchone()
+        result = db_manager.con.execute(
+            _prep(_SQL_INSERT_NOTIFICATION_CHANNEL),
+            ['email', enabled, json.dumps(config)],
+        ).fetchone()
 
         logger.info(f"Created email notification channel {result[0]}")
         return {'status': 'success', 'channel_id': result[0]}
@@ -3611,8 +3744,6 @@ async def create_webhook_channel(
 ):
     """Create webhook notification channel"""
     try:
-        import json
-
         config = {
             'url': url,
             'method': method.upper()
@@ -3623,13 +3754,10 @@ async def create_webhook_channel(
             except json.JSONDecodeError as e:
                 raise HTTPException(status_code=400, detail=f"Invalid JSON in headers: {e}")
 
-        sql = """
-        INSERT INTO notification_channels (channel_type, enabled, config_json)
-        VALUES ('webhook', ?, ?)
-        RETURNING id
-        """
-
-        result = db_manager.con.execute(sql, [enabled, json.dumps(config)]).fetchone()
+        result = db_manager.con.execute(
+            _prep(_SQL_INSERT_NOTIFICATION_CHANNEL),
+            ['webhook', enabled, json.dumps(config)],
+        ).fetchone()
 
         logger.info(f"Created webhook notification channel {result[0]}")
         return {'status': 'success', 'channel_id': result[0]}
@@ -3648,14 +3776,7 @@ async def toggle_notification_channel(
 ):
     """Toggle notification channel enabled status"""
     try:
-        sql = """
-        UPDATE notification_channels
-        SET enabled = ?,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE id = ?
-        """
-
-        db_manager.con.execute(sql, [enabled, channel_id])
+        db_manager.con.execute(_prep(_SQL_TOGGLE_NOTIFICATION_CHANNEL), [enabled, channel_id])
 
         return {
             'status': 'success',
@@ -3672,8 +3793,7 @@ async def toggle_notification_channel(
 async def delete_notification_channel(channel_id: int):
     """Delete notification channel"""
     try:
-        sql = "DELETE FROM notification_channels WHERE id = ?"
-        db_manager.con.execute(sql, [channel_id])
+        db_manager.con.execute(_prep(_SQL_DELETE_NOTIFICATION_CHANNEL), [channel_id])
 
         return {'status': 'success', 'channel_id': channel_id}
 
@@ -3682,6 +3802,28 @@ async def delete_notification_channel(channel_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# get_notification_events: $1 alert_code, $2 channel_id (NULL = any), $3 limit.
+# Temporal columns are cast to VARCHAR in SQL so rows come back JSON-ready
+# without a per-value isinstance sweep in Python.
+_SQL_NOTIFICATION_EVENTS = """
+SELECT
+    ne.id,
+    CAST(ne.date AS VARCHAR) AS date,
+    ne.alert_code,
+    ne.channel_id,
+    ne.status,
+    ne.error_message,
+    CAST(ne.sent_at AS VARCHAR) AS sent_at,
+    CAST(ne.created_at AS VARCHAR) AS created_at,
+    ne.channel_type
+FROM notification_events ne
+WHERE ($1::VARCHAR IS NULL OR ne.alert_code = $1)
+  AND ($2::INTEGER IS NULL OR ne.channel_id = $2)
+ORDER BY ne.created_at DESC
+LIMIT $3
+"""
+
+
 @router.get("/api/admin/notifications/events")
 async def get_notification_events(
     limit: int = Query(50, description="Number of recent events"),
@@ -3690,37 +3832,14 @@ async def get_notification_events(
 ):
     """Get recent notification events"""
     try:
-        sql = """
-        SELECT ne.*, nc.channel_type
-        FROM notification_events ne
-        LEFT JOIN notification_channels nc ON ne.channel_id = nc.id
-        WHERE 1=1
-        """
-
-        params = []
-        if alert_code:
-            sql += " AND ne.alert_code = ?"
-            params.append(alert_code)
-        if channel_id:
-            sql += " AND ne.channel_id = ?"
-            params.append(channel_id)
-
-        sql += " ORDER BY ne.created_at DESC LIMIT ?"
-        params.append(limit)
-
-        results = db_manager.con.execute(sql, params).fetchall()
-
-        events = []
-        for row in results:
-            columns = [desc[0] for desc in db_manager.con.description]
-            event = dict(zip(columns, row))
-            # Convert to string for JSON serialization
-            for key, value in event.items():
-                if value is not None and not isinstance(value, (str, int, float, bool, dict, list)):
-                    event[key] = str(value)
-            events.append(event)
+        cur = db_manager.con.execute(
+            _prep(_SQL_NOTIFICATION_EVENTS), [alert_code or None, channel_id or None, limit]
+        )
+        columns = [desc[0] for desc in cur.description]
+        events = [dict(zip(columns, row)) for row in cur.fetchall()]
 
-        return events
+        # Rows are already JSON-safe; skip FastAPI's jsonable_encoder pass.
+        return JSONResponse(content=events)
 
     except Exception as e:
         logger.error(f"Error fetching notification events: {e}")
@@ -3728,31 +3847,32 @@ async def get_notification_events(
 
 
 # Alert Thresholds endpoints
+_SQL_ALERT_THRESHOLDS = """
+SELECT alert_code, enabled, severity, params_json, updated_at
+FROM alert_thresholds
+ORDER BY alert_code
+"""
+
+
 @router.get("/api/admin/alerts")
 async def get_alert_thresholds():
     """Get all alert thresholds"""
     try:
-        sql = """
-        SELECT alert_code, enabled, severity, params_json, updated_at
-        FROM alert_thresholds
-        ORDER BY alert_code
-        """
-
-        results = db_manager.con.execute(sql).fetchall()
+        results = db_manager.con.execute(_prep(_SQL_ALERT_THRESHOLDS)).fetchall()
 
         thresholds = []
         for row in results:
-            import json
             alert_code, enabled, severity, params_json, updated_at = row
             thresholds.append({
                 'alert_code': alert_code,
                 'enabled': bool(enabled),
                 'severity': severity,
-                'params': json.loads(params_json) if params_json else {},
+                'params': _parse_json_cached(params_json) if params_json else {},
                 'updated_at': str(updated_at) if updated_at else None
             })
 
-        return thresholds
+        # Rows are already JSON-safe; skip FastAPI's jsonable_encoder pass.
+        return JSONResponse(content=thresholds)
 
     except Exception as e:
         logger.error(f"Error fetching alert thresholds: {e}")
@@ -3768,8 +3888,6 @@ async def upsert_alert_threshold(
 ):
     """Insert or update an alert threshold"""
     try:
-        import json
-
         # Parse params if provided
         params_dict = {}
         if params:
@@ -3809,9 +3927,6 @@ async def test_alert_threshold(
 ):
     """Test an alert threshold with given metrics"""
     try:
-        import json
-        from app.analytics.alert_engine import AlertEngine
-
         # Parse metrics
         if metrics:
             try:
@@ -3851,8 +3966,6 @@ async def test_alert_threshold(
 async def reload_alert_thresholds():
     """Force reload alert thresholds from database (clears cache)"""
     try:
-        from app.analytics.alert_engine import AlertEngine
-
         engine = AlertEngine(db_manager)
         engine._load_thresholds(force_reload=True)
 
@@ -3871,13 +3984,15 @@ async def reload_alert_thresholds():
 async def get_dq_latest(date: str = Query(None, description="Target date (YYYY-MM-DD), defaults to today")):
     """Get latest DQ status for a date"""
     try:
-        from app.quality import DataQualityRunner
-        from datetime import date as date_type
-
         target_date = date_type.fromisoformat(date) if date else date_type.today()
+        target_str = str(target_date)
 
-        runner = DataQualityRunner(db_manager)
-        dq_status = runner.get_dq_status_for_date(target_date)
+        if _presence_get("dq", target_str) is False:
+            dq_status = None
+        else:
+            runner = DataQualityRunner(db_manager)
+            dq_status = runner.get_dq_status_for_date(target_date)
+            _presence_set("dq", target_str, bool(dq_status))
 
         if not dq_status:
             # No DQ run exists for this date
@@ -3904,9 +4019,6 @@ async def get_dq_results(
 ):
     """Get DQ results with filters"""
     try:
-        from app.quality import DataQualityRunner
-        from datetime import date as date_type
-
         runner = DataQualityRunner(db_manager)
 
         start = date_type.fromisoformat(start_date) if start_date else None
@@ -3935,9 +4047,6 @@ async def run_dq(
 ):
     """Run DQ checks for a specific date"""
     try:
-        from app.quality import DataQualityRunner
-        from datetime import date as date_type
-
         target_date = date_type.fromisoformat(date)
         dataset_list = datasets.split(',') if datasets else None
 
@@ -3947,6 +4056,7 @@ async def run_dq(
             datasets=dataset_list,
             override_block=override_block
         )
+        _presence_discard("dq", str(target_date))
 
         return result
 
@@ -3955,6 +4065,38 @@ async def run_dq(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_DQ_RANGE_MAX_WORKERS = 8
+
+
+def _run_dq_dates_parallel(
+    dates: list[date],
+    datasets: Optional[list[str]],
+    override_block: bool,
+) -> list[dict]:
+    """
+    Run DQ for each date on a small thread pool, returning results in input order.
+
+    A DuckDB connection must not be shared between threads; the runner goes
+    through db_manager._cursor(), so each worker uses its own cursor, released
+    when its date is done.
+    """
+    if not dates:
+        return []
+
+    def run_one(target: date) -> dict:
+        try:
+            return DataQualityRunner(db_manager).run_dq_for_date(
+                target_date=target,
+                datasets=datasets,
+                override_block=override_block
+            )
+        finally:
+            db_manager.release_thread_cursor()
+
+    with ThreadPoolExecutor(max_workers=min(_DQ_RANGE_MAX_WORKERS, len(dates))) as executor:
+        return list(executor.map(run_one, dates))
+
+
 @router.post("/api/admin/quality/run-range")
 async def run_dq_range(
     start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
@@ -3964,28 +4106,20 @@ async def run_dq_range(
 ):
     """Run DQ checks for a date range"""
     try:
-        from app.quality import DataQualityRunner
-        from datetime import date as date_type, timedelta
-
         start = date_type.fromisoformat(start_date)
         end = date_type.fromisoformat(end_date)
         dataset_list = datasets.split(',') if datasets else None
 
-        runner = DataQualityRunner(db_manager)
+        date_list = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        run_results = _run_dq_dates_parallel(date_list, dataset_list, override_block)
 
         results = []
-        current = start
-        while current <= end:
-            result = runner.run_dq_for_date(
-                target_date=current,
-                datasets=dataset_list,
-                override_block=override_block
-            )
+        for current, result in zip(date_list, run_results):
+            _presence_discard("dq", str(current))
             results.append({
                 'date': str(current),
                 'result': result
             })
-            current += timedelta(days=1)
 
         return {
             'start_date': str(start),
@@ -4003,8 +4137,6 @@ async def run_dq_range(
 async def create_backup():
     """Create a database backup"""
     try:
-        from app.ops import OpsManager
-
         # Get DB path from db_manager
         db_path = str(db_manager.db_path) if hasattr(db_manager, 'db_path') else 'data/bond_lab.db'
 
@@ -4025,8 +4157,6 @@ async def create_backup():
 async def list_backups():
     """List all backups"""
     try:
-        from app.ops import OpsManager
-
         db_path = str(db_manager.db_path) if hasattr(db_manager, 'db_path') else 'data/bond_lab.db'
 
         ops = OpsManager(db_path)
@@ -4043,8 +4173,6 @@ async def list_backups():
 async def verify_backup(backup_path: str = Query(..., description="Path to backup file")):
     """Verify a backup file"""
     try:
-        from app.ops import OpsManager
-
         db_path = str(db_manager.db_path) if hasattr(db_manager, 'db_path') else 'data/bond_lab.db'
 
         ops = OpsManager(db_path)
@@ -4064,8 +4192,6 @@ async def restore_backup(
 ):
     """Restore database from backup (requires ALLOW_RESTORE=true)"""
     try:
-        from app.ops import OpsManager
-
         if not confirm:
             raise HTTPException(
                 status_code=400,
@@ -4090,72 +4216,107 @@ async def restore_backup(
 
 
 # Monitoring endpoints
+# Last ingest run, last DQ run and the 30-day SLO counters in one round-trip.
+# The cutoff date is bound as a parameter so the statement text stays constant.
+_SQL_MONITORING_SUMMARY = """
+WITH last_ingest AS (
+    SELECT
+        id,
+        provider,
+        status,
+        started_at,
+        CASE
+            WHEN ended_at IS NULL THEN NULL
+            ELSE datediff('second', started_at, ended_at)
+        END as duration_seconds
+    FROM ingest_runs
+    ORDER BY started_at DESC
+    LIMIT 1
+),
+last_dq AS (
+    SELECT id, status, run_at, target_date
+    FROM dq_runs
+    ORDER BY run_at DESC
+    LIMIT 1
+),
+date_range AS (
+    SELECT DISTINCT target_date as date FROM dq_runs
+    WHERE target_date >= $cutoff
+),
+snapshot_dates AS (
+    SELECT DISTINCT date FROM daily_snapshots
+    WHERE date >= $cutoff
+)
+SELECT
+    (SELECT struct_pack(id, provider, status, started_at, duration_seconds) FROM last_ingest) as last_ingest,
+    (SELECT struct_pack(id, status, run_at, target_date) FROM last_dq) as last_dq,
+    (SELECT COUNT(*) FROM date_range) as total_days,
+    (SELECT COUNT(*) FROM date_range JOIN dq_runs ON date_range.date = dq_runs.target_date WHERE dq_runs.status = 'FAIL') as dq_failed_days,
+    (SELECT COUNT(*) FROM snapshot_dates) as snapshot_days
+"""
+
+# Per (provider, status) run counts plus the duration sum/count of finished
+# runs, so success rates and average latency come from a single scan.
+_SQL_MONITORING_PROVIDERS = """
+SELECT
+    provider,
+    status,
+    COUNT(*) as count,
+    SUM(datediff('second', started_at, ended_at)) as duration_sum,
+    COUNT(ended_at) as duration_count
+FROM ingest_runs
+WHERE started_at >= ?
+GROUP BY provider, status
+ORDER BY provider, status
+"""
+
+# Reads the fingerprint_drift_30d rollup maintained by insert_source_fingerprint;
+# the window is bucketed by fetch day rather than exact timestamp.
+_SQL_MONITORING_DRIFT = """
+SELECT provider, dataset_id,
+       COUNT(DISTINCT fingerprint_hash) - 1 as fingerprint_changes,
+       CAST(MAX(last_fetched) AS VARCHAR) as last_fetched,
+       ROUND(SUM(sum_rowcount) / NULLIF(SUM(rowcount_n), 0), 1) as avg_rowcount,
+       CAST(SUM(parse_failures) AS BIGINT) as parse_failures
+FROM fingerprint_drift_30d
+WHERE fetched_day >= CAST(current_timestamp - INTERVAL 30 DAY AS DATE)
+GROUP BY provider, dataset_id
+HAVING fingerprint_changes > 0
+ORDER BY MAX(last_fetched) DESC
+"""
+
+
 @router.get("/api/admin/monitoring/summary")
 async def get_monitoring_summary():
     """Get monitoring summary - pipeline status, SLO metrics"""
     try:
-        # Get last ingest run
-        ingest_result = db_manager.con.execute("""
-            SELECT
-                id,
-                provider,
-                status,
-                started_at,
-                ended_at,
-                CASE
-                    WHEN ended_at IS NULL THEN NULL
-                    ELSE datediff('second', started_at, ended_at)
-                END as duration_seconds
-            FROM ingest_runs
-            ORDER BY started_at DESC
-            LIMIT 1
-        """).fetchone()
+        ingest_row, dq_row, total_days, dq_failed_days, snapshot_days = db_manager.con.execute(
+            _prep(_SQL_MONITORING_SUMMARY),
+            {"cutoff": date.today() - timedelta(days=30)},
+        ).fetchone()
 
         last_ingest = {
-            'run_id': ingest_result[0],
-            'provider': ingest_result[1],
-            'status': ingest_result[2],
-            'started_at': str(ingest_result[3]),
-            'duration_seconds': ingest_result[5],
-        } if ingest_result else None
-
-        # Get last DQ status
-        dq_result = db_manager.con.execute("""
-            SELECT id, status, run_at, target_date
-            FROM dq_runs
-            ORDER BY run_at DESC
-            LIMIT 1
-        """).fetchone()
+            'run_id': ingest_row['id'],
+            'provider': ingest_row['provider'],
+            'status': ingest_row['status'],
+            'started_at': str(ingest_row['started_at']),
+            'duration_seconds': ingest_row['duration_seconds'],
+        } if ingest_row else None
 
         last_dq = {
-            'run_id': dq_result[0],
-            'status': dq_result[1],
-            'run_at': str(dq_result[2]),
-            'target_date': str(dq_result[3]) if dq_result[3] is not None else None,
-        } if dq_result else None
-
-        # Calculate SLO metrics (last 30 days)
-        slo_result = db_manager.con.execute("""
-            WITH date_range AS (
-                SELECT DISTINCT target_date as date FROM dq_runs
-                WHERE target_date >= current_date - INTERVAL 30 DAY
-            ),
-            snapshot_dates AS (
-                SELECT DISTINCT date FROM daily_snapshots
-                WHERE date >= current_date - INTERVAL 30 DAY
-            )
-            SELECT
-                (SELECT COUNT(*) FROM date_range) as total_days,
-                (SELECT COUNT(*) FROM date_range JOIN dq_runs ON date_range.date = dq_runs.target_date WHERE dq_runs.status = 'FAIL') as dq_failed_days,
-                (SELECT COUNT(*) FROM snapshot_dates) as snapshot_days
-        """).fetchone()
+            'run_id': dq_row['id'],
+            'status': dq_row['status'],
+            'run_at': str(dq_row['run_at']),
+            'target_date': str(dq_row['target_date']) if dq_row['target_date'] is not None else None,
+        } if dq_row else None
 
+        # SLO metrics (last 30 days)
         slo = {
-            'total_days': slo_result[0],
-            'dq_failed_days': slo_result[1],
-            'snapshot_days': slo_result[2],
-            'dq_success_rate': round((1 - (slo_result[1] / slo_result[0])) * 100, 1) if slo_result[0] > 0 else None,
-            'snapshot_coverage': round((slo_result[2] / slo_result[0]) * 100, 1) if slo_result[0] > 0 else None
+            'total_days': total_days,
+            'dq_failed_days': dq_failed_days,
+            'snapshot_days': snapshot_days,
+            'dq_success_rate': round((1 - (dq_failed_days / total_days)) * 100, 1) if total_days > 0 else None,
+            'snapshot_coverage': round((snapshot_days / total_days) * 100, 1) if total_days > 0 else None
         }
 
         return {
@@ -4173,40 +4334,36 @@ async def get_monitoring_summary():
 async def get_provider_monitoring():
     """Get provider reliability metrics (30 days)"""
     try:
-        # Provider success rates
-        providers_result = db_manager.con.execute("""
-            SELECT provider, status, COUNT(*) as count
-            FROM ingest_runs
-            WHERE started_at >= current_timestamp - INTERVAL 30 DAY
-            GROUP BY provider, status
-            ORDER BY provider, status
-        """).fetchall()
+        providers_result = db_manager.con.execute(
+            _prep(_SQL_MONITORING_PROVIDERS),
+            [datetime.now() - timedelta(days=30)],
+        ).fetchall()
 
         providers = {}
-        for row in providers_result:
-            provider, status, count = row
+        durations: dict[str, list[int]] = {}
+        for provider, status, count, duration_sum, duration_count in providers_result:
+            # Provider success rates
             if provider not in providers:
                 providers[provider] = {'success': 0, 'error': 0, 'total': 0}
             providers[provider][status.lower() if status.lower() in ['success', 'error'] else 'error'] = count
             providers[provider]['total'] += count
 
+            if duration_count:
+                totals = durations.setdefault(provider, [0, 0])
+                totals[0] += duration_sum
+                totals[1] += duration_count
+
         # Calculate success rates
         for provider in providers:
             p = providers[provider]
             p['success_rate'] = round((p['success'] / p['total']) * 100, 1) if p['total'] > 0 else None
 
-        # Get median latency per provider
-        latency_result = db_manager.con.execute("""
-            SELECT
-                provider,
-                AVG(datediff('second', started_at, ended_at)) as avg_duration
-            FROM ingest_runs
-            WHERE started_at >= current_timestamp - INTERVAL 30 DAY AND ended_at IS NOT NULL
-            GROUP BY provider
-            ORDER BY avg_duration ASC
-        """).fetchall()
-
-        latencies = {row[0]: round(row[1], 2) for row in latency_result}
+        # Average latency per provider (finished runs only), fastest first
+        avg_durations = {provider: total / n for provider, (total, n) in durations.items()}
+        latencies = {
+            provider: round(avg, 2)
+            for provider, avg in sorted(avg_durations.items(), key=lambda item: item[1])
+        }
 
         return {
             'providers': providers,
@@ -4220,90 +4377,86 @@ async def get_provider_monitoring():
 
 
 @router.get("/api/admin/monitoring/drift")
+@cached(ttl=_ADMIN_AGGREGATE_TTL_SECONDS, tables=("source_fingerprints",), scope=_db_scope)
 async def get_drift_signals():
     """Get recent drift signals from source_fingerprints"""
     try:
-        # Get recent fingerprint changes
-        drift_result = db_manager.con.execute("""
-            SELECT provider, dataset_id,
-                   COUNT(DISTINCT fingerprint_hash) as fingerprint_count,
-                   MAX(fetched_at) as last_fetched,
-                   AVG(parse_rowcount) as avg_rowcount,
-                   SUM(CASE WHEN parse_required_fields_ok = FALSE THEN 1 ELSE 0 END) as parse_failures
-            FROM source_fingerprints
-            WHERE fetched_at >= current_timestamp - INTERVAL 30 DAY
-            GROUP BY provider, dataset_id
-            HAVING fingerprint_count > 1
-            ORDER BY last_fetched DESC
-        """).fetchall()
-
-        drifts = []
-        for row in drift_result:
-            provider, dataset_id, fp_count, last_fetched, avg_rowcount, parse_failures = row
-            drifts.append({
-                'provider': provider,
-                'dataset_id': dataset_id,
-                'fingerprint_changes': fp_count - 1,
-                'last_fetched': str(last_fetched),
-                'avg_rowcount': round(avg_rowcount, 1) if avg_rowcount else None,
-                'parse_failures': parse_failures
-            })
+        # Rows come back already shaped (rounded, stringified) for the payload
+        cur = db_manager.con.execute(_prep(_SQL_MONITORING_DRIFT))
+        columns = [desc[0] for desc in cur.description]
+        drifts = [dict(zip(columns, row)) for row in cur.fetchall()]
 
-        return {'drifts': drifts, 'period_days': 30}
+        return JSONResponse(content={'drifts': drifts, 'period_days': 30})
 
     except Exception as e:
         logger.error(f"Error getting drift signals: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_SQL_COVERAGE_BY_TABLE = {
+    table: f"SELECT MIN(date), MAX(date), COUNT(DISTINCT date) FROM {table}"
+    for table in COVERAGE_TABLES
+}
+
+_SQL_COVERAGE_ALL = "\nUNION ALL\n".join(
+    f"SELECT '{table}' AS tbl, MIN(date), MAX(date), COUNT(DISTINCT date) FROM {table}"
+    for table in COVERAGE_TABLES
+)
+
+
+def _coverage_entry(earliest, latest, date_count) -> Dict[str, Any]:
+    """Shape one table's MIN/MAX/COUNT(DISTINCT date) row for the coverage payload."""
+    if earliest is None:
+        return {
+            'earliest_date': None,
+            'latest_date': None,
+            'date_count': 0,
+            'has_data': False
+        }
+    return {
+        'earliest_date': str(earliest),
+        'latest_date': str(latest),
+        'date_count': date_count,
+        'has_data': True
+    }
+
+
 # Coverage endpoint (for admin UI)
 @router.get("/api/admin/coverage")
+@cached(ttl=_ADMIN_AGGREGATE_TTL_SECONDS, tables=COVERAGE_TABLES, scope=_db_scope)
 async def get_data_coverage():
     """Get data coverage statistics for all tables"""
     try:
         coverage = {}
 
-        tables = [
-            'gov_yield_curve',
-            'gov_yield_change_stats',
-            'interbank_rates',
-            'gov_auction_results',
-            'gov_secondary_trading',
-            'policy_rates'
-        ]
-
-        for table in tables:
-            try:
-                sql = f"""
-                SELECT
-                    MIN(date) as earliest_date,
-                    MAX(date) as latest_date,
-                    COUNT(DISTINCT date) as date_count
-                FROM {table}
-                """
-
-                result = db_manager.con.execute(sql).fetchone()
+        # Writers keep table_coverage_rollup current, so this is normally a
+        # six-row lookup; scan the tables only when the rollup is incomplete.
+        try:
+            rollup = db_manager.get_coverage_rollup()
+            if all(table in rollup for table in COVERAGE_TABLES):
+                return {table: _coverage_entry(*rollup[table]) for table in COVERAGE_TABLES}
+        except Exception as e:
+            logger.debug(f"Coverage rollup unavailable, scanning tables: {e}")
 
-                if result and result[0]:
-                    coverage[table] = {
-                        'earliest_date': str(result[0]),
-                        'latest_date': str(result[1]),
-                        'date_count': result[2],
-                        'has_data': True
-                    }
-                else:
+        try:
+            rows = db_manager.con.execute(_prep(_SQL_COVERAGE_ALL)).fetchall()
+            for table, earliest, latest, date_count in rows:
+                coverage[table] = _coverage_entry(earliest, latest, date_count)
+        except Exception as e:
+            # One bad table fails the whole UNION; probe tables one by one so
+            # the others still report and the broken one carries its error.
+            logger.debug(f"Batched coverage query failed, probing per table: {e}")
+            coverage = {}
+            for table in COVERAGE_TABLES:
+                try:
+                    result = db_manager.con.execute(_prep(_SQL_COVERAGE_BY_TABLE[table])).fetchone()
+                    coverage[table] = _coverage_entry(*result) if result else _coverage_entry(None, None, 0)
+                except Exception as e:
+                    logger.debug(f"Error getting coverage for {table}: {e}")
                     coverage[table] = {
-                        'earliest_date': None,
-                        'latest_date': None,
-                        'date_count': 0,
+                        'error': str(e),
                         'has_data': False
                     }
-            except Exception as e:
-                logger.debug(f"Error getting coverage for {table}: {e}")
-                coverage[table] = {
-                    'error': str(e),
-                    'has_data': False
-                }
 
         return coverage
 
@@ -3,10 +3,11 @@ Optional Basic Authentication for Admin Routes
 
 Protects /admin/* and /api/admin/* routes when ADMIN_AUTH_ENABLED=true
 """
-import base64
 import binascii
+import hmac
 import logging
 import secrets
+from functools import lru_cache
 from typing import Optional
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 security = HTTPBasic()
 
+# Per-process HMAC key: credential digests are only ever compared in memory
+_DIGEST_KEY = secrets.token_bytes(32)
+
 
 def is_admin_auth_enabled() -> bool:
     """Check if admin auth is enabled"""
@@ -30,6 +34,17 @@ def get_admin_credentials() -> tuple[str, str]:
     return username, password
 
 
+def _credentials_digest(raw: bytes) -> bytes:
+    """HMAC-SHA256 of raw "user:password" bytes under the per-process key"""
+    return hmac.new(_DIGEST_KEY, raw, 'sha256').digest()
+
+
+@lru_cache(maxsize=4)
+def _expected_digest(username: str, password: str) -> bytes:
+    """Digest of the configured credentials, computed once per credential pair"""
+    return _credentials_digest(f"{username}:{password}".encode('utf-8'))
+
+
 async def verify_admin_auth(request: Request) -> Optional[HTTPException]:
     """
     Verify admin authentication for request
@@ -55,22 +70,16 @@ async def verify_admin_auth(request: Request) -> Optional[HTTPException]:
         if scheme.lower() != 'basic':
             raise ValueError("Invalid auth scheme")
 
-        decoded = base64.b64decode(credentials).decode('utf-8')
-        username, password = decoded.split(':', 1)
-
-        # Verify credentials
-        admin_user, admin_pass = get_admin_credentials()
-
-        if not secrets.compare_digest(username, admin_user):
-            logger.warning(f"Admin auth failed: invalid username '{username}'")
-            return HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid username or password",
-                headers={"WWW-Authenticate": "Basic"},
-            )
+        raw = binascii.a2b_base64(credentials)
+        user_bytes, sep, _ = raw.partition(b':')
+        if not sep:
+            raise ValueError("Missing credentials separator")
+        # Only the username is ever decoded, and only for log messages
+        username = user_bytes.decode('utf-8', 'replace')
 
-        if not secrets.compare_digest(password, admin_pass):
-            logger.warning(f"Admin auth failed: invalid password for user '{username}'")
+        # Verify both fields with a single constant-time digest comparison
+        if not hmac.compare_digest(_credentials_digest(raw), _expected_digest(*get_admin_credentials())):
+            logger.warning(f"Admin auth failed: invalid credentials for user '{username}'")
             return HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password",
@@ -81,7 +90,7 @@ async def verify_admin_auth(request: Request) -> Optional[HTTPException]:
         logger.info(f"Admin auth successful: {username}")
         return None
 
-    except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+    except (ValueError, binascii.Error) as e:
         logger.warning(f"Admin auth failed: invalid credentials format")
         return HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -105,6 +114,9 @@ async def require_admin_auth(request: Request):
         raise error
 
 
+_ADMIN_PREFIXES = ('/admin/', '/api/admin/')
+
+
 def is_admin_route(path: str) -> bool:
     """Check if path is an admin route"""
-    return path.startswith('/admin/') or path.startswith('/api/admin/')
+    return path.startswith(_ADMIN_PREFIXES)
@@ -0,0 +1,112 @@
+"""
+In-process TTL cache for expensive admin aggregates
+
+Entries are tagged with the tables they were computed from so writers can
+drop them as soon as those tables change, instead of waiting for the TTL.
+"""
+import asyncio
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping of key -> (expires_at, value) with table invalidation"""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._tables: Dict[Hashable, frozenset] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self._tables.pop(key, None)
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float, tables: Iterable[str] = ()):
+        """Store value for ttl seconds, tagged with the tables it depends on"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._tables[key] = frozenset(tables)
+
+    def invalidate(self, table: str) -> int:
+        """Drop every entry computed from table; returns the number dropped"""
+        with self._lock:
+            stale = [key for key, tables in self._tables.items() if table in tables]
+            for key in stale:
+                self._entries.pop(key, None)
+                self._tables.pop(key, None)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached response(s) for {table}")
+        return len(stale)
+
+    def discard(self, key: Hashable):
+        """Drop the entry for key, if any"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._tables.pop(key, None)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._tables.clear()
+
+
+response_cache = TTLCache()
+_key_locks: Dict[Hashable, asyncio.Lock] = {}
+
+
+def invalidate(table: str) -> int:
+    """Drop cached responses that depend on table (call after writing to it)"""
+    return response_cache.invalidate(table)
+
+
+def cached(ttl: float, tables: Iterable[str], scope: Optional[Callable[[], Hashable]] = None):
+    """
+    Cache an async endpoint's return value in response_cache
+
+    Args:
+        ttl: Seconds a computed value stays valid
+        tables: Tables the value is computed from; writes to any of them
+            invalidate the entry via invalidate()
+        scope: Optional callable whose result is folded into the key, e.g. the
+            active database path, so swapping databases never serves stale data
+
+    Exceptions are not cached. Concurrent misses for the same key wait on a
+    per-key lock so only one of them recomputes.
+    """
+    tables = frozenset(tables)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (fn.__qualname__, scope() if scope else None, args, tuple(sorted(kwargs.items())))
+            value = response_cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            lock = _key_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                value = response_cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = await fn(*args, **kwargs)
+                    response_cache.set(key, value, ttl, tables)
+            return value
+
+        return wrapper
+
+    return decorator
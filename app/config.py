@@ -1,6 +1,8 @@
 """
 Application configuration using pydantic-settings
 """
+from functools import lru_cache
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 from pathlib import Path
@@ -61,7 +63,14 @@ class Settings(BaseSettings):
     legacy_ui_enabled: bool = False
 
     # Database
-    db_path: str = str(_default_state_dir() / "bonds.duckdb")
+    db_path: Path = _default_state_dir() / "bonds.duckdb"
+    # DuckDB runtime knobs applied on connect (None keeps DuckDB's default)
+    duckdb_threads: Optional[int] = None
+    duckdb_memory_limit: Optional[str] = None  # e.g. "2GB"
+    duckdb_temp_directory: Optional[Path] = None  # spill location for large sorts/joins
+    duckdb_checkpoint_threshold: Optional[str] = "1GB"  # WAL size before auto-checkpoint
+    # False lets DuckDB parallelize inserts/CTAS; queries that need an order use ORDER BY
+    duckdb_preserve_insertion_order: bool = False
 
     # Data Collection
     start_date_default: str = "2013-01-01"
@@ -87,8 +96,8 @@ class Settings(BaseSettings):
     abo_base_url: str = "https://asianbondsonline.adb.org"
 
     # Local interest-rate project (Lai_suat) bridge (Optional)
-    lai_suat_root: str = str(PROJECT_ROOT / "Lai_suat")
-    lai_suat_db_path: str = str(PROJECT_ROOT / "Lai_suat" / "data" / "rates.db")
+    lai_suat_root: Path = PROJECT_ROOT / "Lai_suat"
+    lai_suat_db_path: Path = PROJECT_ROOT / "Lai_suat" / "data" / "rates.db"
     lai_suat_run_scraper: bool = False  # Optional: run scraper before importing
     # Lai_suat source selection:
     # Prefer high-quality sources (lower priority number). Default: only priority=1 (Timo).
@@ -100,7 +109,7 @@ class Settings(BaseSettings):
     playwright_timeout: int = 30000
 
     # Raw Data Storage
-    raw_data_path: str = str(_default_state_dir() / "raw")
+    raw_data_path: Path = _default_state_dir() / "raw"
     enable_raw_storage: bool = True
 
     # Trading Economics (Optional)
@@ -134,6 +143,12 @@ class Settings(BaseSettings):
     demo_db_path: Optional[str] = None  # Separate DB path for demo data
     override_demo_ingest: bool = False  # Allow provider ingestion in demo mode
 
+    @field_validator("db_path", "raw_data_path", "lai_suat_root", "lai_suat_db_path", mode="after")
+    @classmethod
+    def _expand_user_path(cls, value: Path) -> Path:
+        # Parsed once here so callers can join onto these paths directly.
+        return value.expanduser()
+
 
 # Global settings instance
 settings = Settings()
@@ -144,7 +159,7 @@ def _apply_backwards_compatibility():
     Apply backwards compatibility for deprecated environment variables.
 
     Maps BASIC_AUTH_* -> ADMIN_AUTH_* with logging.
-    Called once at module load.
+    Called once from the application startup (app.main lifespan).
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -181,14 +196,14 @@ def _apply_backwards_compatibility():
         logger.info("FRED_API_KEY detected; enabling global_series_enabled.")
 
 
-# Apply backwards compatibility once at module load
-_apply_backwards_compatibility()
-
-
-def _lockout_legacy_repo_duckdb_path() -> None:
+@lru_cache(maxsize=1)
+def _ensure_db_path_ok() -> None:
     """
     Prevent accidentally using the legacy repo-local DuckDB file.
 
+    Runs once per process, on first DatabaseManager construction, so entry
+    points that never open the database skip the path resolution and I/O.
+
     Historically, the project stored the DuckDB file at:
       <repo>/.local-data/bonds.duckdb
 
@@ -219,7 +234,7 @@ def _lockout_legacy_repo_duckdb_path() -> None:
     if legacy_repo_db.exists() and not canonical.exists():
         canonical.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(str(legacy_repo_db), str(canonical))
-        settings.db_path = str(canonical)
+        settings.db_path = canonical
         import logging
 
         logging.getLogger(__name__).warning(
@@ -239,13 +254,14 @@ def _lockout_legacy_repo_duckdb_path() -> None:
     )
 
 
-# Enforce DB path guard at module load (safe for local dev).
-_lockout_legacy_repo_duckdb_path()
-
-
 def get_raw_data_path(provider: str) -> Path:
     """Get the raw data storage path for a specific provider"""
-    base_path = Path(settings.raw_data_path)
+    return _provider_raw_data_path(Path(settings.raw_data_path), provider)
+
+
+@lru_cache(maxsize=32)
+def _provider_raw_data_path(base_path: Path, provider: str) -> Path:
+    """Create a provider's raw data directory once per (base path, provider)"""
     provider_path = base_path / provider
     provider_path.mkdir(parents=True, exist_ok=True)
     return provider_path
@@ -4,13 +4,15 @@ Lists all available datasets with metadata
 """
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from datetime import date
+from types import MappingProxyType
 
 from app.config import settings
 
 
-# Dataset catalog registry
+# Dataset catalog registry (read-only; entries are frozen below)
 DATASET_CATALOG = {
     "gov_yield_curve": {
         "name": "Government Bond Yield Curve",
@@ -104,6 +106,48 @@ DATASET_CATALOG = {
         "frequency": "Daily (as scraped)"
     }
 }
+DATASET_CATALOG = MappingProxyType({
+    dataset_id: MappingProxyType(info) for dataset_id, info in DATASET_CATALOG.items()
+})
+
+_RULE = "=" * 120
+_TABLE_HEADER = f"{'Dataset ID':<25} {'Name':<30} {'Historical':<12} {'Earliest':<12} {'Provider':<15} {'Provenance':<12}"
+_TABLE_SEPARATOR = "-" * 120
+_TABLE_LEGEND = (
+    "Legend:",
+    "  Historical YES   = Can backfill from earliest_known_date",
+    "  Historical NO    = Daily accumulation only from accumulation_start",
+    "  Provenance OFFICIAL  = Official source",
+    "  Provenance NON-OFFICIAL = Unofficial/validation source",
+)
+
+
+@lru_cache(maxsize=1)
+def _render_table() -> tuple[str, ...]:
+    """Render the table-format catalog as output lines (the catalog is immutable)"""
+    lines = ["\n" + _RULE, "VIETNAMESE BOND DATA LAB - DATASET CATALOG", _RULE, "", _TABLE_HEADER, _TABLE_SEPARATOR]
+
+    for dataset_id, info in DATASET_CATALOG.items():
+        historical = "YES" if info['supports_historical'] else "NO (daily acc.)"
+        earliest = info['earliest_known_date'] or (info['accumulation_start'] if info['accumulation_start'] else "N/A")
+        provider = info['provider']
+        provenance = info['provenance']
+        name = info['name'][:28]
+
+        lines.append(f"{dataset_id:<25} {name:<30} {historical:<12} {earliest:<12} {provider:<15} {provenance:<12}")
+
+    lines.extend([_RULE, "", *_TABLE_LEGEND, "", f"Total Datasets: {len(DATASET_CATALOG)}", ""])
+    return tuple(lines)
+
+
+@lru_cache(maxsize=4)
+def _render_json(catalog_date: str) -> str:
+    """Render the JSON catalog for a given catalog date"""
+    catalog_data = {
+        "catalog_date": catalog_date,
+        "datasets": {dataset_id: dict(info) for dataset_id, info in DATASET_CATALOG.items()}
+    }
+    return json.dumps(catalog_data, indent=2)
 
 
 def main():
@@ -119,50 +163,19 @@ def main():
 
     if args.format == 'json':
         # Output JSON catalog
-        catalog_data = {
-            "catalog_date": date.today().isoformat(),
-            "datasets": DATASET_CATALOG
-        }
+        rendered = _render_json(date.today().isoformat())
 
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(catalog_data, f, indent=2)
+            output_path.write_text(rendered)
             print(f"Catalog saved to {output_path}")
         else:
-            print(json.dumps(catalog_data, indent=2))
+            sys.stdout.write(rendered + "\n")
 
     else:
-        # Output table format
-        print("\n" + "=" * 120)
-        print("VIETNAMESE BOND DATA LAB - DATASET CATALOG")
-        print("=" * 120)
-        print()
-
-        # Header
-        print(f"{'Dataset ID':<25} {'Name':<30} {'Historical':<12} {'Earliest':<12} {'Provider':<15} {'Provenance':<12}")
-        print("-" * 120)
-
-        for dataset_id, info in DATASET_CATALOG.items():
-            historical = "YES" if info['supports_historical'] else "NO (daily acc.)"
-            earliest = info['earliest_known_date'] or (info['accumulation_start'] if info['accumulation_start'] else "N/A")
-            provider = info['provider']
-            provenance = info['provenance']
-            name = info['name'][:28]
-
-            print(f"{dataset_id:<25} {name:<30} {historical:<12} {earliest:<12} {provider:<15} {provenance:<12}")
-
-        print("=" * 120)
-        print()
-        print("Legend:")
-        print("  Historical YES   = Can backfill from earliest_known_date")
-        print("  Historical NO    = Daily accumulation only from accumulation_start")
-        print("  Provenance OFFICIAL  = Official source")
-        print("  Provenance NON-OFFICIAL = Unofficial/validation source")
-        print()
-        print(f"Total Datasets: {len(DATASET_CATALOG)}")
-        print()
+        # Output table format, written in one call rather than a print per row
+        sys.stdout.write("\n".join(_render_table()) + "\n")
 
 
 if __name__ == '__main__':
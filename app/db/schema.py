@@ -1,41 +1,1194 @@
 """
 DuckDB Schema initialization and management for Vietnamese Bond Data Lab
 """
+import csv
 import duckdb
+import hashlib
+import json
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Iterable, Iterator, Optional
 from datetime import datetime, date, timedelta
+from collections import namedtuple
 from collections.abc import Sequence
 
+from app.cache import invalidate as invalidate_cache
+from app.config import _ensure_db_path_ok, settings
+
 logger = logging.getLogger(__name__)
 
+# Rows per set-based upsert statement; DuckDB gains little beyond ~10k rows
+# per statement while larger chunks only grow the bound list parameters.
+BULK_BATCH_SIZE = 10_000
+
+# Above this many rows an upsert is staged through a CSV file and loaded with
+# read_csv, which beats binding the rows as list parameters on backfills.
+BULK_COPY_THRESHOLD = 50_000
+
+# Columns that do not count as a change when an upsert meets an existing row;
+# rows whose other columns are identical are left as they are.
+_UPSERT_BOOKKEEPING_COLUMNS = frozenset({"fetched_at"})
+
+# NULL marker in CSV staging files; unlike an empty field it cannot be confused
+# with an empty string.
+_CSV_NULL = "\\N"
+
+# Tables summarised in table_coverage_rollup (and reported by /api/admin/coverage).
+# Names are interpolated into SQL, so only ever extend this with literal table names.
+COVERAGE_TABLES = (
+    'gov_yield_curve',
+    'gov_yield_change_stats',
+    'interbank_rates',
+    'gov_auction_results',
+    'gov_secondary_trading',
+    'policy_rates',
+)
+
+
+_GOV_YIELD_CURVE_DDL = """
+CREATE TABLE IF NOT EXISTS gov_yield_curve (
+    date DATE NOT NULL,
+    tenor_label VARCHAR NOT NULL,
+    tenor_days INTEGER NOT NULL,
+    spot_rate_continuous DOUBLE,
+    par_yield DOUBLE,
+    spot_rate_annual DOUBLE,
+    source VARCHAR NOT NULL,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, tenor_label, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gov_yield_curve_date ON gov_yield_curve(date);
+CREATE INDEX IF NOT EXISTS idx_gov_yield_curve_source ON gov_yield_curve(source);
+CREATE INDEX IF NOT EXISTS idx_gov_yield_curve_source_spot ON gov_yield_curve(source, spot_rate_annual);
+"""
+
+_GOV_YIELD_CHANGE_STATS_DDL = """
+CREATE TABLE IF NOT EXISTS gov_yield_change_stats (
+    date DATE NOT NULL,
+    bucket_label VARCHAR NOT NULL,
+    currency VARCHAR,
+    volume_domestic DOUBLE,
+    volume_foreign DOUBLE,
+    weight_domestic DOUBLE,
+    weight_foreign DOUBLE,
+    yield_min_domestic DOUBLE,
+    yield_max_domestic DOUBLE,
+    yield_min_foreign DOUBLE,
+    yield_max_foreign DOUBLE,
+    source VARCHAR NOT NULL,
+    raw_file VARCHAR,
+    UNIQUE(date, bucket_label, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_yield_change_stats_date ON gov_yield_change_stats(date);
+CREATE INDEX IF NOT EXISTS idx_yield_change_stats_source ON gov_yield_change_stats(source);
+"""
+
+_INTERBANK_RATES_DDL = """
+CREATE TABLE IF NOT EXISTS interbank_rates (
+    date DATE NOT NULL,
+    tenor_label VARCHAR NOT NULL,
+    rate DOUBLE NOT NULL,
+    source VARCHAR NOT NULL,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, tenor_label, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_interbank_rates_date ON interbank_rates(date);
+CREATE INDEX IF NOT EXISTS idx_interbank_rates_tenor ON interbank_rates(tenor_label);
+CREATE INDEX IF NOT EXISTS idx_interbank_rates_source ON interbank_rates(source);
+"""
+
+_INGEST_RUNS_DDL = """
+CREATE TABLE IF NOT EXISTS ingest_runs (
+    id INTEGER PRIMARY KEY,
+    provider VARCHAR NOT NULL,
+    start_date DATE,
+    end_date DATE,
+    status VARCHAR NOT NULL,
+    rows_inserted INTEGER DEFAULT 0,
+    error_message TEXT,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ended_at TIMESTAMP
+);
+
+CREATE SEQUENCE IF NOT EXISTS ingest_runs_id_seq START 1;
+"""
+
+_GOV_AUCTION_RESULTS_DDL = """
+CREATE TABLE IF NOT EXISTS gov_auction_results (
+    date DATE NOT NULL,
+    instrument_type VARCHAR NOT NULL,
+    tenor_label VARCHAR NOT NULL,
+    tenor_days INTEGER NOT NULL,
+    amount_offered DOUBLE,
+    amount_sold DOUBLE,
+    bid_to_cover DOUBLE,
+    cut_off_yield DOUBLE,
+    avg_yield DOUBLE,
+    source VARCHAR NOT NULL,
+    raw_file VARCHAR,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, instrument_type, tenor_label, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gov_auction_results_date ON gov_auction_results(date);
+CREATE INDEX IF NOT EXISTS idx_gov_auction_results_type ON gov_auction_results(instrument_type);
+CREATE INDEX IF NOT EXISTS idx_gov_auction_results_source ON gov_auction_results(source);
+"""
+
+_GOV_SECONDARY_TRADING_DDL = """
+CREATE TABLE IF NOT EXISTS gov_secondary_trading (
+    date DATE NOT NULL,
+    segment VARCHAR NOT NULL,
+    bucket_label VARCHAR NOT NULL,
+    segment_kind VARCHAR,
+    segment_code VARCHAR,
+    bucket_kind VARCHAR,
+    bucket_code VARCHAR,
+    bucket_display VARCHAR,
+    volume DOUBLE,
+    value DOUBLE,
+    avg_yield DOUBLE,
+    source VARCHAR NOT NULL,
+    raw_file VARCHAR,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, segment, bucket_label, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_date ON gov_secondary_trading(date);
+CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_segment ON gov_secondary_trading(segment);
+CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_source ON gov_secondary_trading(source);
+"""
+
+_POLICY_RATES_DDL = """
+CREATE TABLE IF NOT EXISTS policy_rates (
+    date DATE NOT NULL,
+    rate_name VARCHAR NOT NULL,
+    rate DOUBLE NOT NULL,
+    source VARCHAR NOT NULL,
+    raw_file VARCHAR,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, rate_name, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_policy_rates_date ON policy_rates(date);
+CREATE INDEX IF NOT EXISTS idx_policy_rates_name ON policy_rates(rate_name);
+CREATE INDEX IF NOT EXISTS idx_policy_rates_source ON policy_rates(source);
+"""
+
+_BANK_RATES_DDL = """
+CREATE TABLE IF NOT EXISTS bank_rates (
+    date DATE NOT NULL,
+    product_group VARCHAR NOT NULL CHECK(product_group IN ('deposit','loan')),
+    series_code VARCHAR NOT NULL,
+    bank_name VARCHAR NOT NULL,
+    term_months INTEGER NOT NULL DEFAULT -1,
+    term_label VARCHAR,
+    rate_min_pct DOUBLE,
+    rate_max_pct DOUBLE,
+    rate_pct DOUBLE,
+    source_url VARCHAR,
+    source_priority INTEGER,
+    scraped_at TIMESTAMP,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    source VARCHAR NOT NULL,
+    UNIQUE(date, series_code, bank_name, term_months)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bank_rates_date ON bank_rates(date);
+CREATE INDEX IF NOT EXISTS idx_bank_rates_series ON bank_rates(series_code);
+CREATE INDEX IF NOT EXISTS idx_bank_rates_bank ON bank_rates(bank_name);
+CREATE INDEX IF NOT EXISTS idx_bank_rates_source ON bank_rates(source);
+CREATE INDEX IF NOT EXISTS idx_bank_rates_group_term_date ON bank_rates(product_group, term_months, date);
+"""
+
+_INGEST_FAILURES_DDL = """
+CREATE TABLE IF NOT EXISTS ingest_failures (
+    id INTEGER PRIMARY KEY,
+    dataset_id VARCHAR NOT NULL,
+    provider VARCHAR NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    error_type VARCHAR NOT NULL,
+    error_message TEXT,
+    raw_ref VARCHAR,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_failures_dataset ON ingest_failures(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_ingest_failures_provider ON ingest_failures(provider);
+CREATE INDEX IF NOT EXISTS idx_ingest_failures_created_at ON ingest_failures(created_at);
+
+CREATE SEQUENCE IF NOT EXISTS ingest_failures_id_seq START 1;
+"""
+
+_TRANSMISSION_DAILY_METRICS_DDL = """
+CREATE TABLE IF NOT EXISTS transmission_daily_metrics (
+    date DATE NOT NULL,
+    metric_name VARCHAR NOT NULL,
+    metric_value DOUBLE,
+    metric_value_text TEXT,
+    source_components TEXT,
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, metric_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transmission_metrics_date ON transmission_daily_metrics(date);
+CREATE INDEX IF NOT EXISTS idx_transmission_metrics_name ON transmission_daily_metrics(metric_name);
+CREATE INDEX IF NOT EXISTS idx_transmission_metrics_computed_at ON transmission_daily_metrics(computed_at);
+CREATE INDEX IF NOT EXISTS idx_transmission_metrics_name_value ON transmission_daily_metrics(metric_name, metric_value);
+"""
+
+_TRANSMISSION_ALERTS_DDL = """
+CREATE TABLE IF NOT EXISTS transmission_alerts (
+    id INTEGER PRIMARY KEY,
+    date DATE NOT NULL,
+    alert_type VARCHAR NOT NULL,
+    severity VARCHAR NOT NULL,
+    message TEXT,
+    metric_value DOUBLE,
+    threshold DOUBLE,
+    source_data TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_transmission_alerts_date ON transmission_alerts(date);
+CREATE INDEX IF NOT EXISTS idx_transmission_alerts_type ON transmission_alerts(alert_type);
+CREATE INDEX IF NOT EXISTS idx_transmission_alerts_severity ON transmission_alerts(severity);
+CREATE INDEX IF NOT EXISTS idx_transmission_alerts_created_at ON transmission_alerts(created_at);
+
+CREATE SEQUENCE IF NOT EXISTS transmission_alerts_id_seq START 1;
+"""
+
+_GLOBAL_RATES_DAILY_DDL = """
+CREATE TABLE IF NOT EXISTS global_rates_daily (
+    date DATE NOT NULL,
+    series_id VARCHAR NOT NULL,
+    series_name VARCHAR NOT NULL,
+    value DOUBLE,
+    source VARCHAR NOT NULL,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, series_id, source)
+);
+
+CREATE INDEX IF NOT EXISTS idx_global_rates_date ON global_rates_daily(date);
+CREATE INDEX IF NOT EXISTS idx_global_rates_series ON global_rates_daily(series_id);
+CREATE INDEX IF NOT EXISTS idx_global_rates_source ON global_rates_daily(source);
+"""
+
+_BONDY_STRESS_DAILY_DDL = """
+CREATE TABLE IF NOT EXISTS bondy_stress_daily (
+    date DATE NOT NULL UNIQUE,
+    stress_index DOUBLE,
+    regime_bucket VARCHAR,
+    driver_json JSON,
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_bondy_stress_date ON bondy_stress_daily(date);
+CREATE INDEX IF NOT EXISTS idx_bondy_stress_bucket ON bondy_stress_daily(regime_bucket);
+"""
+
+_DAILY_SNAPSHOTS_DDL = """
+CREATE TABLE IF NOT EXISTS daily_snapshots (
+    date DATE NOT NULL UNIQUE,
+    baseline_date DATE,
+    snapshot_json JSON,
+    snapshot_text TEXT,
+    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    source_components_json JSON
+);
+
+CREATE INDEX IF NOT EXISTS idx_daily_snapshots_date ON daily_snapshots(date);
+CREATE INDEX IF NOT EXISTS idx_daily_snapshots_baseline ON daily_snapshots(baseline_date);
+"""
+
+_ALERTS_DDL = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY,
+    rule_code VARCHAR NOT NULL,
+    severity VARCHAR NOT NULL,
+    message TEXT,
+    details_json JSON,
+    triggered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_alerts_rule_code ON alerts(rule_code);
+CREATE INDEX IF NOT EXISTS idx_alerts_severity ON alerts(severity);
+CREATE INDEX IF NOT EXISTS idx_alerts_triggered_at ON alerts(triggered_at);
+
+CREATE SEQUENCE IF NOT EXISTS alerts_id_seq START 1;
+"""
+
+_ALERT_THRESHOLDS_DDL = """
+CREATE TABLE IF NOT EXISTS alert_thresholds (
+    id INTEGER PRIMARY KEY,
+    alert_code VARCHAR NOT NULL UNIQUE,
+    enabled BOOLEAN DEFAULT TRUE,
+    severity VARCHAR NOT NULL,
+    params_json JSON,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_alert_thresholds_code ON alert_thresholds(alert_code);
+CREATE INDEX IF NOT EXISTS idx_alert_thresholds_enabled ON alert_thresholds(enabled);
+
+CREATE SEQUENCE IF NOT EXISTS alert_thresholds_id_seq START 1;
+"""
+
+_NOTIFICATION_CHANNELS_DDL = """
+CREATE TABLE IF NOT EXISTS notification_channels (
+    id INTEGER PRIMARY KEY,
+    channel_type VARCHAR NOT NULL,
+    enabled BOOLEAN DEFAULT FALSE,
+    config_json JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_channels_type ON notification_channels(channel_type);
+CREATE INDEX IF NOT EXISTS idx_notification_channels_enabled ON notification_channels(enabled);
+
+CREATE SEQUENCE IF NOT EXISTS notification_channels_id_seq START 1;
+"""
+
+_NOTIFICATION_EVENTS_DDL = """
+CREATE TABLE IF NOT EXISTS notification_events (
+    id INTEGER PRIMARY KEY,
+    date DATE NOT NULL,
+    alert_code VARCHAR NOT NULL,
+    channel_id INTEGER NOT NULL,
+    status VARCHAR NOT NULL,
+    error_message TEXT,
+    sent_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    channel_type VARCHAR
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_events_date ON notification_events(date);
+CREATE INDEX IF NOT EXISTS idx_notification_events_alert ON notification_events(alert_code);
+CREATE INDEX IF NOT EXISTS idx_notification_events_channel ON notification_events(channel_id);
+
+CREATE SEQUENCE IF NOT EXISTS notification_events_id_seq START 1;
+"""
+
+_REPORT_ARTIFACTS_DDL = """
+CREATE TABLE IF NOT EXISTS report_artifacts (
+    id INTEGER PRIMARY KEY,
+    report_type VARCHAR NOT NULL,
+    date DATE NOT NULL,
+    file_path VARCHAR NOT NULL,
+    file_size BIGINT,
+    status VARCHAR NOT NULL,
+    error_message TEXT,
+    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(report_type, date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_report_artifacts_type ON report_artifacts(report_type);
+CREATE INDEX IF NOT EXISTS idx_report_artifacts_date ON report_artifacts(date);
+
+CREATE SEQUENCE IF NOT EXISTS report_artifacts_id_seq START 1;
+"""
+
+_DQ_RUNS_DDL = """
+CREATE TABLE IF NOT EXISTS dq_runs (
+    id INTEGER PRIMARY KEY,
+    run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    target_date DATE NOT NULL,
+    status VARCHAR NOT NULL,
+    total_rules INTEGER,
+    passed_rules INTEGER,
+    failed_rules INTEGER,
+    summary_json JSON
+);
+
+CREATE INDEX IF NOT EXISTS idx_dq_runs_target_date ON dq_runs(target_date);
+CREATE INDEX IF NOT EXISTS idx_dq_runs_status ON dq_runs(status);
+
+CREATE SEQUENCE IF NOT EXISTS dq_runs_id_seq START 1;
+"""
+
+_DQ_RESULTS_DDL = """
+CREATE TABLE IF NOT EXISTS dq_results (
+    id INTEGER PRIMARY KEY,
+    target_date DATE NOT NULL,
+    dataset_id VARCHAR NOT NULL,
+    rule_code VARCHAR NOT NULL,
+    severity VARCHAR NOT NULL,
+    passed BOOLEAN NOT NULL,
+    message TEXT,
+    details_json JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(target_date, dataset_id, rule_code)
+);
+
+CREATE INDEX IF NOT EXISTS idx_dq_results_target_date ON dq_results(target_date);
+CREATE INDEX IF NOT EXISTS idx_dq_results_dataset ON dq_results(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_dq_results_severity ON dq_results(severity);
+
+CREATE SEQUENCE IF NOT EXISTS dq_results_id_seq START 1;
+"""
+
+_SOURCE_FINGERPRINTS_DDL = """
+CREATE TABLE IF NOT EXISTS source_fingerprints (
+    id INTEGER PRIMARY KEY,
+    provider VARCHAR NOT NULL,
+    dataset_id VARCHAR NOT NULL,
+    target_date DATE NOT NULL,
+    fingerprint_hash VARCHAR NOT NULL,
+    content_type VARCHAR,
+    bytes INTEGER,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    parse_rowcount INTEGER,
+    parse_required_fields_ok BOOLEAN,
+    note TEXT,
+    UNIQUE(provider, dataset_id, target_date, fingerprint_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_source_fingerprints_provider ON source_fingerprints(provider);
+CREATE INDEX IF NOT EXISTS idx_source_fingerprints_dataset ON source_fingerprints(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_source_fingerprints_date ON source_fingerprints(target_date);
+CREATE INDEX IF NOT EXISTS idx_source_fingerprints_hash ON source_fingerprints(fingerprint_hash);
+CREATE INDEX IF NOT EXISTS idx_source_fingerprints_provider_dataset_fetched
+    ON source_fingerprints(provider, dataset_id, fetched_at);
+
+CREATE SEQUENCE IF NOT EXISTS source_fingerprints_id_seq START 1;
+"""
+
+_TABLE_COVERAGE_ROLLUP_DDL = """
+CREATE TABLE IF NOT EXISTS table_coverage_rollup (
+    table_name VARCHAR PRIMARY KEY,
+    earliest_date DATE,
+    latest_date DATE,
+    date_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_FINGERPRINT_DRIFT_ROLLUP_DDL = """
+CREATE TABLE IF NOT EXISTS fingerprint_drift_30d (
+    provider VARCHAR NOT NULL,
+    dataset_id VARCHAR NOT NULL,
+    fetched_day DATE NOT NULL,
+    fingerprint_hash VARCHAR NOT NULL,
+    last_fetched TIMESTAMP,
+    rowcount_n INTEGER NOT NULL DEFAULT 0,
+    sum_rowcount BIGINT NOT NULL DEFAULT 0,
+    parse_failures INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (provider, dataset_id, fetched_day, fingerprint_hash)
+);
+"""
+
+_SCHEMA_MIGRATIONS_DDL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    name VARCHAR PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Every table's DDL as one script, in creation order, so initialize_schema
+# creates the whole schema with a single execute() call.
+_SCHEMA_DDL = "\n".join((
+    _SCHEMA_MIGRATIONS_DDL,
+    _GOV_YIELD_CURVE_DDL,
+    _GOV_YIELD_CHANGE_STATS_DDL,
+    _INTERBANK_RATES_DDL,
+    _INGEST_RUNS_DDL,
+    _GOV_AUCTION_RESULTS_DDL,
+    _GOV_SECONDARY_TRADING_DDL,
+    _POLICY_RATES_DDL,
+    _BANK_RATES_DDL,
+    _INGEST_FAILURES_DDL,
+    _TRANSMISSION_DAILY_METRICS_DDL,
+    _TRANSMISSION_ALERTS_DDL,
+    _GLOBAL_RATES_DAILY_DDL,
+    _BONDY_STRESS_DAILY_DDL,
+    _DAILY_SNAPSHOTS_DDL,
+    _ALERTS_DDL,
+    _ALERT_THRESHOLDS_DDL,
+    _NOTIFICATION_CHANNELS_DDL,
+    _NOTIFICATION_EVENTS_DDL,
+    _REPORT_ARTIFACTS_DDL,
+    _DQ_RUNS_DDL,
+    _DQ_RESULTS_DDL,
+    _SOURCE_FINGERPRINTS_DDL,
+    _TABLE_COVERAGE_ROLLUP_DDL,
+    _FINGERPRINT_DRIFT_ROLLUP_DDL,
+))
+
+
+# get_bank_rates: $1..$6 are optional filters (NULL = unfiltered), $7 an optional LIMIT.
+_SQL_BANK_RATES = """
+SELECT *
+FROM bank_rates
+WHERE ($1::VARCHAR IS NULL OR series_code = $1)
+  AND ($2::VARCHAR IS NULL OR bank_name = $2)
+  AND ($3::VARCHAR IS NULL OR product_group = $3)
+  AND ($4::INTEGER IS NULL OR term_months = $4)
+  AND ($5::DATE IS NULL OR date >= $5)
+  AND ($6::DATE IS NULL OR date <= $6)
+ORDER BY date DESC, product_group, series_code, bank_name, term_months
+LIMIT $7
+"""
+
+# Latest deposit/loan dates and their simple averages for get_latest_bank_rate_averages.
+# Loan rows use the midpoint when min+max exist, else min, else rate_pct.
+_SQL_LATEST_BANK_RATE_AVERAGES = """
+WITH latest_dep AS (
+    SELECT MAX(date) AS d
+    FROM bank_rates
+    WHERE product_group = 'deposit'
+      AND term_months = $1
+      AND rate_pct IS NOT NULL
+),
+latest_loan AS (
+    SELECT MAX(date) AS d
+    FROM bank_rates
+    WHERE product_group = 'loan'
+      AND (rate_min_pct IS NOT NULL OR rate_max_pct IS NOT NULL OR rate_pct IS NOT NULL)
+),
+dep AS (
+    SELECT AVG(b.rate_pct) AS v
+    FROM bank_rates b, latest_dep
+    WHERE b.date = latest_dep.d
+      AND b.product_group = 'deposit'
+      AND b.term_months = $1
+      AND b.rate_pct IS NOT NULL
+),
+loan AS (
+    SELECT AVG(
+      CASE
+        WHEN b.rate_min_pct IS NOT NULL AND b.rate_max_pct IS NOT NULL THEN (b.rate_min_pct + b.rate_max_pct) / 2.0
+        WHEN b.rate_min_pct IS NOT NULL THEN b.rate_min_pct
+        WHEN b.rate_pct IS NOT NULL THEN b.rate_pct
+        ELSE NULL
+      END
+    ) AS v
+    FROM bank_rates b, latest_loan
+    WHERE b.date = latest_loan.d
+      AND b.product_group = 'loan'
+)
+SELECT latest_dep.d, latest_loan.d, dep.v, loan.v
+FROM latest_dep, latest_loan, dep, loan
+"""
+
+# ABO pages give dot-decimal yields ("4.141") that the generic parser can read as
+# thousands (4141); scale those rows back down. Idempotent.
+_SQL_NORMALIZE_ABO_YIELD_CURVE = """
+UPDATE gov_yield_curve
+SET
+  spot_rate_annual = spot_rate_annual / 1000.0,
+  spot_rate_continuous = CASE
+    WHEN spot_rate_continuous IS NULL THEN NULL
+    ELSE spot_rate_continuous / 1000.0
+  END,
+  par_yield = CASE
+    WHEN par_yield IS NULL THEN NULL
+    ELSE par_yield / 1000.0
+  END
+WHERE source = 'ABO'
+  AND spot_rate_annual IS NOT NULL
+  AND spot_rate_annual > 100
+  AND spot_rate_annual < 100000
+"""
+
+# Transmission metrics derived from yield levels, and thus affected by the ABO mis-scaling.
+_TRANSMISSION_YIELD_METRICS = (
+    "level_2y",
+    "level_5y",
+    "level_10y",
+    "slope_10y_2y",
+    "slope_5y_2y",
+    "curvature",
+)
+
+_SQL_NORMALIZE_TRANSMISSION_YIELDS = f"""
+UPDATE transmission_daily_metrics
+SET metric_value = metric_value / 1000.0
+WHERE metric_name IN ({",".join("?" * len(_TRANSMISSION_YIELD_METRICS))})
+  AND metric_value IS NOT NULL
+  AND metric_value > 100
+  AND metric_value < 100000
+"""
+
+
+# Column order of each batch insert, shared by _normalize_records and the upsert
+# SQL. Global rates insert and select the same columns (_GLOBAL_RATE_COLUMNS below).
+_BANK_RATE_COLUMNS = (
+    "date",
+    "product_group",
+    "series_code",
+    "bank_name",
+    "term_months",
+    "term_label",
+    "rate_min_pct",
+    "rate_max_pct",
+    "rate_pct",
+    "source_url",
+    "source_priority",
+    "scraped_at",
+    "fetched_at",
+    "source",
+)
+_YIELD_CURVE_COLUMNS = (
+    "date",
+    "tenor_label",
+    "tenor_days",
+    "spot_rate_continuous",
+    "par_yield",
+    "spot_rate_annual",
+    "source",
+    "fetched_at",
+)
+_YIELD_CHANGE_STATS_COLUMNS = (
+    "date",
+    "bucket_label",
+    "currency",
+    "volume_domestic",
+    "volume_foreign",
+    "weight_domestic",
+    "weight_foreign",
+    "yield_min_domestic",
+    "yield_max_domestic",
+    "yield_min_foreign",
+    "yield_max_foreign",
+    "source",
+    "raw_file",
+)
+_INTERBANK_RATE_COLUMNS = ("date", "tenor_label", "rate", "source", "fetched_at")
+_AUCTION_RESULT_COLUMNS = (
+    "date",
+    "instrument_type",
+    "tenor_label",
+    "tenor_days",
+    "amount_offered",
+    "amount_sold",
+    "bid_to_cover",
+    "cut_off_yield",
+    "avg_yield",
+    "source",
+    "raw_file",
+    "fetched_at",
+)
+_SECONDARY_TRADING_COLUMNS = (
+    "date",
+    "segment",
+    "bucket_label",
+    "segment_kind",
+    "segment_code",
+    "bucket_kind",
+    "bucket_code",
+    "bucket_display",
+    "volume",
+    "value",
+    "avg_yield",
+    "source",
+    "raw_file",
+    "fetched_at",
+)
+_POLICY_RATE_COLUMNS = ("date", "rate_name", "rate", "source", "raw_file", "fetched_at")
+
+# Explicit projections for the list getters: only these columns are read, in a
+# fixed order regardless of how older databases had columns appended.
+_INGEST_FAILURE_COLUMNS = (
+    "id",
+    "dataset_id",
+    "provider",
+    "start_date",
+    "end_date",
+    "error_type",
+    "error_message",
+    "raw_ref",
+    "created_at",
+)
+_INGEST_RUN_COLUMNS = (
+    "id",
+    "provider",
+    "start_date",
+    "end_date",
+    "status",
+    "rows_inserted",
+    "error_message",
+    "started_at",
+    "ended_at",
+)
+_TRANSMISSION_METRIC_COLUMNS = (
+    "date",
+    "metric_name",
+    "metric_value",
+    "metric_value_text",
+    "source_components",
+    "computed_at",
+)
+_GLOBAL_RATE_COLUMNS = ("date", "series_id", "series_name", "value", "source", "fetched_at")
+_TRANSMISSION_ALERT_COLUMNS = (
+    "id",
+    "date",
+    "alert_type",
+    "severity",
+    "message",
+    "metric_value",
+    "threshold",
+    "source_data",
+    "created_at",
+)
+
+_SQL_INGEST_FAILURES = f"""
+SELECT {", ".join(_INGEST_FAILURE_COLUMNS)}
+FROM ingest_failures
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_INGEST_RUNS = f"""
+SELECT {", ".join(_INGEST_RUN_COLUMNS)}
+FROM ingest_runs
+ORDER BY started_at DESC
+LIMIT ?
+"""
+
+# get_pending_resumes: $1 optionally narrows to one dataset (NULL = all datasets).
+_SQL_PENDING_RESUMES = """
+SELECT dataset_id, provider, start_date, end_date, COUNT(*) AS fail_count
+FROM ingest_failures
+WHERE ($1::VARCHAR IS NULL OR dataset_id = $1)
+GROUP BY dataset_id, provider, start_date, end_date
+ORDER BY start_date DESC
+"""
+
+# The filtered getters below share one statement per table: every filter is an
+# optional parameter (NULL = unfiltered), so each getter has a single SQL text
+# that parses once and is reused for every filter combination. LIMIT NULL
+# means no limit.
+
+# get_transmission_metrics: $1 metric_name, $2/$3 date bounds, $4 limit.
+_SQL_TRANSMISSION_METRICS = f"""
+SELECT {", ".join(_TRANSMISSION_METRIC_COLUMNS)}
+FROM transmission_daily_metrics
+WHERE ($1::VARCHAR IS NULL OR metric_name = $1)
+  AND ($2::DATE IS NULL OR date >= $2)
+  AND ($3::DATE IS NULL OR date <= $3)
+ORDER BY date DESC, metric_name
+LIMIT $4
+"""
+
+# get_transmission_alerts: $1 alert_type, $2/$3 date bounds, $4 limit. ORDER BY +
+# LIMIT plans as a TOP_N heap, so the filtered set is never fully sorted.
+_SQL_TRANSMISSION_ALERTS = f"""
+SELECT {", ".join(_TRANSMISSION_ALERT_COLUMNS)}
+FROM transmission_alerts
+WHERE ($1::VARCHAR IS NULL OR alert_type = $1)
+  AND ($2::DATE IS NULL OR date >= $2)
+  AND ($3::DATE IS NULL OR date <= $3)
+ORDER BY date DESC, created_at DESC
+LIMIT $4
+"""
+
+# get_global_rates: $1 series_id, $2/$3 date bounds, $4 limit.
+_SQL_GLOBAL_RATES = f"""
+SELECT {", ".join(_GLOBAL_RATE_COLUMNS)}
+FROM global_rates_daily
+WHERE ($1::VARCHAR IS NULL OR series_id = $1)
+  AND ($2::DATE IS NULL OR date >= $2)
+  AND ($3::DATE IS NULL OR date <= $3)
+ORDER BY date DESC, series_id
+LIMIT $4
+"""
+
+# *_json columns stored as DuckDB JSON; older databases created them as TEXT
+_JSON_COLUMNS = {
+    "bondy_stress_daily": ("driver_json",),
+    "daily_snapshots": ("snapshot_json", "source_components_json"),
+    "alerts": ("details_json",),
+    "alert_thresholds": ("params_json",),
+    "notification_channels": ("config_json",),
+    "dq_runs": ("summary_json",),
+    "dq_results": ("details_json",),
+}
+
+# get_bondy_stress / iter_bondy_stress: $1/$2 date bounds, $3 limit.
+_SQL_BONDY_STRESS = """
+SELECT * FROM bondy_stress_daily
+WHERE ($1::DATE IS NULL OR date >= $1)
+  AND ($2::DATE IS NULL OR date <= $2)
+ORDER BY date DESC
+LIMIT $3
+"""
+
+# get_alert_thresholds / get_notification_channels: $1 enabled_only
+_SQL_ALERT_THRESHOLDS = """
+SELECT * FROM alert_thresholds
+WHERE NOT $1 OR enabled
+ORDER BY alert_code
+"""
+
+_SQL_NOTIFICATION_CHANNELS = """
+SELECT * FROM notification_channels
+WHERE NOT $1 OR enabled
+ORDER BY id
+"""
+
+# get_source_fingerprints: $1 provider, $2 dataset, $3/$4 target_date bounds, $5 limit
+_SQL_SOURCE_FINGERPRINTS = """
+SELECT * FROM source_fingerprints
+WHERE ($1::VARCHAR IS NULL OR provider = $1)
+  AND ($2::VARCHAR IS NULL OR dataset_id = $2)
+  AND ($3::DATE IS NULL OR target_date >= $3)
+  AND ($4::DATE IS NULL OR target_date <= $4)
+ORDER BY fetched_at DESC
+LIMIT $5
+"""
+
+# check_fingerprint_drift: the newest fingerprint for ($1 provider, $2 dataset)
+# plus the parse_rowcount recorded for the current hash $3. No row when the
+# provider/dataset has never been fingerprinted.
+_SQL_FINGERPRINT_DRIFT = """
+SELECT
+    prev.fingerprint_hash,
+    prev.parse_rowcount,
+    (SELECT parse_rowcount FROM source_fingerprints WHERE fingerprint_hash = $3 LIMIT 1)
+FROM (
+    SELECT fingerprint_hash, parse_rowcount
+    FROM source_fingerprints
+    WHERE provider = $1 AND dataset_id = $2
+    ORDER BY fetched_at DESC
+    LIMIT 1
+) AS prev
+"""
+
+# Rows pulled per fetchmany() call by _iter_dicts
+_ITER_BATCH_SIZE = 1024
+
+# get_interbank_rates: $1/$2 date bounds, $3 tenor. One row per (date, tenor_label):
+# SBV > ABO > others, then newest fetched_at.
+_SQL_INTERBANK_RATES = f"""
+SELECT {", ".join(_INTERBANK_RATE_COLUMNS)}
+FROM interbank_rates
+WHERE ($1::DATE IS NULL OR date >= $1)
+  AND ($2::DATE IS NULL OR date <= $2)
+  AND ($3::VARCHAR IS NULL OR tenor_label = $3)
+QUALIFY ROW_NUMBER() OVER (
+  PARTITION BY date, tenor_label
+  ORDER BY
+    CASE
+      WHEN source = 'SBV' THEN 1
+      WHEN source = 'ABO' THEN 2
+      ELSE 9
+    END ASC,
+    fetched_at DESC
+) = 1
+ORDER BY date DESC, tenor_label
+"""
+
+@lru_cache(maxsize=64)
+def _row_extractor(keys: tuple[str, ...]) -> Callable[[dict], tuple]:
+    """
+    Return a callable mapping a dict record to the tuple of its `keys` values.
+
+    Built once per key tuple; for more than one key it is the bare
+    itemgetter, so extraction runs entirely in C.
+    """
+    get = itemgetter(*keys)
+    if len(keys) == 1:
+        return lambda record: (get(record),)
+    return get
+
+
+def _fetch_dicts(cur: duckdb.DuckDBPyConnection, columns: Optional[Sequence[str]] = None) -> list[dict]:
+    """
+    Fetch the remaining rows of the last query on `cur` as column -> value dicts.
+
+    Column binding runs through map/zip in C rather than a per-row
+    comprehension; values keep their DuckDB-to-Python types. Queries with a
+    fixed projection pass its `columns` so cur.description is not walked.
+    """
+    if columns is None:
+        columns = [desc[0] for desc in cur.description]
+    return list(map(dict, map(zip, repeat(columns), cur.fetchall())))
+
+
+@lru_cache(maxsize=64)
+def _row_type(columns: tuple[str, ...]) -> type:
+    """Named tuple class for a projection, built once per column tuple"""
+    return namedtuple("Row", columns, rename=True)
+
+
+def _fetch_records(cur: duckdb.DuckDBPyConnection, columns: Optional[Sequence[str]] = None) -> list[tuple]:
+    """
+    Fetch the remaining rows of the last query on `cur` as named tuples.
+
+    Rows keep tuple storage (no per-row dict) and expose columns as
+    attributes; ._asdict() gives the dict form when a caller needs it.
+    """
+    if columns is None:
+        columns = [desc[0] for desc in cur.description]
+    return list(map(_row_type(tuple(columns))._make, cur.fetchall()))
+
+
+def _fetch_dict(cur: duckdb.DuckDBPyConnection) -> Optional[dict]:
+    """Fetch the next row of the last query on `cur` as a dict, or None"""
+    row = cur.fetchone()
+    if row is None:
+        return None
+    return dict(zip([desc[0] for desc in cur.description], row))
+
+
+def _iter_dicts(
+    cur: duckdb.DuckDBPyConnection, batch_size: int = _ITER_BATCH_SIZE
+) -> Iterator[dict]:
+    """
+    Yield the remaining rows of the last query on `cur` as column -> value dicts.
+
+    Rows are pulled batch_size at a time with fetchmany(), so at most one
+    batch of tuples is materialized in Python while the caller iterates.
+    """
+    columns = [desc[0] for desc in cur.description]
+    while True:
+        rows = cur.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from map(dict, map(zip, repeat(columns), rows))
+
+
+# Alert types produced by the core transmission run; insert_transmission_alerts
+# replaces the whole set for a day when a batch contains only these.
+_CORE_TRANSMISSION_ALERT_TYPES = frozenset({
+    "ALERT_TRANSMISSION_TIGHTENING",
+    "ALERT_TRANSMISSION_JUMP",
+    "ALERT_LIQUIDITY_SPIKE",
+    "ALERT_CURVE_BEAR_STEEPEN",
+    "ALERT_AUCTION_WEAK",
+    "ALERT_TURNOVER_DROP",
+    "ALERT_POLICY_CHANGE",
+    "ALERT_TRANSMISSION_HIGH",
+    "ALERT_STRESS_HIGH",
+})
+
+_EMPTY_SOURCES_JSON = "{}"
+
+# Compact (no-whitespace) JSON for payload columns; one shared encoder instead of
+# json.dumps building a new one for every call with non-default separators.
+_encode_compact_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _metric_from_dict(data: dict) -> tuple:
+    return data.get("value"), data.get("value_text"), json.dumps(data.get("sources", {}))
+
+
+def _metric_from_text(data: str) -> tuple:
+    return None, data, _EMPTY_SOURCES_JSON
+
+
+def _metric_from_value(data: Any) -> tuple:
+    # Subclasses of dict/str miss the exact-type lookup in _METRIC_EXTRACTORS
+    if isinstance(data, dict):
+        return _metric_from_dict(data)
+    if isinstance(data, str):
+        return _metric_from_text(data)
+    return data, None, _EMPTY_SOURCES_JSON
+
+
+# insert_transmission_metrics: metric payload type -> (value, value_text, source_components)
+_METRIC_EXTRACTORS: dict[type, Callable[[Any], tuple]] = {
+    dict: _metric_from_dict,
+    str: _metric_from_text,
+}
+
+
+def _to_datetime(value: Any) -> Any:
+    """
+    Parse an ISO-8601 string into a datetime; other values pass through.
+
+    Sticks to datetime.fromisoformat (C-implemented, far cheaper than a
+    general-purpose parser) and maps a trailing 'Z' to '+00:00' so UTC
+    timestamps take the same path.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class _MigrationFailed(Exception):
+    """Rolls back the transaction of a migration that reported failure"""
+
 
 class DatabaseManager:
     """Manages DuckDB database connection and schema initialization"""
 
     def __init__(self, db_path: str):
+        _ensure_db_path_ok()
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.con: Optional[duckdb.DuckDBPyConnection] = None
+        # Per-thread cursors (and transaction depth), see _cursor()
+        self._local = threading.local()
+        self._owner_thread: Optional[int] = None
+        self._cursors: list[duckdb.DuckDBPyConnection] = []
+        self._cursors_lock = threading.Lock()
+        # Parsed statements keyed by SQL text, see _stmt()
+        self._prepared: dict[str, duckdb.Statement] = {}
+        # schema_migrations names, read once per initialize_schema()
+        self._applied_migrations: Optional[set[str]] = None
 
     def connect(self, read_only: bool = False):
         """Establish database connection"""
         try:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self.con = duckdb.connect(str(self.db_path), read_only=bool(read_only))
+            self._owner_thread = threading.get_ident()
+            # SET after connecting rather than passing connect(config=...): DuckDB
+            # refuses further connections to a file opened with a different config,
+            # which would break the plain connections app.ops opens for exports.
+            self._apply_runtime_settings(read_only=bool(read_only))
             logger.info(f"Connected to database at {self.db_path}")
             return self.con
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
+    def _apply_runtime_settings(self, read_only: bool = False) -> None:
+        """
+        Apply the DuckDB runtime knobs from settings to the new connection.
+
+        Each option is set on its own so one that this DuckDB version rejects
+        only logs a warning. The checkpoint threshold only matters for writers
+        and is skipped on read-only connections.
+        """
+        options: list[tuple[str, Any]] = [
+            ("threads", settings.duckdb_threads),
+            ("memory_limit", settings.duckdb_memory_limit),
+            ("temp_directory", settings.duckdb_temp_directory),
+            ("preserve_insertion_order", settings.duckdb_preserve_insertion_order),
+        ]
+        if not read_only:
+            options.append(("checkpoint_threshold", settings.duckdb_checkpoint_threshold))
+
+        for name, value in options:
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                literal = "true" if value else "false"
+            elif isinstance(value, int):
+                literal = str(value)
+            else:
+                literal = "'" + str(value).replace("'", "''") + "'"
+            try:
+                self.con.execute(f"SET {name} = {literal}")
+            except duckdb.Error as e:
+                logger.warning(f"Could not set DuckDB {name}={literal}: {e}")
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return this thread's handle on the database.
+
+        A DuckDB connection must not be shared between threads, so threads
+        other than the one that called connect() each get their own
+        self.con.cursor(), created on first use and reused afterwards. The
+        connecting thread keeps using self.con directly.
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.con
+        local = self._local
+        if getattr(local, "con", None) is not self.con:
+            local.con = self.con
+            local.cursor = self.con.cursor()
+            local.txn_depth = 0
+            with self._cursors_lock:
+                self._cursors.append(local.cursor)
+        return local.cursor
+
+    def release_thread_cursor(self) -> None:
+        """
+        Close the calling thread's cursor, if it has one.
+
+        Pool workers call this when their task finishes so short-lived thread
+        pools do not leave one cursor per thread registered until close().
+        The thread gets a fresh cursor if it uses the manager again.
+        """
+        local = self._local
+        cursor = getattr(local, "cursor", None)
+        if cursor is None:
+            return
+        local.con = local.cursor = None
+        with self._cursors_lock:
+            try:
+                self._cursors.remove(cursor)
+            except ValueError:
+                pass
+        try:
+            cursor.close()
+        except duckdb.Error:
+            pass
+
     def close(self):
         """Close database connection"""
+        with self._cursors_lock:
+            cursors, self._cursors = self._cursors, []
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except duckdb.Error:
+                pass
         if self.con:
             self.con.close()
             logger.info("Database connection closed")
 
+    def _stmt(self, sql: str) -> duckdb.Statement:
+        """
+        Return the parsed statement for `sql`, parsing it on first use.
+
+        Hot write paths run the same SQL text on every call; executing the
+        cached statement skips re-parsing it. Parsed statements are not bound
+        to a connection, so the cache survives reconnects.
+        """
+        stmt = self._prepared.get(sql)
+        if stmt is None:
+            stmt = duckdb.extract_statements(sql)[0]
+            self._prepared[sql] = stmt
+        return stmt
+
+    @contextmanager
+    def _txn(self):
+        """
+        Run the enclosed statements in one explicit transaction.
+
+        Commits on success and rolls back on error. Nested uses join the
+        outermost transaction, so a bulk insert called from a larger unit of
+        work commits together with it instead of on its own. Transactions are
+        per thread and run on that thread's _cursor().
+        """
+        local = self._local
+        if getattr(local, "txn_depth", 0):
+            local.txn_depth += 1
+            try:
+                yield
+            finally:
+                local.txn_depth -= 1
+            return
+
+        cur = self._cursor()
+        cur.execute("BEGIN TRANSACTION")
+        local.txn_depth = 1
+        try:
+            yield
+        except BaseException:
+            local.txn_depth = 0
+            cur.execute("ROLLBACK")
+            raise
+        local.txn_depth = 0
+        cur.execute("COMMIT")
+
     def initialize_schema(self):
         """Initialize all database tables"""
         if not self.con:
@@ -43,123 +1196,126 @@ class DatabaseManager:
 
         logger.info("Initializing database schema...")
 
-        # Create tables in order
-        self._create_gov_yield_curve_table()
-        self._create_gov_yield_change_stats_table()
-        self._create_interbank_rates_table()
-        self._create_ingest_runs_table()
-        self._create_gov_auction_results_table()
-        self._create_gov_secondary_trading_table()
-        self._create_policy_rates_table()
-        self._create_bank_rates_table()
-        self._create_ingest_failures_table()
-        self._create_transmission_daily_metrics_table()
-        self._create_transmission_alerts_table()
-        self._create_global_rates_daily_table()
-        self._create_bondy_stress_daily_table()
-        self._create_daily_snapshots_table()
-        self._create_alerts_table()
-        self._create_alert_thresholds_table()
-        self._create_notification_channels_table()
-        self._create_notification_events_table()
-        self._create_report_artifacts_table()
-        self._create_dq_runs_table()
-        self._create_dq_results_table()
-        self._create_source_fingerprints_table()
-
-        # Data hygiene: normalize known provider scaling quirks (idempotent)
-        self._normalize_abo_yield_curve_scaling()
-        self._normalize_transmission_yield_scaling()
-
-        logger.info("Database schema initialized successfully")
-
-        # Create views
-        self._create_transmission_views()
-        self._create_bondy_stress_views()
-        self._create_bank_rates_views()
-
-        # Seed default alert thresholds
-        self._seed_default_alert_thresholds()
-
-    def _normalize_abo_yield_curve_scaling(self) -> None:
+        try:
+            # Tables and id sequences commit together. Each migration then runs
+            # in its own transaction (see _apply_migration), so one that fails
+            # is rolled back without aborting the rest of the bootstrap.
+            with self._txn():
+                # Create every table in one script, then run the per-table steps
+                # DDL alone cannot express (column migrations, backfills)
+                self.con.execute(_SCHEMA_DDL)
+                # Every migration below checks this set instead of querying
+                # schema_migrations once each; restarts then skip them all cheaply
+                self._applied_migrations = {
+                    name for (name,) in self.con.execute("SELECT name FROM schema_migrations").fetchall()
+                }
+                self._sync_id_sequence("ingest_runs", "ingest_runs_id_seq")
+                self._sync_id_sequence("ingest_failures", "ingest_failures_id_seq")
+
+            self._ensure_gov_secondary_trading_columns()
+            self._ensure_transmission_daily_metrics_columns()
+            # Drop indexes before the JSON retype, which has to drop and
+            # recreate every index on the tables it alters
+            self._drop_notification_channels_unique_type()
+            self._drop_unused_status_indexes()
+            self._ensure_json_column_types()
+            self._ensure_notification_events_channel_type()
+
+            with self._txn():
+                self._backfill_table_coverage_rollup()
+                self._backfill_fingerprint_drift_rollup()
+            logger.info("Created database tables")
+
+            # Data hygiene: normalize known provider scaling quirks. The parsers
+            # are fixed, so each rewrite only has to run once per database.
+            self._apply_migration("normalize_abo_yield_curve_scaling", self._normalize_abo_yield_curve_scaling)
+            self._apply_migration("normalize_transmission_yield_scaling", self._normalize_transmission_yield_scaling)
+
+            logger.info("Database schema initialized successfully")
+
+            with self._txn():
+                # Create views
+                self._create_transmission_views()
+                self._create_bondy_stress_views()
+                self._create_bank_rates_views()
+
+                # Seed default alert thresholds
+                self._seed_default_alert_thresholds()
+        finally:
+            self._applied_migrations = None
+
+    def _create_schema_migrations_table(self):
+        """Create schema_migrations table (one-time data migrations already applied)"""
+        self.con.execute(_SCHEMA_MIGRATIONS_DDL)
+        logger.info("Created schema_migrations table")
+
+    def _apply_migration(self, name: str, migrate) -> bool:
+        """
+        Run `migrate` unless `name` is already recorded in schema_migrations.
+
+        `migrate` runs in its own transaction together with recording it in
+        schema_migrations. It returns True on success; on False the transaction
+        is rolled back (a statement error aborts a DuckDB transaction, so the
+        migration's partial work cannot be kept anyway) and the migration is
+        retried on the next schema init. Must not be called inside another
+        _txn(). Returns whether the migration ran.
+        """
+        if self._applied_migrations is not None:
+            applied = name in self._applied_migrations
+        else:
+            applied = self.con.execute(
+                self._stmt("SELECT 1 FROM schema_migrations WHERE name = ?"), [name]
+            ).fetchone()
+        if applied:
+            return False
+        try:
+            with self._txn():
+                if not migrate():
+                    raise _MigrationFailed(name)
+                self.con.execute(
+                    "INSERT INTO schema_migrations (name) VALUES (?) ON CONFLICT DO NOTHING", [name]
+                )
+        except _MigrationFailed:
+            logger.warning(f"Migration {name} failed; rolled back, will retry on next start")
+            return True
+        if self._applied_migrations is not None:
+            self._applied_migrations.add(name)
+        logger.info(f"Applied migration {name}")
+        return True
+
+    def _normalize_abo_yield_curve_scaling(self) -> bool:
         """
         ABO pages often provide dot-decimal yields like "4.141" but the generic
         parser may have interpreted them as thousands (4141). Normalize those rows.
-        This is safe to run repeatedly.
+        This is safe to run repeatedly. Returns False if the update failed.
         """
         try:
-            self.con.execute(
-                """
-                UPDATE gov_yield_curve
-                SET
-                  spot_rate_annual = spot_rate_annual / 1000.0,
-                  spot_rate_continuous = CASE
-                    WHEN spot_rate_continuous IS NULL THEN NULL
-                    ELSE spot_rate_continuous / 1000.0
-                  END,
-                  par_yield = CASE
-                    WHEN par_yield IS NULL THEN NULL
-                    ELSE par_yield / 1000.0
-                  END
-                WHERE source = 'ABO'
-                  AND spot_rate_annual IS NOT NULL
-                  AND spot_rate_annual > 100
-                  AND spot_rate_annual < 100000
-                """
-            )
+            self.con.execute(self._stmt(_SQL_NORMALIZE_ABO_YIELD_CURVE))
         except Exception as e:
             logger.warning("Failed to normalize ABO yield curve scaling: %s", e)
+            return False
+        return True
 
-    def _normalize_transmission_yield_scaling(self) -> None:
+    def _normalize_transmission_yield_scaling(self) -> bool:
         """
         Earlier versions may have computed transmission yield-level metrics from
         mis-scaled yield curve inputs (e.g. 4141 instead of 4.141). Normalize
-        those historical rows in-place. Safe to run repeatedly.
+        those historical rows in-place. Safe to run repeatedly. Returns False if
+        the update failed.
         """
         try:
-            metric_names = (
-                "level_2y",
-                "level_5y",
-                "level_10y",
-                "slope_10y_2y",
-                "slope_5y_2y",
-                "curvature",
-            )
-            placeholders = ",".join(["?"] * len(metric_names))
             self.con.execute(
-                f"""
-                UPDATE transmission_daily_metrics
-                SET metric_value = metric_value / 1000.0
-                WHERE metric_name IN ({placeholders})
-                  AND metric_value IS NOT NULL
-                  AND metric_value > 100
-                  AND metric_value < 100000
-                """,
-                list(metric_names),
+                self._stmt(_SQL_NORMALIZE_TRANSMISSION_YIELDS),
+                _TRANSMISSION_YIELD_METRICS,
             )
         except Exception as e:
             logger.warning("Failed to normalize transmission yield scaling: %s", e)
+            return False
+        return True
 
     def _create_alerts_table(self):
         """Create alerts table (rule triggers / demo seed)"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS alerts (
-            id INTEGER PRIMARY KEY,
-            rule_code VARCHAR NOT NULL,
-            severity VARCHAR NOT NULL,
-            message TEXT,
-            details_json TEXT,
-            triggered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_alerts_rule_code ON alerts(rule_code);
-        CREATE INDEX IF NOT EXISTS idx_alerts_severity ON alerts(severity);
-        CREATE INDEX IF NOT EXISTS idx_alerts_triggered_at ON alerts(triggered_at);
-
-        CREATE SEQUENCE IF NOT EXISTS alerts_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_ALERTS_DDL)
         logger.info("Created alerts table")
 
     def insert_alert(
@@ -171,38 +1327,146 @@ class DatabaseManager:
         triggered_at: Optional[datetime | str] = None,
     ) -> int:
         """Insert an alert record (used by demo seed / monitoring)"""
+        cur = self._cursor()
         try:
-            import json
-
-            alert_id = self.con.execute("SELECT nextval('alerts_id_seq')").fetchone()[0]
-            ts: Optional[datetime]
-            if isinstance(triggered_at, str):
-                ts = datetime.fromisoformat(triggered_at)
-            else:
-                ts = triggered_at
+            ts: Optional[datetime] = _to_datetime(triggered_at)
 
             sql = """
             INSERT INTO alerts (id, rule_code, severity, message, details_json, triggered_at)
-            VALUES (?, ?, ?, ?, ?, ?)
+            VALUES (nextval('alerts_id_seq'), ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
-            self.con.execute(
-                sql,
+            (alert_id,) = cur.execute(
+                self._stmt(sql),
                 (
-                    alert_id,
                     rule_code,
                     severity,
                     message,
                     json.dumps(details) if details is not None else None,
                     ts,
                 ),
-            )
+            ).fetchone()
             return alert_id
         except Exception as e:
             logger.error(f"Error inserting alert: {e}")
             raise
 
-    def _normalize_records(self, records: list[Any], keys: list[str]) -> list[tuple]:
+    def _bulk_upsert(
+        self,
+        table: str,
+        keys: Sequence[str],
+        conflict_cols: Sequence[str],
+        params: list[tuple],
+        batch_size: int = BULK_BATCH_SIZE,
+        copy_threshold: int = BULK_COPY_THRESHOLD,
+    ) -> None:
+        """
+        Upsert normalized rows into `table` with one set-based statement.
+
+        Each column is bound as a single list parameter and unnested, so DuckDB
+        plans and executes one INSERT ... SELECT instead of one statement per
+        row. Every non-conflict column is updated on conflict, but only when a
+        data column actually changed: re-ingesting identical rows leaves them
+        (and their fetched_at) untouched instead of rewriting them. Rows sharing a
+        conflict key are collapsed to the last one first, matching executemany
+        (a set-based upsert would otherwise keep the first). A batch that
+        cannot be bound raises; callers run this inside _txn(), so the whole
+        insert is rolled back.
+
+        Large inputs are sent in chunks of `batch_size` rows so a backfill
+        does not materialize one huge list parameter per column. Inputs over
+        `copy_threshold` rows skip the chunks and load from a staged CSV file
+        instead (see _upsert_via_csv), unless a value is the literal string
+        used as the CSV NULL marker, which that path could not tell from NULL.
+        """
+        cur = self._cursor()
+        if not params:
+            return
+
+        columns = ", ".join(keys)
+        update_cols = [k for k in keys if k not in conflict_cols]
+        update_set = ",\n                ".join(f"{k} = EXCLUDED.{k}" for k in update_cols)
+        changed = "\n                OR ".join(
+            f"{table}.{k} IS DISTINCT FROM EXCLUDED.{k}"
+            for k in update_cols
+            if k not in _UPSERT_BOOKKEEPING_COLUMNS
+        )
+        conflict = f"""
+            ON CONFLICT ({", ".join(conflict_cols)})
+            DO UPDATE SET
+                {update_set}
+            """
+        if changed:
+            conflict += f"""WHERE {changed}
+            """
+
+        rows = self._dedupe_rows(table, keys, conflict_cols, params)
+
+        if len(rows) > copy_threshold and not any(_CSV_NULL in row for row in rows):
+            self._upsert_via_csv(table, keys, conflict, rows)
+            return
+
+        bulk_sql = (
+            f"INSERT INTO {table} ({columns})\n"
+            f"            SELECT {', '.join('unnest(?)' for _ in keys)}"
+            + conflict
+        )
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            cur.execute(self._stmt(bulk_sql), [list(col) for col in zip(*batch)])
+
+    def _dedupe_rows(
+        self,
+        table: str,
+        keys: Sequence[str],
+        conflict_cols: Sequence[str],
+        rows: list[tuple],
+    ) -> list[tuple]:
+        """
+        Collapse rows sharing a conflict key to the last one, in first-seen order.
+
+        The end state matches upserting every row in turn, but the engine only
+        resolves each key once.
+        """
+        key_idx = [keys.index(c) for c in conflict_cols]
+        unique = list({tuple(row[i] for i in key_idx): row for row in rows}.values())
+        if len(unique) < len(rows):
+            logger.debug(f"Dropped {len(rows) - len(unique)} duplicate {table} row(s) before upsert")
+        return unique
+
+    def _upsert_via_csv(self, table: str, keys: Sequence[str], conflict: str, rows: list[tuple]) -> None:
+        """
+        Upsert `rows` by writing them to a temporary CSV file and loading it
+        with a single INSERT ... SELECT FROM read_csv(...) plus `conflict`.
+
+        Columns are read as VARCHAR and cast to the table's types on insert,
+        so no type sniffing is involved. None is written as the \\N marker and
+        read back as NULL, keeping empty strings distinct from NULL. A string
+        value equal to \\N would also be read back as NULL, so _bulk_upsert
+        never sends such rows here.
+        """
+        cur = self._cursor()
+        with tempfile.TemporaryDirectory(prefix="bond_lab_stage_") as stage_dir:
+            stage_path = Path(stage_dir) / f"{table}.csv"
+            with open(stage_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(keys)
+                writer.writerows(
+                    [_CSV_NULL if value is None else value for value in row] for row in rows
+                )
+
+            columns = ", ".join(keys)
+            cur.execute(
+                f"INSERT INTO {table} ({columns})\n"
+                f"            SELECT {columns}\n"
+                f"            FROM read_csv(?, header = true, all_varchar = true, nullstr = '{_CSV_NULL}')"
+                + conflict,
+                [str(stage_path)],
+            )
+        logger.info(f"Loaded {len(rows)} rows into {table} via CSV staging")
+
+    def _normalize_records(self, records: list[Any], keys: Sequence[str]) -> list[tuple]:
         """
         Normalize user-facing records (list[dict] or list[sequence]) into
         positional tuples suitable for DuckDB executemany with `?` placeholders.
@@ -212,232 +1476,209 @@ class DatabaseManager:
 
         first = records[0]
         if isinstance(first, dict):
-            return [tuple(r.get(k) for k in keys) for r in records]
+            # The extractor pulls every column in C; records that omit optional
+            # keys raise KeyError and are laid over a None-filled defaults dict
+            # first, so extraction still stays in C.
+            extract = _row_extractor(tuple(keys))
+            try:
+                return list(map(extract, records))
+            except KeyError:
+                defaults = dict.fromkeys(keys)
+                return [extract({**defaults, **r}) for r in records]
         if isinstance(first, Sequence) and not isinstance(first, (str, bytes, bytearray)):
-            return [tuple(r) for r in records]
+            return list(map(tuple, records))
 
         raise TypeError("records must be a list of dicts or sequences")
 
     def _create_gov_yield_curve_table(self):
         """Create government bond yield curve table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS gov_yield_curve (
-            date DATE NOT NULL,
-            tenor_label VARCHAR NOT NULL,
-            tenor_days INTEGER NOT NULL,
-            spot_rate_continuous DOUBLE,
-            par_yield DOUBLE,
-            spot_rate_annual DOUBLE,
-            source VARCHAR NOT NULL,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, tenor_label, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_gov_yield_curve_date ON gov_yield_curve(date);
-        CREATE INDEX IF NOT EXISTS idx_gov_yield_curve_source ON gov_yield_curve(source);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_GOV_YIELD_CURVE_DDL)
         logger.info("Created gov_yield_curve table")
 
     def _create_gov_yield_change_stats_table(self):
         """Create government bond yield change statistics table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS gov_yield_change_stats (
-            date DATE NOT NULL,
-            bucket_label VARCHAR NOT NULL,
-            currency VARCHAR,
-            volume_domestic DOUBLE,
-            volume_foreign DOUBLE,
-            weight_domestic DOUBLE,
-            weight_foreign DOUBLE,
-            yield_min_domestic DOUBLE,
-            yield_max_domestic DOUBLE,
-            yield_min_foreign DOUBLE,
-            yield_max_foreign DOUBLE,
-            source VARCHAR NOT NULL,
-            raw_file VARCHAR,
-            UNIQUE(date, bucket_label, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_yield_change_stats_date ON gov_yield_change_stats(date);
-        CREATE INDEX IF NOT EXISTS idx_yield_change_stats_source ON gov_yield_change_stats(source);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_GOV_YIELD_CHANGE_STATS_DDL)
         logger.info("Created gov_yield_change_stats table")
 
     def _create_interbank_rates_table(self):
         """Create interbank rates table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS interbank_rates (
-            date DATE NOT NULL,
-            tenor_label VARCHAR NOT NULL,
-            rate DOUBLE NOT NULL,
-            source VARCHAR NOT NULL,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, tenor_label, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_interbank_rates_date ON interbank_rates(date);
-        CREATE INDEX IF NOT EXISTS idx_interbank_rates_tenor ON interbank_rates(tenor_label);
-        CREATE INDEX IF NOT EXISTS idx_interbank_rates_source ON interbank_rates(source);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_INTERBANK_RATES_DDL)
         logger.info("Created interbank_rates table")
 
     def _create_ingest_runs_table(self):
         """Create ingestion runs tracking table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS ingest_runs (
-            id INTEGER PRIMARY KEY,
-            provider VARCHAR NOT NULL,
-            start_date DATE,
-            end_date DATE,
-            status VARCHAR NOT NULL,
-            rows_inserted INTEGER DEFAULT 0,
-            error_message TEXT,
-            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            ended_at TIMESTAMP
-        );
+        self.con.execute(_INGEST_RUNS_DDL)
+        # Older databases allocated ids with MAX(id)+1 and never advanced the sequence
+        self._sync_id_sequence("ingest_runs", "ingest_runs_id_seq")
+        logger.info("Created ingest_runs table")
 
-        CREATE SEQUENCE IF NOT EXISTS ingest_runs_id_seq START 1;
+    def _sync_id_sequence(self, table: str, sequence: str) -> None:
         """
+        Advance `sequence` past MAX(id) of `table`.
 
-        self.con.execute(sql)
-        logger.info("Created ingest_runs table")
+        Rows written without the sequence (MAX(id)+1 allocation in older
+        versions, CSV imports) would otherwise collide with its next values.
+        DuckDB has no setval(), so the sequence is recreated at the new start.
+        """
+        cur = self._cursor()
+        max_id = cur.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        row = cur.execute(
+            "SELECT COALESCE(last_value, start_value - 1) FROM duckdb_sequences() WHERE sequence_name = ?",
+            [sequence],
+        ).fetchone()
+        if row is not None and max_id > row[0]:
+            cur.execute(f"CREATE OR REPLACE SEQUENCE {sequence} START {int(max_id) + 1}")
+            logger.info(f"Advanced {sequence} to {int(max_id) + 1}")
+
+    def _insert_returning_id(self, sql: str, params: Sequence[Any], table: str, sequence: str) -> int:
+        """
+        Run a single-row `INSERT ... VALUES (nextval(sequence), ...) RETURNING id`.
 
-    def _create_gov_auction_results_table(self):
-        """Create government auction results table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS gov_auction_results (
-            date DATE NOT NULL,
-            instrument_type VARCHAR NOT NULL,
-            tenor_label VARCHAR NOT NULL,
-            tenor_days INTEGER NOT NULL,
-            amount_offered DOUBLE,
-            amount_sold DOUBLE,
-            bid_to_cover DOUBLE,
-            cut_off_yield DOUBLE,
-            avg_yield DOUBLE,
-            source VARCHAR NOT NULL,
-            raw_file VARCHAR,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, instrument_type, tenor_label, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_gov_auction_results_date ON gov_auction_results(date);
-        CREATE INDEX IF NOT EXISTS idx_gov_auction_results_type ON gov_auction_results(instrument_type);
-        CREATE INDEX IF NOT EXISTS idx_gov_auction_results_source ON gov_auction_results(source);
+        If the id collides with a row written behind the sequence's back, the
+        sequence is resynced with the table once and the insert retried.
         """
+        cur = self._cursor()
+        try:
+            return cur.execute(self._stmt(sql), params).fetchone()[0]
+        except duckdb.ConstraintException:
+            self._sync_id_sequence(table, sequence)
+            return cur.execute(self._stmt(sql), params).fetchone()[0]
 
-        self.con.execute(sql)
+    def _create_gov_auction_results_table(self):
+        """Create government auction results table"""
+        self.con.execute(_GOV_AUCTION_RESULTS_DDL)
         logger.info("Created gov_auction_results table")
 
     def _create_gov_secondary_trading_table(self):
         """Create government secondary trading table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS gov_secondary_trading (
-            date DATE NOT NULL,
-            segment VARCHAR NOT NULL,
-            bucket_label VARCHAR NOT NULL,
-            segment_kind VARCHAR,
-            segment_code VARCHAR,
-            bucket_kind VARCHAR,
-            bucket_code VARCHAR,
-            bucket_display VARCHAR,
-            volume DOUBLE,
-            value DOUBLE,
-            avg_yield DOUBLE,
-            source VARCHAR NOT NULL,
-            raw_file VARCHAR,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, segment, bucket_label, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_date ON gov_secondary_trading(date);
-        CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_segment ON gov_secondary_trading(segment);
-        CREATE INDEX IF NOT EXISTS idx_gov_secondary_trading_source ON gov_secondary_trading(source);
-        """
+        self.con.execute(_GOV_SECONDARY_TRADING_DDL)
+        self._ensure_gov_secondary_trading_columns()
+        logger.info("Created gov_secondary_trading table")
 
-        self.con.execute(sql)
-        self._ensure_table_columns(
-            "gov_secondary_trading",
-            {
-                "segment_kind": "VARCHAR",
-                "segment_code": "VARCHAR",
-                "bucket_kind": "VARCHAR",
-                "bucket_code": "VARCHAR",
-                "bucket_display": "VARCHAR",
-            },
+    def _ensure_gov_secondary_trading_columns(self):
+        """Add segment/bucket columns missing from older gov_secondary_trading tables"""
+        self._apply_migration(
+            "gov_secondary_trading_v2_columns",
+            lambda: self._ensure_table_columns(
+                "gov_secondary_trading",
+                {
+                    "segment_kind": "VARCHAR",
+                    "segment_code": "VARCHAR",
+                    "bucket_kind": "VARCHAR",
+                    "bucket_code": "VARCHAR",
+                    "bucket_display": "VARCHAR",
+                },
+            ),
         )
-        logger.info("Created gov_secondary_trading table")
 
-    def _ensure_table_columns(self, table: str, columns: dict[str, str]) -> None:
+    def _ensure_json_column_types(self):
+        """
+        Retype the TEXT *_json columns of older databases to JSON.
+
+        Each table is its own migration, so a table holding invalid JSON (or
+        failing to convert) is rolled back and retried alone while the others
+        are converted and recorded.
+        """
+        for table in _JSON_COLUMNS:
+            self._apply_migration(
+                f"json_column_types_{table}",
+                lambda table=table: self._convert_json_columns(table),
+            )
+
+    def _convert_json_columns(self, table: str) -> bool:
+        """
+        ALTER the _JSON_COLUMNS columns of `table` still typed TEXT to JSON.
+
+        DuckDB refuses to alter a column while indexes depend on its table, so
+        the table's indexes are read from duckdb_indexes() right before the
+        ALTER, dropped, and recreated from their stored SQL afterwards. Returns
+        False if rows hold values that are not valid JSON (the cast would fail)
+        or on error, so the migration is retried.
+        """
+        try:
+            types = {
+                row[1]: row[2] for row in self.con.execute(f"PRAGMA table_info('{table}')").fetchall()
+            }
+            stale = [col for col in _JSON_COLUMNS[table] if col in types and types[col] != "JSON"]
+            if not stale:
+                return True
+
+            invalid = self.con.execute(
+                f"SELECT count(*) FROM {table} WHERE "
+                + " OR ".join(f"NOT json_valid({col})" for col in stale)
+            ).fetchone()[0]
+            if invalid:
+                logger.warning(f"Keeping TEXT json columns on {table}: {invalid} row(s) hold invalid JSON")
+                return False
+
+            indexes = self.con.execute(
+                "SELECT index_name, sql FROM duckdb_indexes() WHERE table_name = ?", [table]
+            ).fetchall()
+            for index_name, _ in indexes:
+                self.con.execute(f"DROP INDEX {index_name}")
+            for col in stale:
+                self.con.execute(f"ALTER TABLE {table} ALTER COLUMN {col} TYPE JSON")
+            for _, index_sql in indexes:
+                self.con.execute(index_sql)
+        except Exception as e:
+            logger.warning(f"Failed to convert json columns on {table}: {e}")
+            return False
+        return True
+
+    def _drop_unused_status_indexes(self):
+        """
+        Drop the status indexes on notification_events and report_artifacts.
+
+        Nothing filters those tables on status alone, and DuckDB only takes an
+        index scan for a lone equality on the indexed column, so the indexes
+        were never read but were maintained on every insert.
+        """
+        self._apply_migration("drop_unused_status_indexes", self._drop_status_indexes)
+
+    def _drop_status_indexes(self) -> bool:
+        """Drop the unused status indexes; returns False on failure"""
+        try:
+            self.con.execute(
+                """
+                DROP INDEX IF EXISTS idx_notification_events_status;
+                DROP INDEX IF EXISTS idx_report_artifacts_status;
+                """
+            )
+        except Exception as e:
+            logger.warning(f"Failed to drop unused status indexes: {e}")
+            return False
+        return True
+
+    def _ensure_table_columns(self, table: str, columns: dict[str, str]) -> bool:
         """
         Ensure columns exist on a table (lightweight migration).
         DuckDB doesn't support ADD COLUMN IF NOT EXISTS across all versions, so we check first.
+        Missing columns are added in one multi-statement call. Returns False on failure.
         """
         try:
             existing = {
                 row[1] for row in self.con.execute(f"PRAGMA table_info('{table}')").fetchall()
             }
-            for col, col_type in columns.items():
-                if col in existing:
-                    continue
-                self.con.execute(f"ALTER TABLE {table} ADD COLUMN {col} {col_type}")
+            alters = [
+                f"ALTER TABLE {table} ADD COLUMN {col} {col_type}"
+                for col, col_type in columns.items()
+                if col not in existing
+            ]
+            if alters:
+                self.con.execute(";\n".join(alters))
         except Exception as e:
             logger.warning(f"Could not ensure columns for {table}: {e}")
+            return False
+        return True
 
     def _create_policy_rates_table(self):
         """Create policy rates table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS policy_rates (
-            date DATE NOT NULL,
-            rate_name VARCHAR NOT NULL,
-            rate DOUBLE NOT NULL,
-            source VARCHAR NOT NULL,
-            raw_file VARCHAR,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, rate_name, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_policy_rates_date ON policy_rates(date);
-        CREATE INDEX IF NOT EXISTS idx_policy_rates_name ON policy_rates(rate_name);
-        CREATE INDEX IF NOT EXISTS idx_policy_rates_source ON policy_rates(source);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_POLICY_RATES_DDL)
         logger.info("Created policy_rates table")
 
     def _create_bank_rates_table(self):
         """Create bank deposit/loan rates table (imported from Lai_suat or other sources)"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS bank_rates (
-            date DATE NOT NULL,
-            product_group VARCHAR NOT NULL CHECK(product_group IN ('deposit','loan')),
-            series_code VARCHAR NOT NULL,
-            bank_name VARCHAR NOT NULL,
-            term_months INTEGER NOT NULL DEFAULT -1,
-            term_label VARCHAR,
-            rate_min_pct DOUBLE,
-            rate_max_pct DOUBLE,
-            rate_pct DOUBLE,
-            source_url VARCHAR,
-            source_priority INTEGER,
-            scraped_at TIMESTAMP,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source VARCHAR NOT NULL,
-            UNIQUE(date, series_code, bank_name, term_months)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_bank_rates_date ON bank_rates(date);
-        CREATE INDEX IF NOT EXISTS idx_bank_rates_series ON bank_rates(series_code);
-        CREATE INDEX IF NOT EXISTS idx_bank_rates_bank ON bank_rates(bank_name);
-        CREATE INDEX IF NOT EXISTS idx_bank_rates_source ON bank_rates(source);
-        """
-        self.con.execute(sql)
+        self.con.execute(_BANK_RATES_DDL)
         logger.info("Created bank_rates table")
 
     def _create_bank_rates_views(self):
@@ -446,69 +1687,26 @@ class DatabaseManager:
         CREATE OR REPLACE VIEW v_bank_rates_latest AS
         SELECT *
         FROM bank_rates
-        WHERE date = (SELECT MAX(date) FROM bank_rates)
-        ORDER BY product_group, series_code, bank_name, term_months;
+        WHERE date = (SELECT MAX(date) FROM bank_rates);
         """
         self.con.execute(sql)
         logger.info("Created bank_rates views")
 
-    def insert_bank_rates(self, records: list[dict]) -> int:
+    def insert_bank_rates(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert bank rate records with upsert"""
         try:
             if not records:
                 return 0
 
-            sql = """
-            INSERT INTO bank_rates (
-                date,
-                product_group,
-                series_code,
-                bank_name,
-                term_months,
-                term_label,
-                rate_min_pct,
-                rate_max_pct,
-                rate_pct,
-                source_url,
-                source_priority,
-                scraped_at,
-                fetched_at,
-                source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, series_code, bank_name, term_months)
-            DO UPDATE SET
-                product_group = EXCLUDED.product_group,
-                term_label = EXCLUDED.term_label,
-                rate_min_pct = EXCLUDED.rate_min_pct,
-                rate_max_pct = EXCLUDED.rate_max_pct,
-                rate_pct = EXCLUDED.rate_pct,
-                source_url = EXCLUDED.source_url,
-                source_priority = EXCLUDED.source_priority,
-                scraped_at = EXCLUDED.scraped_at,
-                fetched_at = EXCLUDED.fetched_at,
-                source = EXCLUDED.source
-            """
-
-            params = self._normalize_records(
-                records,
-                [
-                    "date",
-                    "product_group",
-                    "series_code",
-                    "bank_name",
-                    "term_months",
-                    "term_label",
-                    "rate_min_pct",
-                    "rate_max_pct",
-                    "rate_pct",
-                    "source_url",
-                    "source_priority",
-                    "scraped_at",
-                    "fetched_at",
-                    "source",
-                ],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _BANK_RATE_COLUMNS)
+            with self._txn():
+                self._bulk_upsert(
+                    "bank_rates",
+                    _BANK_RATE_COLUMNS,
+                    ("date", "series_code", "bank_name", "term_months"),
+                    params,
+                    batch_size=batch_size,
+                )
             count = len(params)
             logger.info(f"Inserted/updated {count} bank rate records")
             return count
@@ -525,47 +1723,32 @@ class DatabaseManager:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
-    ) -> list[dict]:
-        """Get bank rates with optional filters"""
-        try:
-            conditions = []
-            params: list[Any] = []
-
-            if series_code:
-                conditions.append("series_code = ?")
-                params.append(series_code)
-            if bank_name:
-                conditions.append("bank_name = ?")
-                params.append(bank_name)
-            if product_group:
-                conditions.append("product_group = ?")
-                params.append(product_group)
-            if term_months is not None:
-                conditions.append("term_months = ?")
-                params.append(int(term_months))
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT *
-            FROM bank_rates
-            {where_clause}
-            ORDER BY date DESC, product_group, series_code, bank_name, term_months
-            """
-
-            if limit is not None:
-                sql += "\nLIMIT ?"
-                params.append(int(limit))
+        as_frame: bool = False,
+    ) -> Any:
+        """
+        Get bank rates with optional filters
 
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+        With as_frame=True the rows come back as a pandas DataFrame built
+        column-wise by DuckDB, skipping the per-row dict materialization for
+        callers that aggregate or export the result.
+        """
+        cur = self._cursor()
+        try:
+            # One static statement for every filter combination: unset filters
+            # bind NULL and DuckDB folds their `$n IS NULL OR ...` guard away.
+            params = [
+                series_code or None,
+                bank_name or None,
+                product_group or None,
+                int(term_months) if term_months is not None else None,
+                start_date or None,
+                end_date or None,
+                int(limit) if limit is not None else None,
+            ]
+            cur = cur.execute(self._stmt(_SQL_BANK_RATES), params)
+            if as_frame:
+                return cur.df()
+            return _fetch_dicts(cur)
         except Exception as e:
             logger.error(f"Error fetching bank rates: {e}")
             raise
@@ -578,94 +1761,34 @@ class DatabaseManager:
         - Deposit average uses `rate_pct` for the chosen term (default: 12 months).
         - Loan average uses midpoint when min+max exist; else min; else rate_pct.
         """
-        deposit_date = self.con.execute(
-            """
-            SELECT MAX(date)
-            FROM bank_rates
-            WHERE product_group = 'deposit'
-              AND term_months = ?
-              AND rate_pct IS NOT NULL
-            """,
+        cur = self._cursor()
+        # Latest dates and both averages in one statement: one plan, one round trip.
+        deposit_date, loan_date, deposit_avg, loan_avg = cur.execute(
+            self._stmt(_SQL_LATEST_BANK_RATE_AVERAGES),
             [int(deposit_term_months)],
-        ).fetchone()[0]
-        loan_date = self.con.execute(
-            """
-            SELECT MAX(date)
-            FROM bank_rates
-            WHERE product_group = 'loan'
-              AND (rate_min_pct IS NOT NULL OR rate_max_pct IS NOT NULL OR rate_pct IS NOT NULL)
-            """
-        ).fetchone()[0]
+        ).fetchone()
 
         if deposit_date is None and loan_date is None:
             return {"latest_date": None, "deposit_avg_12m": None, "loan_avg": None}
 
-        deposit_avg = self.con.execute(
-            """
-            SELECT AVG(rate_pct) AS v
-            FROM bank_rates
-            WHERE date = ?
-              AND product_group = 'deposit'
-              AND term_months = ?
-              AND rate_pct IS NOT NULL
-            """,
-            [str(deposit_date), int(deposit_term_months)],
-        ).fetchone()[0]
-
-        loan_avg = self.con.execute(
-            """
-            SELECT AVG(
-              CASE
-                WHEN rate_min_pct IS NOT NULL AND rate_max_pct IS NOT NULL THEN (rate_min_pct + rate_max_pct) / 2.0
-                WHEN rate_min_pct IS NOT NULL THEN rate_min_pct
-                WHEN rate_pct IS NOT NULL THEN rate_pct
-                ELSE NULL
-              END
-            ) AS v
-            FROM bank_rates
-            WHERE date = ?
-              AND product_group = 'loan'
-            """,
-            [str(loan_date)],
-        ).fetchone()[0]
-
         return {
-            "latest_date": str(max(d for d in [deposit_date, loan_date] if d is not None)),
+            "latest_date": max(d for d in (deposit_date, loan_date) if d is not None).isoformat(),
             "deposit_avg_12m": float(deposit_avg) if deposit_avg is not None else None,
             "loan_avg": float(loan_avg) if loan_avg is not None else None,
         }
 
-    def insert_yield_curve(self, records: list[dict]) -> int:
+    def insert_yield_curve(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert yield curve records with upsert"""
         try:
-            sql = """
-            INSERT INTO gov_yield_curve (
-                date, tenor_label, tenor_days, spot_rate_continuous,
-                par_yield, spot_rate_annual, source, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, tenor_label, source)
-            DO UPDATE SET
-                tenor_days = EXCLUDED.tenor_days,
-                spot_rate_continuous = EXCLUDED.spot_rate_continuous,
-                par_yield = EXCLUDED.par_yield,
-                spot_rate_annual = EXCLUDED.spot_rate_annual,
-                fetched_at = EXCLUDED.fetched_at
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                [
-                    "date",
-                    "tenor_label",
-                    "tenor_days",
-                    "spot_rate_continuous",
-                    "par_yield",
-                    "spot_rate_annual",
-                    "source",
-                    "fetched_at",
-                ],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _YIELD_CURVE_COLUMNS)
+            with self._txn():
+                delta = self._coverage_delta("gov_yield_curve", params)
+                self._bulk_upsert("gov_yield_curve", _YIELD_CURVE_COLUMNS, ("date", "tenor_label", "source"), params, batch_size=batch_size)
+                self._apply_coverage_delta("gov_yield_curve", delta)
+            invalidate_cache("gov_yield_curve")
             count = len(params)
             logger.info(f"Inserted/updated {count} yield curve records")
             return count
@@ -673,48 +1796,18 @@ class DatabaseManager:
             logger.error(f"Error inserting yield curve records: {e}")
             raise
 
-    def insert_yield_change_stats(self, records: list[dict]) -> int:
+    def insert_yield_change_stats(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert yield change statistics with upsert"""
         try:
-            sql = """
-            INSERT INTO gov_yield_change_stats (
-                date, bucket_label, currency, volume_domestic, volume_foreign,
-                weight_domestic, weight_foreign, yield_min_domestic, yield_max_domestic,
-                yield_min_foreign, yield_max_foreign, source, raw_file
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, bucket_label, source)
-            DO UPDATE SET
-                currency = EXCLUDED.currency,
-                volume_domestic = EXCLUDED.volume_domestic,
-                volume_foreign = EXCLUDED.volume_foreign,
-                weight_domestic = EXCLUDED.weight_domestic,
-                weight_foreign = EXCLUDED.weight_foreign,
-                yield_min_domestic = EXCLUDED.yield_min_domestic,
-                yield_max_domestic = EXCLUDED.yield_max_domestic,
-                yield_min_foreign = EXCLUDED.yield_min_foreign,
-                yield_max_foreign = EXCLUDED.yield_max_foreign,
-                raw_file = EXCLUDED.raw_file
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                [
-                    "date",
-                    "bucket_label",
-                    "currency",
-                    "volume_domestic",
-                    "volume_foreign",
-                    "weight_domestic",
-                    "weight_foreign",
-                    "yield_min_domestic",
-                    "yield_max_domestic",
-                    "yield_min_foreign",
-                    "yield_max_foreign",
-                    "source",
-                    "raw_file",
-                ],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _YIELD_CHANGE_STATS_COLUMNS)
+            with self._txn():
+                delta = self._coverage_delta("gov_yield_change_stats", params)
+                self._bulk_upsert("gov_yield_change_stats", _YIELD_CHANGE_STATS_COLUMNS, ("date", "bucket_label", "source"), params, batch_size=batch_size)
+                self._apply_coverage_delta("gov_yield_change_stats", delta)
+            invalidate_cache("gov_yield_change_stats")
             count = len(params)
             logger.info(f"Inserted/updated {count} yield change stats records")
             return count
@@ -722,23 +1815,18 @@ class DatabaseManager:
             logger.error(f"Error inserting yield change stats: {e}")
             raise
 
-    def insert_interbank_rates(self, records: list[dict]) -> int:
+    def insert_interbank_rates(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert interbank rate records with upsert"""
         try:
-            sql = """
-            INSERT INTO interbank_rates (date, tenor_label, rate, source, fetched_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT (date, tenor_label, source)
-            DO UPDATE SET
-                rate = EXCLUDED.rate,
-                fetched_at = EXCLUDED.fetched_at
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                ["date", "tenor_label", "rate", "source", "fetched_at"],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _INTERBANK_RATE_COLUMNS)
+            with self._txn():
+                delta = self._coverage_delta("interbank_rates", params)
+                self._bulk_upsert("interbank_rates", _INTERBANK_RATE_COLUMNS, ("date", "tenor_label", "source"), params, batch_size=batch_size)
+                self._apply_coverage_delta("interbank_rates", delta)
+            invalidate_cache("interbank_rates")
             count = len(params)
             logger.info(f"Inserted/updated {count} interbank rate records")
             return count
@@ -757,29 +1845,25 @@ class DatabaseManager:
     ) -> int:
         """Log an ingestion run"""
         try:
-            # DuckDB sequences can be transactional and may reuse values after rollbacks.
-            # Use MAX(id)+1 to avoid duplicate PKs during long backfills.
-            run_id = self.con.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM ingest_runs").fetchone()[0]
-
             sql = """
             INSERT INTO ingest_runs (
                 id, provider, start_date, end_date, status,
                 rows_inserted, error_message, started_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (nextval('ingest_runs_id_seq'), ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
-            self.con.execute(sql, (
-                run_id, provider, start_date, end_date, status,
+            return self._insert_returning_id(sql, (
+                provider, start_date, end_date, status,
                 rows_inserted, error_message, datetime.now()
-            ))
-
-            return run_id
+            ), "ingest_runs", "ingest_runs_id_seq")
         except Exception as e:
             logger.error(f"Error logging ingest run: {e}")
             raise
 
     def update_ingest_run(self, run_id: int, status: str, rows_inserted: int = 0, error_message: Optional[str] = None):
         """Update an ingestion run with completion status"""
+        cur = self._cursor()
         try:
             sql = """
             UPDATE ingest_runs
@@ -787,7 +1871,7 @@ class DatabaseManager:
             WHERE id = ?
             """
 
-            self.con.execute(sql, (status, rows_inserted, error_message, datetime.now(), run_id))
+            cur.execute(self._stmt(sql), (status, rows_inserted, error_message, datetime.now(), run_id))
         except Exception as e:
             logger.error(f"Error updating ingest run: {e}")
             raise
@@ -804,25 +1888,21 @@ class DatabaseManager:
         Insert a synthetic ingest run record (used by monitoring/tests).
         """
         try:
-            if isinstance(started_at, str):
-                started_at_dt = datetime.fromisoformat(started_at)
-            else:
-                started_at_dt = started_at
+            started_at_dt = _to_datetime(started_at)
 
-            run_id = self.con.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM ingest_runs").fetchone()[0]
             ended_at = started_at_dt + timedelta(seconds=float(duration_seconds))
 
             sql = """
             INSERT INTO ingest_runs (
                 id, provider, start_date, end_date, status,
                 rows_inserted, error_message, started_at, ended_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (nextval('ingest_runs_id_seq'), ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
-            self.con.execute(
+            return self._insert_returning_id(
                 sql,
                 (
-                    run_id,
                     provider,
                     None,
                     None,
@@ -832,8 +1912,9 @@ class DatabaseManager:
                     started_at_dt,
                     ended_at,
                 ),
+                "ingest_runs",
+                "ingest_runs_id_seq",
             )
-            return run_id
         except Exception as e:
             logger.error(f"Error inserting ingest run: {e}")
             raise
@@ -851,26 +1932,23 @@ class DatabaseManager:
         """
         Insert a data quality run record (used by monitoring/tests).
         """
+        cur = self._cursor()
         try:
-            if isinstance(run_at, str):
-                run_at_dt = datetime.fromisoformat(run_at)
-            else:
-                run_at_dt = run_at
+            run_at_dt = _to_datetime(run_at)
 
-            run_id = self.con.execute("SELECT nextval('dq_runs_id_seq')").fetchone()[0]
             target = target_date or run_at_dt.date()
 
             sql = """
             INSERT INTO dq_runs (
                 id, run_at, target_date, status,
                 total_rules, passed_rules, failed_rules, summary_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (nextval('dq_runs_id_seq'), ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
-            self.con.execute(
-                sql,
+            (run_id,) = cur.execute(
+                self._stmt(sql),
                 (
-                    run_id,
                     run_at_dt,
                     target,
                     status,
@@ -879,7 +1957,7 @@ class DatabaseManager:
                     int(failed_rules),
                     summary_json,
                 ),
-            )
+            ).fetchone()
             return run_id
         except Exception as e:
             logger.error(f"Error inserting DQ run: {e}")
@@ -887,66 +1965,50 @@ class DatabaseManager:
 
     def get_latest_yield_curve(self, date: Optional[str] = None) -> list[dict]:
         """Get yield curve for a specific date or latest available"""
+        cur = self._cursor()
         try:
             if date:
-                target_date_expr = "?"
+                target_sql = "SELECT CAST(? AS DATE) AS d"
                 params = [date]
             else:
-                # Prefer the official HNX curve date for "latest" UI views.
-                target_date_expr = """
-                COALESCE(
-                  (SELECT MAX(date) FROM gov_yield_curve WHERE source IN ('HNX_YC','HNX')),
-                  (SELECT MAX(date) FROM gov_yield_curve)
-                )
+                # Prefer the official HNX curve date for "latest" UI views; both
+                # candidates come out of a single scan.
+                target_sql = """
+                SELECT COALESCE(
+                  MAX(date) FILTER (WHERE source IN ('HNX_YC','HNX')),
+                  MAX(date)
+                ) AS d
+                FROM gov_yield_curve
                 """
                 params = []
 
             # Prefer the official HNX yield curve when available; fall back to ABO.
             sql = f"""
-            WITH base AS (
-              SELECT *
-              FROM gov_yield_curve
-              WHERE date = {target_date_expr}
-            ),
-            ranked AS (
-              SELECT
-                date,
-                tenor_label,
-                tenor_days,
-                spot_rate_continuous,
-                par_yield,
-                spot_rate_annual,
-                source,
-                fetched_at,
-                ROW_NUMBER() OVER (
-                  PARTITION BY tenor_label
-                  ORDER BY
-                    CASE
-                      WHEN source IN ('HNX_YC','HNX') THEN 1
-                      WHEN source = 'ABO' THEN 2
-                      ELSE 9
-                    END ASC,
-                    fetched_at DESC
-                ) AS rn
-              FROM base
-            )
+            WITH target AS ({target_sql})
             SELECT
-              date,
-              tenor_label,
-              tenor_days,
-              spot_rate_continuous,
-              par_yield,
-              spot_rate_annual,
-              source,
-              fetched_at
-            FROM ranked
-            WHERE rn = 1
-            ORDER BY tenor_days
+              g.date,
+              g.tenor_label,
+              g.tenor_days,
+              g.spot_rate_continuous,
+              g.par_yield,
+              g.spot_rate_annual,
+              g.source,
+              g.fetched_at
+            FROM gov_yield_curve g, target
+            WHERE g.date = target.d
+            QUALIFY ROW_NUMBER() OVER (
+              PARTITION BY g.tenor_label
+              ORDER BY
+                CASE
+                  WHEN g.source IN ('HNX_YC','HNX') THEN 1
+                  WHEN g.source = 'ABO' THEN 2
+                  ELSE 9
+                END ASC,
+                g.fetched_at DESC
+            ) = 1
+            ORDER BY g.tenor_days
             """
-            result = self.con.execute(sql, params).fetchall()
-
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(sql, params))
         except Exception as e:
             logger.error(f"Error fetching yield curve: {e}")
             raise
@@ -964,109 +2026,26 @@ class DatabaseManager:
         - Canonicalizes per (date, tenor_label): SBV > ABO > others, then newest fetched_at.
         - This avoids duplicates across providers when serving timeseries to the UI.
         """
+        cur = self._cursor()
         try:
-            conditions = []
-            params = []
-
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-            if tenor:
-                conditions.append("tenor_label = ?")
-                params.append(tenor)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            WITH base AS (
-              SELECT
-                date,
-                tenor_label,
-                rate,
-                source,
-                fetched_at
-              FROM interbank_rates
-              {where_clause}
-            ),
-            ranked AS (
-              SELECT
-                date,
-                tenor_label,
-                rate,
-                source,
-                fetched_at,
-                ROW_NUMBER() OVER (
-                  PARTITION BY date, tenor_label
-                  ORDER BY
-                    CASE
-                      WHEN source = 'SBV' THEN 1
-                      WHEN source = 'ABO' THEN 2
-                      ELSE 9
-                    END ASC,
-                    fetched_at DESC
-                ) AS rn
-              FROM base
-            )
-            SELECT
-              date,
-              tenor_label,
-              rate,
-              source,
-              fetched_at
-            FROM ranked
-            WHERE rn = 1
-            ORDER BY date DESC, tenor_label
-            """
-
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            params = [start_date or None, end_date or None, tenor or None]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_INTERBANK_RATES), params), _INTERBANK_RATE_COLUMNS)
         except Exception as e:
             logger.error(f"Error fetching interbank rates: {e}")
             raise
 
-    def insert_auction_results(self, records: list[dict]) -> int:
+    def insert_auction_results(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert auction result records with upsert"""
         try:
-            sql = """
-            INSERT INTO gov_auction_results (
-                date, instrument_type, tenor_label, tenor_days,
-                amount_offered, amount_sold, bid_to_cover, cut_off_yield,
-                avg_yield, source, raw_file, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, instrument_type, tenor_label, source)
-            DO UPDATE SET
-                tenor_days = EXCLUDED.tenor_days,
-                amount_offered = EXCLUDED.amount_offered,
-                amount_sold = EXCLUDED.amount_sold,
-                bid_to_cover = EXCLUDED.bid_to_cover,
-                cut_off_yield = EXCLUDED.cut_off_yield,
-                avg_yield = EXCLUDED.avg_yield,
-                raw_file = EXCLUDED.raw_file,
-                fetched_at = EXCLUDED.fetched_at
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                [
-                    "date",
-                    "instrument_type",
-                    "tenor_label",
-                    "tenor_days",
-                    "amount_offered",
-                    "amount_sold",
-                    "bid_to_cover",
-                    "cut_off_yield",
-                    "avg_yield",
-                    "source",
-                    "raw_file",
-                    "fetched_at",
-                ],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _AUCTION_RESULT_COLUMNS)
+            with self._txn():
+                delta = self._coverage_delta("gov_auction_results", params)
+                self._bulk_upsert("gov_auction_results", _AUCTION_RESULT_COLUMNS, ("date", "instrument_type", "tenor_label", "source"), params, batch_size=batch_size)
+                self._apply_coverage_delta("gov_auction_results", delta)
+            invalidate_cache("gov_auction_results")
             count = len(params)
             logger.info(f"Inserted/updated {count} auction result records")
             return count
@@ -1074,50 +2053,18 @@ class DatabaseManager:
             logger.error(f"Error inserting auction results: {e}")
             raise
 
-    def insert_secondary_trading(self, records: list[dict]) -> int:
+    def insert_secondary_trading(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert secondary trading records with upsert"""
         try:
-            sql = """
-            INSERT INTO gov_secondary_trading (
-                date, segment, bucket_label,
-                segment_kind, segment_code, bucket_kind, bucket_code, bucket_display,
-                volume, value,
-                avg_yield, source, raw_file, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, segment, bucket_label, source)
-            DO UPDATE SET
-                segment_kind = EXCLUDED.segment_kind,
-                segment_code = EXCLUDED.segment_code,
-                bucket_kind = EXCLUDED.bucket_kind,
-                bucket_code = EXCLUDED.bucket_code,
-                bucket_display = EXCLUDED.bucket_display,
-                volume = EXCLUDED.volume,
-                value = EXCLUDED.value,
-                avg_yield = EXCLUDED.avg_yield,
-                raw_file = EXCLUDED.raw_file,
-                fetched_at = EXCLUDED.fetched_at
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                [
-                    "date",
-                    "segment",
-                    "bucket_label",
-                    "segment_kind",
-                    "segment_code",
-                    "bucket_kind",
-                    "bucket_code",
-                    "bucket_display",
-                    "volume",
-                    "value",
-                    "avg_yield",
-                    "source",
-                    "raw_file",
-                    "fetched_at",
-                ],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _SECONDARY_TRADING_COLUMNS)
+            with self._txn():
+                delta = self._coverage_delta("gov_secondary_trading", params)
+                self._bulk_upsert("gov_secondary_trading", _SECONDARY_TRADING_COLUMNS, ("date", "segment", "bucket_label", "source"), params, batch_size=batch_size)
+                self._apply_coverage_delta("gov_secondary_trading", delta)
+            invalidate_cache("gov_secondary_trading")
             count = len(params)
             logger.info(f"Inserted/updated {count} secondary trading records")
             return count
@@ -1127,7 +2074,11 @@ class DatabaseManager:
 
     def insert_policy_rates(self, records: list[dict]) -> int:
         """Insert policy rate records with upsert"""
+        cur = self._cursor()
         try:
+            if not records:
+                return 0
+
             sql = """
             INSERT INTO policy_rates (
                 date, rate_name, rate, source, raw_file, fetched_at
@@ -1139,11 +2090,13 @@ class DatabaseManager:
                 fetched_at = EXCLUDED.fetched_at
             """
 
-            params = self._normalize_records(
-                records,
-                ["date", "rate_name", "rate", "source", "raw_file", "fetched_at"],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _POLICY_RATE_COLUMNS)
+            rows = self._dedupe_rows("policy_rates", _POLICY_RATE_COLUMNS, ("date", "rate_name", "source"), params)
+            with self._txn():
+                delta = self._coverage_delta("policy_rates", rows)
+                cur.executemany(self._stmt(sql), rows)
+                self._apply_coverage_delta("policy_rates", delta)
+            invalidate_cache("policy_rates")
             count = len(params)
             logger.info(f"Inserted/updated {count} policy rate records")
             return count
@@ -1153,27 +2106,9 @@ class DatabaseManager:
 
     def _create_ingest_failures_table(self):
         """Create ingestion failures tracking table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS ingest_failures (
-            id INTEGER PRIMARY KEY,
-            dataset_id VARCHAR NOT NULL,
-            provider VARCHAR NOT NULL,
-            start_date DATE NOT NULL,
-            end_date DATE NOT NULL,
-            error_type VARCHAR NOT NULL,
-            error_message TEXT,
-            raw_ref VARCHAR,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_ingest_failures_dataset ON ingest_failures(dataset_id);
-        CREATE INDEX IF NOT EXISTS idx_ingest_failures_provider ON ingest_failures(provider);
-        CREATE INDEX IF NOT EXISTS idx_ingest_failures_created_at ON ingest_failures(created_at);
-
-        CREATE SEQUENCE IF NOT EXISTS ingest_failures_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_INGEST_FAILURES_DDL)
+        # Older databases allocated ids with MAX(id)+1 and never advanced the sequence
+        self._sync_id_sequence("ingest_failures", "ingest_failures_id_seq")
         logger.info("Created ingest_failures table")
 
     def log_ingest_failure(
@@ -1185,144 +2120,106 @@ class DatabaseManager:
         error_type: str,
         error_message: str,
         raw_ref: Optional[str] = None
-    ):
-        """Log an ingestion failure"""
+    ) -> int:
+        """Log an ingestion failure and return its id"""
         try:
-            run_id = self.con.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM ingest_failures").fetchone()[0]
-
             sql = """
             INSERT INTO ingest_failures (
                 id, dataset_id, provider, start_date, end_date,
                 error_type, error_message, raw_ref
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (nextval('ingest_failures_id_seq'), ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
-            self.con.execute(sql, (
-                run_id, dataset_id, provider, start_date, end_date,
+            failure_id = self._insert_returning_id(sql, (
+                dataset_id, provider, start_date, end_date,
                 error_type, error_message, raw_ref
-            ))
+            ), "ingest_failures", "ingest_failures_id_seq")
 
             logger.info(f"Logged ingest failure for {dataset_id}: {error_type}")
-
+            return failure_id
         except Exception as e:
             logger.error(f"Error logging ingest failure: {e}")
             raise
 
     def get_ingest_failures(self, limit: int = 100) -> list[dict]:
         """Get recent ingestion failures"""
+        cur = self._cursor()
         try:
-            sql = """
-            SELECT * FROM ingest_failures
-            ORDER BY created_at DESC
-            LIMIT ?
-            """
-
-            result = self.con.execute(sql, [limit]).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_INGEST_FAILURES), [limit]), _INGEST_FAILURE_COLUMNS)
         except Exception as e:
             logger.error(f"Error fetching ingest failures: {e}")
             raise
 
     def get_pending_resumes(self, dataset_id: Optional[str] = None) -> list[dict]:
         """Get failed chunks that can be resumed"""
+        cur = self._cursor()
         try:
-            if dataset_id:
-                sql = """
-                SELECT DISTINCT provider, start_date, end_date, COUNT(*) as fail_count
-                FROM ingest_failures
-                WHERE dataset_id = ?
-                GROUP BY provider, start_date, end_date
-                ORDER BY start_date DESC
-                """
-                result = self.con.execute(sql, [dataset_id]).fetchall()
-            else:
-                sql = """
-                SELECT DISTINCT dataset_id, provider, start_date, end_date, COUNT(*) as fail_count
-                FROM ingest_failures
-                GROUP BY dataset_id, provider, start_date, end_date
-                ORDER BY start_date DESC
-                """
-                result = self.con.execute(sql).fetchall()
-
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_PENDING_RESUMES), [dataset_id or None]))
         except Exception as e:
             logger.error(f"Error fetching pending resumes: {e}")
             raise
 
     def get_ingest_runs(self, limit: int = 100) -> list[dict]:
         """Get recent ingestion runs"""
+        cur = self._cursor()
         try:
-            sql = """
-            SELECT * FROM ingest_runs
-            ORDER BY started_at DESC
-            LIMIT ?
-            """
-
-            result = self.con.execute(sql, [limit]).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_INGEST_RUNS), [limit]), _INGEST_RUN_COLUMNS)
         except Exception as e:
             logger.error(f"Error fetching ingest runs: {e}")
             raise
 
     def _create_transmission_daily_metrics_table(self):
         """Create transmission daily metrics table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS transmission_daily_metrics (
-            date DATE NOT NULL,
-            metric_name VARCHAR NOT NULL,
-            metric_value DOUBLE,
-            metric_value_text TEXT,
-            source_components TEXT,
-            computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, metric_name)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_transmission_metrics_date ON transmission_daily_metrics(date);
-        CREATE INDEX IF NOT EXISTS idx_transmission_metrics_name ON transmission_daily_metrics(metric_name);
-        CREATE INDEX IF NOT EXISTS idx_transmission_metrics_computed_at ON transmission_daily_metrics(computed_at);
-        """
+        self.con.execute(_TRANSMISSION_DAILY_METRICS_DDL)
+        self._ensure_transmission_daily_metrics_columns()
+        logger.info("Created transmission_daily_metrics table")
 
-        self.con.execute(sql)
-        self._ensure_table_columns(
-            "transmission_daily_metrics",
-            {
-                "metric_value_text": "TEXT",
-            },
+    def _ensure_transmission_daily_metrics_columns(self):
+        """Add metric_value_text to older transmission_daily_metrics tables"""
+        self._apply_migration(
+            "transmission_daily_metrics_v2_columns",
+            lambda: self._ensure_table_columns(
+                "transmission_daily_metrics",
+                {
+                    "metric_value_text": "TEXT",
+                },
+            ),
         )
-        logger.info("Created transmission_daily_metrics table")
+
+    def _ensure_notification_events_channel_type(self):
+        """Add and backfill channel_type on older notification_events tables"""
+        self._apply_migration("notification_events_channel_type", self._add_notification_events_channel_type)
+
+    def _add_notification_events_channel_type(self) -> bool:
+        """Add the denormalized channel_type column and fill it from notification_channels"""
+        if not self._ensure_table_columns("notification_events", {"channel_type": "VARCHAR"}):
+            return False
+        try:
+            self.con.execute(
+                """
+                UPDATE notification_events AS ne
+                SET channel_type = nc.channel_type
+                FROM notification_channels AS nc
+                WHERE nc.id = ne.channel_id AND ne.channel_type IS NULL
+                """
+            )
+        except Exception as e:
+            logger.warning(f"Failed to backfill notification event channel types: {e}")
+            return False
+        return True
 
     def _create_transmission_alerts_table(self):
         """Create transmission alerts table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS transmission_alerts (
-            id INTEGER PRIMARY KEY,
-            date DATE NOT NULL,
-            alert_type VARCHAR NOT NULL,
-            severity VARCHAR NOT NULL,
-            message TEXT,
-            metric_value DOUBLE,
-            threshold DOUBLE,
-            source_data TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_transmission_alerts_date ON transmission_alerts(date);
-        CREATE INDEX IF NOT EXISTS idx_transmission_alerts_type ON transmission_alerts(alert_type);
-        CREATE INDEX IF NOT EXISTS idx_transmission_alerts_severity ON transmission_alerts(severity);
-        CREATE INDEX IF NOT EXISTS idx_transmission_alerts_created_at ON transmission_alerts(created_at);
-
-        CREATE SEQUENCE IF NOT EXISTS transmission_alerts_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_TRANSMISSION_ALERTS_DDL)
         logger.info("Created transmission_alerts table")
 
     def _create_transmission_views(self):
         """Create transmission analytics views"""
         sql = """
+        -- Views are left unordered so a read that does not need order skips
+        -- the sort; callers add ORDER BY.
+
         -- Latest metrics view
         CREATE OR REPLACE VIEW v_transmission_latest AS
         SELECT
@@ -1333,8 +2230,7 @@ class DatabaseManager:
             source_components,
             computed_at
         FROM transmission_daily_metrics
-        WHERE date = (SELECT MAX(date) FROM transmission_daily_metrics)
-        ORDER BY metric_name;
+        WHERE date = (SELECT MAX(date) FROM transmission_daily_metrics);
 
         -- Time series view
         CREATE OR REPLACE VIEW v_transmission_timeseries AS
@@ -1344,8 +2240,7 @@ class DatabaseManager:
             metric_value,
             metric_value_text,
             computed_at
-        FROM transmission_daily_metrics
-        ORDER BY metric_name, date;
+        FROM transmission_daily_metrics;
         """
 
         self.con.execute(sql)
@@ -1353,23 +2248,13 @@ class DatabaseManager:
 
     def insert_transmission_metrics(self, date: str, metrics: dict) -> int:
         """Insert transmission metrics for a specific date"""
+        cur = self._cursor()
         try:
-            import json
-
             records = []
             for metric_name, metric_data in metrics.items():
-                value_text = None
-                if isinstance(metric_data, dict):
-                    value = metric_data.get('value')
-                    value_text = metric_data.get('value_text')
-                    source_components = json.dumps(metric_data.get('sources', {}))
-                elif isinstance(metric_data, str):
-                    value = None
-                    value_text = metric_data
-                    source_components = '{}'
-                else:
-                    value = metric_data
-                    source_components = '{}'
+                value, value_text, source_components = _METRIC_EXTRACTORS.get(
+                    type(metric_data), _metric_from_value
+                )(metric_data)
 
                 if value is not None and not isinstance(value, (int, float)):
                     continue
@@ -1383,6 +2268,8 @@ class DatabaseManager:
                     value_text,
                     source_components
                 ))
+            if not records:
+                return 0
 
             sql = """
             INSERT INTO transmission_daily_metrics (date, metric_name, metric_value, metric_value_text, source_components)
@@ -1394,7 +2281,8 @@ class DatabaseManager:
                 source_components = EXCLUDED.source_components
             """
 
-            self.con.executemany(sql, records)
+            with self._txn():
+                cur.executemany(self._stmt(sql), records)
             count = len(records)
             logger.info(f"Inserted/updated {count} transmission metrics for {date}")
             return count
@@ -1404,52 +2292,34 @@ class DatabaseManager:
 
     def insert_transmission_alerts(self, date: str, alerts: list[dict]) -> int:
         """Insert transmission alerts for a specific date"""
+        cur = self._cursor()
         try:
-            import json
-
             if not alerts:
                 return 0
 
-            core_types = {
-                "ALERT_TRANSMISSION_TIGHTENING",
-                "ALERT_TRANSMISSION_JUMP",
-                "ALERT_LIQUIDITY_SPIKE",
-                "ALERT_CURVE_BEAR_STEEPEN",
-                "ALERT_AUCTION_WEAK",
-                "ALERT_TURNOVER_DROP",
-                "ALERT_POLICY_CHANGE",
-                "ALERT_TRANSMISSION_HIGH",
-                "ALERT_STRESS_HIGH",
-            }
-
             # Replace semantics:
             # - If this insert is for "core transmission alerts", we delete the entire core set for the day,
             #   so stale alerts that no longer trigger get removed (fixes duplicated / wrong historical alerts).
             # - Otherwise (e.g., stress/global alerts), delete only the incoming types.
             incoming_types = {a.get("alert_type") for a in alerts if a.get("alert_type")}
-            replace_types = core_types if incoming_types and incoming_types.issubset(core_types) else incoming_types
-
-            if replace_types:
-                placeholders = ",".join(["?"] * len(replace_types))
-                self.con.execute(
-                    f"DELETE FROM transmission_alerts WHERE date = ? AND alert_type IN ({placeholders})",
-                    [date, *sorted(replace_types)],
-                )
-
-            records = []
-            for alert in alerts:
-                alert_id = self.con.execute("SELECT nextval('transmission_alerts_id_seq')").fetchone()[0]
+            replace_types = (
+                _CORE_TRANSMISSION_ALERT_TYPES
+                if incoming_types and incoming_types <= _CORE_TRANSMISSION_ALERT_TYPES
+                else incoming_types
+            )
 
-                records.append((
-                    alert_id,
+            records = [
+                (
                     date,
                     alert['alert_type'],
                     alert['severity'],
                     alert['message'],
                     alert.get('metric_value'),
                     alert.get('threshold'),
-                    json.dumps(alert.get('source_data', {}))
-                ))
+                    _encode_compact_json(alert.get('source_data', {})),
+                )
+                for alert in alerts
+            ]
 
             sql = """
             INSERT INTO transmission_alerts (
@@ -1458,7 +2328,25 @@ class DatabaseManager:
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """
 
-            self.con.executemany(sql, records)
+            # Allocate ids, delete and re-insert in one transaction: readers never
+            # see the day with its alerts removed but not yet replaced, and a
+            # failure midway leaves the previous alerts in place.
+            with self._txn():
+                # One round-trip for the whole id range instead of a nextval per alert
+                alert_ids = cur.execute(
+                    self._stmt("SELECT nextval('transmission_alerts_id_seq') FROM range(?)"),
+                    [len(records)],
+                ).fetchall()
+                if replace_types:
+                    placeholders = ",".join(["?"] * len(replace_types))
+                    cur.execute(
+                        f"DELETE FROM transmission_alerts WHERE date = ? AND alert_type IN ({placeholders})",
+                        [date, *sorted(replace_types)],
+                    )
+                cur.executemany(
+                    self._stmt(sql),
+                    [(alert_id, *record) for (alert_id,), record in zip(alert_ids, records)],
+                )
             count = len(records)
             logger.info(f"Inserted {count} transmission alerts for {date}")
             return count
@@ -1472,37 +2360,26 @@ class DatabaseManager:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
-    ) -> list[dict]:
-        """Get transmission metrics with optional filters"""
-        try:
-            conditions = []
-            params = []
-
-            if metric_name:
-                conditions.append("metric_name = ?")
-                params.append(metric_name)
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM transmission_daily_metrics
-            {where_clause}
-            ORDER BY date DESC, metric_name
-            """
-
-            if limit is not None:
-                sql += "\nLIMIT ?"
-                params.append(int(limit))
+        as_tuples: bool = False,
+    ) -> list:
+        """
+        Get transmission metrics with optional filters
 
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+        With as_tuples=True rows are named tuples (row.metric_value) rather
+        than dicts, for callers that scan long histories for a field or two.
+        """
+        cur = self._cursor()
+        try:
+            params = [
+                metric_name or None,
+                start_date or None,
+                end_date or None,
+                None if limit is None else int(limit),
+            ]
+            cur = cur.execute(self._stmt(_SQL_TRANSMISSION_METRICS), params)
+            if as_tuples:
+                return _fetch_records(cur, _TRANSMISSION_METRIC_COLUMNS)
+            return _fetch_dicts(cur, _TRANSMISSION_METRIC_COLUMNS)
         except Exception as e:
             logger.error(f"Error fetching transmission metrics: {e}")
             raise
@@ -1515,77 +2392,30 @@ class DatabaseManager:
         limit: int = 100
     ) -> list[dict]:
         """Get transmission alerts with optional filters"""
+        cur = self._cursor()
         try:
-            conditions = []
-            params = []
-
-            if alert_type:
-                conditions.append("alert_type = ?")
-                params.append(alert_type)
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM transmission_alerts
-            {where_clause}
-            ORDER BY date DESC, created_at DESC
-            LIMIT ?
-            """
-
-            params.append(limit)
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            params = [alert_type or None, start_date or None, end_date or None, limit]
+            return _fetch_dicts(
+                cur.execute(self._stmt(_SQL_TRANSMISSION_ALERTS), params), _TRANSMISSION_ALERT_COLUMNS
+            )
         except Exception as e:
             logger.error(f"Error fetching transmission alerts: {e}")
             raise
 
-    def _create_global_rates_daily_table(self):
-        """Create global rates daily table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS global_rates_daily (
-            date DATE NOT NULL,
-            series_id VARCHAR NOT NULL,
-            series_name VARCHAR NOT NULL,
-            value DOUBLE,
-            source VARCHAR NOT NULL,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, series_id, source)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_global_rates_date ON global_rates_daily(date);
-        CREATE INDEX IF NOT EXISTS idx_global_rates_series ON global_rates_daily(series_id);
-        CREATE INDEX IF NOT EXISTS idx_global_rates_source ON global_rates_daily(source);
-        """
-
-        self.con.execute(sql)
+    def _create_global_rates_daily_table(self):
+        """Create global rates daily table"""
+        self.con.execute(_GLOBAL_RATES_DAILY_DDL)
         logger.info("Created global_rates_daily table")
 
-    def insert_global_rates(self, records: list[dict]) -> int:
+    def insert_global_rates(self, records: list[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
         """Insert global rate records with upsert"""
         try:
-            sql = """
-            INSERT INTO global_rates_daily (
-                date, series_id, series_name, value, source, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date, series_id, source)
-            DO UPDATE SET
-                series_name = EXCLUDED.series_name,
-                value = EXCLUDED.value,
-                fetched_at = EXCLUDED.fetched_at
-            """
+            if not records:
+                return 0
 
-            params = self._normalize_records(
-                records,
-                ["date", "series_id", "series_name", "value", "source", "fetched_at"],
-            )
-            self.con.executemany(sql, params)
+            params = self._normalize_records(records, _GLOBAL_RATE_COLUMNS)
+            with self._txn():
+                self._bulk_upsert("global_rates_daily", _GLOBAL_RATE_COLUMNS, ("date", "series_id", "source"), params, batch_size=batch_size)
             count = len(params)
             logger.info(f"Inserted/updated {count} global rate records")
             return count
@@ -1601,55 +2431,22 @@ class DatabaseManager:
         limit: Optional[int] = None,
     ) -> list[dict]:
         """Get global rates with optional filters"""
+        cur = self._cursor()
         try:
-            conditions = []
-            params = []
-
-            if series_id:
-                conditions.append("series_id = ?")
-                params.append(series_id)
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM global_rates_daily
-            {where_clause}
-            ORDER BY date DESC, series_id
-            """
-
-            if limit is not None:
-                sql += "\nLIMIT ?"
-                params.append(int(limit))
-
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            params = [
+                series_id or None,
+                start_date or None,
+                end_date or None,
+                None if limit is None else int(limit),
+            ]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_GLOBAL_RATES), params), _GLOBAL_RATE_COLUMNS)
         except Exception as e:
             logger.error(f"Error fetching global rates: {e}")
             raise
 
     def _create_bondy_stress_daily_table(self):
         """Create BondY stress daily table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS bondy_stress_daily (
-            date DATE NOT NULL UNIQUE,
-            stress_index DOUBLE,
-            regime_bucket VARCHAR,
-            driver_json TEXT,
-            computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_bondy_stress_date ON bondy_stress_daily(date);
-        CREATE INDEX IF NOT EXISTS idx_bondy_stress_bucket ON bondy_stress_daily(regime_bucket);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_BONDY_STRESS_DAILY_DDL)
         logger.info("Created bondy_stress_daily table")
 
     def insert_bondy_stress(
@@ -1660,6 +2457,7 @@ class DatabaseManager:
         driver_json: str
     ) -> int:
         """Insert BondY stress record"""
+        cur = self._cursor()
         try:
             sql = """
             INSERT INTO bondy_stress_daily (date, stress_index, regime_bucket, driver_json)
@@ -1672,54 +2470,52 @@ class DatabaseManager:
                 computed_at = get_current_timestamp()
             """
 
-            self.con.execute(sql, (date, stress_index, regime_bucket, driver_json))
+            cur.execute(self._stmt(sql), (date, stress_index, regime_bucket, driver_json))
+            invalidate_cache("bondy_stress_daily")
             logger.info(f"Inserted/updated BondY stress for {date}")
             return 1
         except Exception as e:
             logger.error(f"Error inserting BondY stress: {e}")
             raise
 
-    def get_bondy_stress(
+    def iter_bondy_stress(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
-    ) -> list[dict]:
-        """Get BondY stress data"""
-        try:
-            conditions = []
-            params = []
-
-            if start_date:
-                conditions.append("date >= ?")
-                params.append(start_date)
-            if end_date:
-                conditions.append("date <= ?")
-                params.append(end_date)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM bondy_stress_daily
-            {where_clause}
-            ORDER BY date DESC
-            """
-
-            if limit is not None:
-                sql += "\nLIMIT ?"
-                params.append(int(limit))
+        batch_size: int = _ITER_BATCH_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Stream BondY stress rows, newest first, batch_size rows at a time.
 
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+        The query runs on its own cursor, closed once the generator is
+        exhausted or discarded, so other queries may be issued while iterating.
+        """
+        cur = self.con.cursor()
+        try:
+            params = [start_date or None, end_date or None, int(limit) if limit is not None else None]
+            cur.execute(self._stmt(_SQL_BONDY_STRESS), params)
+            yield from _iter_dicts(cur, batch_size)
         except Exception as e:
             logger.error(f"Error fetching BondY stress: {e}")
             raise
+        finally:
+            cur.close()
+
+    def get_bondy_stress(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
+        """Get BondY stress data"""
+        return list(self.iter_bondy_stress(start_date, end_date, limit))
 
     def _create_bondy_stress_views(self):
         """Create BondY stress analytics views"""
         sql = """
-        -- Latest BondY stress view
+        -- Latest BondY stress view (date is UNIQUE, so one row; a single
+        -- TOP_N pass instead of a MAX() scan followed by a filtered scan)
         CREATE OR REPLACE VIEW v_bondy_stress_latest AS
         SELECT
             date,
@@ -1728,17 +2524,17 @@ class DatabaseManager:
             driver_json,
             computed_at
         FROM bondy_stress_daily
-        WHERE date = (SELECT MAX(date) FROM bondy_stress_daily);
+        ORDER BY date DESC
+        LIMIT 1;
 
-        -- BondY stress timeseries view
+        -- BondY stress timeseries view (unordered; callers add ORDER BY)
         CREATE OR REPLACE VIEW v_bondy_stress_timeseries AS
         SELECT
             date,
             stress_index,
             regime_bucket,
             computed_at
-        FROM bondy_stress_daily
-        ORDER BY date DESC;
+        FROM bondy_stress_daily;
         """
 
         self.con.execute(sql)
@@ -1746,21 +2542,7 @@ class DatabaseManager:
 
     def _create_daily_snapshots_table(self):
         """Create daily snapshots table for audit"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS daily_snapshots (
-            date DATE NOT NULL UNIQUE,
-            baseline_date DATE,
-            snapshot_json TEXT,
-            snapshot_text TEXT,
-            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source_components_json TEXT
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_daily_snapshots_date ON daily_snapshots(date);
-        CREATE INDEX IF NOT EXISTS idx_daily_snapshots_baseline ON daily_snapshots(baseline_date);
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_DAILY_SNAPSHOTS_DDL)
         logger.info("Created daily_snapshots table")
 
     def insert_daily_snapshot(
@@ -1772,9 +2554,8 @@ class DatabaseManager:
         source_components: Optional[dict] = None
     ) -> int:
         """Insert daily snapshot"""
+        cur = self._cursor()
         try:
-            import json
-
             sql = """
             INSERT INTO daily_snapshots (date, baseline_date, snapshot_json, snapshot_text, source_components_json)
             VALUES (?, ?, ?, ?, ?)
@@ -1787,7 +2568,7 @@ class DatabaseManager:
                 generated_at = get_current_timestamp()
             """
 
-            self.con.execute(sql, (
+            cur.execute(self._stmt(sql), (
                 date,
                 baseline_date,
                 snapshot_json,
@@ -1803,48 +2584,26 @@ class DatabaseManager:
 
     def get_daily_snapshot(self, date: str) -> Optional[dict]:
         """Get daily snapshot for specific date"""
+        cur = self._cursor()
         try:
             sql = """
             SELECT * FROM daily_snapshots
             WHERE date = ?
             """
 
-            result = self.con.execute(sql, [date]).fetchone()
-
-            if result:
-                columns = [desc[0] for desc in self.con.description]
-                return dict(zip(columns, result))
-
-            return None
+            return _fetch_dict(cur.execute(self._stmt(sql), [date]))
         except Exception as e:
             logger.error(f"Error getting daily snapshot: {e}")
             raise
 
     def _create_alert_thresholds_table(self):
         """Create alert thresholds table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS alert_thresholds (
-            id INTEGER PRIMARY KEY,
-            alert_code VARCHAR NOT NULL UNIQUE,
-            enabled BOOLEAN DEFAULT TRUE,
-            severity VARCHAR NOT NULL,
-            params_json TEXT,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_alert_thresholds_code ON alert_thresholds(alert_code);
-        CREATE INDEX IF NOT EXISTS idx_alert_thresholds_enabled ON alert_thresholds(enabled);
-
-        CREATE SEQUENCE IF NOT EXISTS alert_thresholds_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_ALERT_THRESHOLDS_DDL)
         logger.info("Created alert_thresholds table")
 
     def _seed_default_alert_thresholds(self):
         """Seed default alert thresholds (insert missing only)"""
-
-        import json
+        cur = self._cursor()
 
         default_thresholds = [
             {
@@ -1904,105 +2663,78 @@ class DatabaseManager:
         ]
 
         # Load existing codes to avoid overwriting user edits.
-        existing_rows = self.con.execute("SELECT alert_code, enabled, severity, params_json FROM alert_thresholds").fetchall()
-        existing_codes = {r[0] for r in existing_rows} if existing_rows else set()
+        existing_codes = {code for (code,) in cur.execute("SELECT alert_code FROM alert_thresholds").fetchall()}
 
         # Targeted migration: fix legacy key "zscore_max" -> "z_max" for turnover alert.
-        for code, enabled, severity, params_json in existing_rows or []:
-            if code != "ALERT_TURNOVER_DROP" or not params_json:
-                continue
+        turnover = cur.execute(
+            "SELECT enabled, severity, params_json FROM alert_thresholds WHERE alert_code = 'ALERT_TURNOVER_DROP'"
+        ).fetchone()
+        if turnover and turnover[2]:
+            enabled, severity, params_json = turnover
             try:
                 params = json.loads(params_json)
             except Exception:
-                continue
+                params = None
             if isinstance(params, dict) and "zscore_max" in params and "z_max" not in params:
                 params["z_max"] = params.pop("zscore_max")
-                self.upsert_alert_threshold(alert_code=code, enabled=bool(enabled), severity=str(severity), params=params)
+                self.upsert_alert_threshold(
+                    alert_code="ALERT_TURNOVER_DROP", enabled=bool(enabled), severity=str(severity), params=params
+                )
                 logger.info("Migrated ALERT_TURNOVER_DROP params: zscore_max -> z_max")
 
-        for threshold in default_thresholds:
+        missing = [t for t in default_thresholds if t['alert_code'] not in existing_codes]
+        if missing:
+            sql = """
+            INSERT INTO alert_thresholds (id, alert_code, enabled, severity, params_json)
+            VALUES (?, ?, ?, ?, ?)
+            """
             try:
-                if threshold['alert_code'] in existing_codes:
-                    continue
-
-                alert_id = self.con.execute("SELECT nextval('alert_thresholds_id_seq')").fetchone()[0]
-
-                sql = """
-                INSERT INTO alert_thresholds (id, alert_code, enabled, severity, params_json)
-                VALUES (?, ?, ?, ?, ?)
-                """
-
-                self.con.execute(sql, (
-                    alert_id,
-                    threshold['alert_code'],
-                    threshold['enabled'],
-                    threshold['severity'],
-                    json.dumps(threshold['params'])
-                ))
-
-                logger.info(f"Seeded alert threshold: {threshold['alert_code']}")
-
+                with self._txn():
+                    # One id range and one executemany for every missing default
+                    alert_ids = cur.execute(
+                        "SELECT nextval('alert_thresholds_id_seq') FROM range(?)", [len(missing)]
+                    ).fetchall()
+                    cur.executemany(sql, [
+                        (
+                            alert_id,
+                            threshold['alert_code'],
+                            threshold['enabled'],
+                            threshold['severity'],
+                            json.dumps(threshold['params']),
+                        )
+                        for (alert_id,), threshold in zip(alert_ids, missing)
+                    ])
+                logger.info(f"Seeded alert thresholds: {', '.join(t['alert_code'] for t in missing)}")
             except Exception as e:
-                logger.warning(f"Failed to seed threshold {threshold['alert_code']}: {e}")
+                logger.warning(f"Failed to seed default alert thresholds: {e}")
 
         logger.info("Default alert thresholds ensured (missing inserted)")
 
     def get_alert_thresholds(self, enabled_only: bool = False) -> list[dict]:
         """Get alert thresholds"""
+        cur = self._cursor()
         try:
-            conditions = []
-            params = []
-
-            if enabled_only:
-                conditions.append("enabled = ?")
-                params.append(True)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM alert_thresholds
-            {where_clause}
-            ORDER BY alert_code
-            """
-
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_ALERT_THRESHOLDS), [bool(enabled_only)]))
         except Exception as e:
             logger.error(f"Error getting alert thresholds: {e}")
             raise
 
     def upsert_alert_threshold(self, alert_code: str, enabled: bool, severity: str, params: dict) -> int:
         """Insert or update alert threshold"""
+        cur = self._cursor()
         try:
-            import json
-
-            # Check if exists
-            existing = self.con.execute(
-                "SELECT id FROM alert_thresholds WHERE alert_code = ?",
-                [alert_code]
-            ).fetchone()
-
-            if existing:
-                # Update
-                sql = """
-                UPDATE alert_thresholds
-                SET enabled = ?, severity = ?, params_json = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE alert_code = ?
-                """
-
-                self.con.execute(sql, (enabled, severity, json.dumps(params), alert_code))
-            else:
-                # Insert
-                alert_id = self.con.execute("SELECT nextval('alert_thresholds_id_seq')").fetchone()[0]
-
-                sql = """
-                INSERT INTO alert_thresholds (id, alert_code, enabled, severity, params_json)
-                VALUES (?, ?, ?, ?, ?)
-                """
-
-                self.con.execute(sql, (alert_id, alert_code, enabled, severity, json.dumps(params)))
+            sql = """
+            INSERT INTO alert_thresholds (id, alert_code, enabled, severity, params_json)
+            VALUES (nextval('alert_thresholds_id_seq'), ?, ?, ?, ?)
+            ON CONFLICT (alert_code)
+            DO UPDATE SET
+                enabled = EXCLUDED.enabled,
+                severity = EXCLUDED.severity,
+                params_json = EXCLUDED.params_json,
+                updated_at = get_current_timestamp()
+            """
 
+            cur.execute(self._stmt(sql), (alert_code, enabled, severity, json.dumps(params)))
             logger.info(f"Upserted alert threshold: {alert_code}")
             return 1
         except Exception as e:
@@ -2011,80 +2743,60 @@ class DatabaseManager:
 
     def _create_notification_channels_table(self):
         """Create notification channels table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS notification_channels (
-            id INTEGER PRIMARY KEY,
-            channel_type VARCHAR NOT NULL,
-            enabled BOOLEAN DEFAULT FALSE,
-            config_json TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
+        self.con.execute(_NOTIFICATION_CHANNELS_DDL)
+        logger.info("Created notification_channels table")
 
-        CREATE INDEX IF NOT EXISTS idx_notification_channels_type ON notification_channels(channel_type);
-        CREATE INDEX IF NOT EXISTS idx_notification_channels_enabled ON notification_channels(enabled);
+    def _drop_notification_channels_unique_type(self):
+        """
+        Drop the unique channel_type index an earlier migration added.
 
-        CREATE SEQUENCE IF NOT EXISTS notification_channels_id_seq START 1;
+        Several email/webhook channels may share a channel_type (the admin
+        routes create and toggle them by id), so the index cannot be kept.
         """
+        self._apply_migration("drop_notification_channels_unique_type", self._drop_channel_type_unique_index)
 
-        self.con.execute(sql)
-        logger.info("Created notification_channels table")
+    def _drop_channel_type_unique_index(self) -> bool:
+        """Drop idx_notification_channels_type_unique if present; returns False on failure"""
+        try:
+            self.con.execute("DROP INDEX IF EXISTS idx_notification_channels_type_unique")
+        except Exception as e:
+            logger.warning(f"Failed to drop unique notification channel type index: {e}")
+            return False
+        return True
 
     def get_notification_channels(self, enabled_only: bool = True) -> list[dict]:
         """Get notification channels"""
+        cur = self._cursor()
         try:
-            conditions = []
-            params = []
-
-            if enabled_only:
-                conditions.append("enabled = ?")
-                params.append(True)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-            sql = f"""
-            SELECT * FROM notification_channels
-            {where_clause}
-            ORDER BY id
-            """
-
-            result = self.con.execute(sql, params).fetchall()
-            columns = [desc[0] for desc in self.con.description]
-            return [dict(zip(columns, row)) for row in result]
+            return _fetch_dicts(cur.execute(self._stmt(_SQL_NOTIFICATION_CHANNELS), [bool(enabled_only)]))
         except Exception as e:
             logger.error(f"Error getting notification channels: {e}")
             raise
 
     def upsert_notification_channel(self, channel_type: str, enabled: bool, config: dict) -> int:
         """Insert or update notification channel"""
+        cur = self._cursor()
         try:
-            import json
-
-            # Check if exists
-            existing = self.con.execute(
-                "SELECT id FROM notification_channels WHERE channel_type = ?",
-                [channel_type]
+            # channel_type is not unique (see _drop_notification_channels_unique_type),
+            # so there is no conflict target to upsert on
+            existing = cur.execute(
+                self._stmt("SELECT id FROM notification_channels WHERE channel_type = ? LIMIT 1"),
+                [channel_type],
             ).fetchone()
 
             if existing:
-                # Update
                 sql = """
                 UPDATE notification_channels
                 SET enabled = ?, config_json = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE channel_type = ?
                 """
-
-                self.con.execute(sql, (enabled, json.dumps(config), channel_type))
+                cur.execute(self._stmt(sql), (enabled, json.dumps(config), channel_type))
             else:
-                # Insert
-                channel_id = self.con.execute("SELECT nextval('notification_channels_id_seq')").fetchone()[0]
-
                 sql = """
                 INSERT INTO notification_channels (id, channel_type, enabled, config_json)
-                VALUES (?, ?, ?, ?)
+                VALUES (nextval('notification_channels_id_seq'), ?, ?, ?)
                 """
-
-                self.con.execute(sql, (channel_id, channel_type, enabled, json.dumps(config)))
+                cur.execute(self._stmt(sql), (channel_type, enabled, json.dumps(config)))
 
             logger.info(f"Upserted notification channel: {channel_type}")
             return 1
@@ -2094,27 +2806,7 @@ class DatabaseManager:
 
     def _create_notification_events_table(self):
         """Create notification events table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS notification_events (
-            id INTEGER PRIMARY KEY,
-            date DATE NOT NULL,
-            alert_code VARCHAR NOT NULL,
-            channel_id INTEGER NOT NULL,
-            status VARCHAR NOT NULL,
-            error_message TEXT,
-            sent_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_notification_events_date ON notification_events(date);
-        CREATE INDEX IF NOT EXISTS idx_notification_events_alert ON notification_events(alert_code);
-        CREATE INDEX IF NOT EXISTS idx_notification_events_status ON notification_events(status);
-        CREATE INDEX IF NOT EXISTS idx_notification_events_channel ON notification_events(channel_id);
-
-        CREATE SEQUENCE IF NOT EXISTS notification_events_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_NOTIFICATION_EVENTS_DDL)
         logger.info("Created notification_events table")
 
     def insert_notification_event(
@@ -2126,59 +2818,79 @@ class DatabaseManager:
         error_message: Optional[str] = None
     ) -> int:
         """Insert notification event"""
-        try:
-            event_id = self.con.execute("SELECT nextval('notification_events_id_seq')").fetchone()[0]
+        event_id = self.insert_notification_events_many([{
+            'date': date,
+            'alert_code': alert_code,
+            'channel_id': channel_id,
+            'status': status,
+            'error_message': error_message,
+        }])[0]
+        logger.info(f"Logged notification event: {alert_code} -> {status}")
+        return event_id
+
+    def insert_notification_events_many(self, events: list[dict]) -> list[int]:
+        """
+        Insert notification events in one transaction
+
+        Each event has date, alert_code, channel_id, status and optionally
+        error_message. Returns the new event ids in input order.
+        """
+        if not events:
+            return []
 
+        cur = self._cursor()
+        try:
+            # channel_type is copied from the channel so event listings and
+            # per-type rollups need no join back to notification_channels
             sql = """
-            INSERT INTO notification_events (id, date, alert_code, channel_id, status, error_message)
-            VALUES (?, ?, ?, ?, ?, ?)
+            INSERT INTO notification_events (id, date, alert_code, channel_id, status, error_message, channel_type)
+            VALUES ($1, $2, $3, $4, $5, $6, (SELECT channel_type FROM notification_channels WHERE id = $4))
             """
 
-            self.con.execute(sql, (event_id, date, alert_code, channel_id, status, error_message))
-            logger.info(f"Logged notification event: {alert_code} -> {status}")
-            return event_id
+            with self._txn():
+                # One round-trip for the whole id range instead of a nextval per event
+                event_ids = [
+                    event_id for (event_id,) in cur.execute(
+                        self._stmt("SELECT nextval('notification_events_id_seq') FROM range(?)"),
+                        [len(events)],
+                    ).fetchall()
+                ]
+                cur.executemany(self._stmt(sql), [
+                    (
+                        event_id,
+                        event['date'],
+                        event['alert_code'],
+                        event['channel_id'],
+                        event['status'],
+                        event.get('error_message'),
+                    )
+                    for event_id, event in zip(event_ids, events)
+                ])
+            return event_ids
         except Exception as e:
             logger.error(f"Error inserting notification event: {e}")
             raise
 
     def has_notification_been_sent(self, date: str, alert_code: str, channel_id: int) -> bool:
         """Check if notification has already been sent for this date/alert/channel"""
+        cur = self._cursor()
         try:
+            # EXISTS stops at the first matching row instead of counting them all
             sql = """
-            SELECT COUNT(*) as count
-            FROM notification_events
-            WHERE date = ? AND alert_code = ? AND channel_id = ? AND status = 'sent'
+            SELECT EXISTS (
+                SELECT 1 FROM notification_events
+                WHERE date = ? AND alert_code = ? AND channel_id = ? AND status = 'sent'
+            )
             """
 
-            result = self.con.execute(sql, [date, alert_code, channel_id]).fetchone()
-            return result and result[0] > 0
+            return cur.execute(self._stmt(sql), [date, alert_code, channel_id]).fetchone()[0]
         except Exception as e:
             logger.error(f"Error checking notification sent status: {e}")
             return False
 
     def _create_report_artifacts_table(self):
         """Create report artifacts table for caching"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS report_artifacts (
-            id INTEGER PRIMARY KEY,
-            report_type VARCHAR NOT NULL,
-            date DATE NOT NULL,
-            file_path VARCHAR NOT NULL,
-            file_size BIGINT,
-            status VARCHAR NOT NULL,
-            error_message TEXT,
-            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(report_type, date)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_report_artifacts_type ON report_artifacts(report_type);
-        CREATE INDEX IF NOT EXISTS idx_report_artifacts_date ON report_artifacts(date);
-        CREATE INDEX IF NOT EXISTS idx_report_artifacts_status ON report_artifacts(status);
-
-        CREATE SEQUENCE IF NOT EXISTS report_artifacts_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_REPORT_ARTIFACTS_DDL)
         logger.info("Created report_artifacts table")
 
     def insert_report_artifact(
@@ -2191,12 +2903,11 @@ class DatabaseManager:
         error_message: Optional[str] = None
     ) -> int:
         """Insert report artifact record"""
+        cur = self._cursor()
         try:
-            artifact_id = self.con.execute("SELECT nextval('report_artifacts_id_seq')").fetchone()[0]
-
             sql = """
             INSERT INTO report_artifacts (id, report_type, date, file_path, file_size, status, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            VALUES (nextval('report_artifacts_id_seq'), ?, ?, ?, ?, ?, ?)
             ON CONFLICT (report_type, date)
             DO UPDATE SET
                 file_path = EXCLUDED.file_path,
@@ -2204,9 +2915,14 @@ class DatabaseManager:
                 status = EXCLUDED.status,
                 error_message = EXCLUDED.error_message,
                 generated_at = get_current_timestamp()
+            RETURNING id
             """
 
-            self.con.execute(sql, (artifact_id, report_type, date, file_path, file_size, status, error_message))
+            # RETURNING gives the stored row's id, including when an existing
+            # (report_type, date) row was updated
+            artifact_id = cur.execute(
+                self._stmt(sql), (report_type, date, file_path, file_size, status, error_message)
+            ).fetchone()[0]
             logger.info(f"Inserted report artifact: {report_type} for {date}")
             return artifact_id
         except Exception as e:
@@ -2215,100 +2931,213 @@ class DatabaseManager:
 
     def get_report_artifact(self, report_type: str, date: str) -> Optional[dict]:
         """Get report artifact for specific type and date"""
+        cur = self._cursor()
         try:
             sql = """
             SELECT * FROM report_artifacts
             WHERE report_type = ? AND date = ? AND status = 'success'
             """
 
-            result = self.con.execute(sql, [report_type, date]).fetchone()
-
-            if result:
-                columns = [desc[0] for desc in self.con.description]
-                return dict(zip(columns, result))
-
-            return None
+            return _fetch_dict(cur.execute(self._stmt(sql), [report_type, date]))
         except Exception as e:
             logger.error(f"Error getting report artifact: {e}")
             raise
 
     def _create_dq_runs_table(self):
         """Create data quality runs table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS dq_runs (
-            id INTEGER PRIMARY KEY,
-            run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            target_date DATE NOT NULL,
-            status VARCHAR NOT NULL,
-            total_rules INTEGER,
-            passed_rules INTEGER,
-            failed_rules INTEGER,
-            summary_json TEXT
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_dq_runs_target_date ON dq_runs(target_date);
-        CREATE INDEX IF NOT EXISTS idx_dq_runs_status ON dq_runs(status);
-
-        CREATE SEQUENCE IF NOT EXISTS dq_runs_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_DQ_RUNS_DDL)
         logger.info("Created dq_runs table")
 
     def _create_dq_results_table(self):
         """Create data quality results table"""
-        sql = """
-        CREATE TABLE IF NOT EXISTS dq_results (
-            id INTEGER PRIMARY KEY,
-            target_date DATE NOT NULL,
-            dataset_id VARCHAR NOT NULL,
-            rule_code VARCHAR NOT NULL,
-            severity VARCHAR NOT NULL,
-            passed BOOLEAN NOT NULL,
-            message TEXT,
-            details_json TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(target_date, dataset_id, rule_code)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_dq_results_target_date ON dq_results(target_date);
-        CREATE INDEX IF NOT EXISTS idx_dq_results_dataset ON dq_results(dataset_id);
-        CREATE INDEX IF NOT EXISTS idx_dq_results_severity ON dq_results(severity);
-
-        CREATE SEQUENCE IF NOT EXISTS dq_results_id_seq START 1;
-        """
-
-        self.con.execute(sql)
+        self.con.execute(_DQ_RESULTS_DDL)
         logger.info("Created dq_results table")
 
     def _create_source_fingerprints_table(self):
         """Create source fingerprints table for drift detection"""
+        self.con.execute(_SOURCE_FINGERPRINTS_DDL)
+        logger.info("Created source_fingerprints table")
+
+    def _create_table_coverage_rollup_table(self):
+        """Create per-table date coverage rollup and backfill tables it does not cover yet"""
+        self.con.execute(_TABLE_COVERAGE_ROLLUP_DDL)
+        self._backfill_table_coverage_rollup()
+        logger.info("Created table_coverage_rollup table")
+
+    def _backfill_table_coverage_rollup(self):
+        """Rebuild rollup rows for coverage tables it does not cover yet"""
+        covered = {
+            row[0] for row in self.con.execute("SELECT table_name FROM table_coverage_rollup").fetchall()
+        }
+        missing = [t for t in COVERAGE_TABLES if t not in covered]
+        if missing:
+            self.rebuild_coverage_rollup(missing)
+
+    def rebuild_coverage_rollup(self, tables: Optional[Sequence[str]] = None) -> int:
+        """
+        Recompute table_coverage_rollup rows from the underlying tables
+
+        Args:
+            tables: Tables to rebuild (default: all of COVERAGE_TABLES)
+
+        Returns:
+            Number of rollup rows written
+        """
+        tables = [t for t in (tables or COVERAGE_TABLES) if t in COVERAGE_TABLES]
+        if not tables:
+            return 0
+
+        try:
+            sql = (
+                "INSERT INTO table_coverage_rollup (table_name, earliest_date, latest_date, date_count, updated_at)\n"
+                + "\nUNION ALL\n".join(
+                    f"SELECT '{t}', MIN(date), MAX(date), COUNT(DISTINCT date), CURRENT_TIMESTAMP FROM {t}"
+                    for t in tables
+                )
+                + """
+            ON CONFLICT (table_name)
+            DO UPDATE SET
+                earliest_date = EXCLUDED.earliest_date,
+                latest_date = EXCLUDED.latest_date,
+                date_count = EXCLUDED.date_count,
+                updated_at = EXCLUDED.updated_at
+            """
+            )
+            self.con.execute(sql)
+            for t in tables:
+                invalidate_cache(t)
+            logger.info(f"Rebuilt coverage rollup for {len(tables)} tables")
+            return len(tables)
+        except Exception as e:
+            logger.error(f"Error rebuilding coverage rollup: {e}")
+            raise
+
+    def _coverage_delta(self, table: str, params: list[tuple]) -> tuple:
+        """
+        Count dates in an upsert batch that `table` does not hold yet
+
+        Must run before the batch is written. Returns (new_date_count,
+        min_new_date, max_new_date); dates already present cannot move the
+        table's bounds, so only new ones matter for the rollup.
+        """
+        cur = self._cursor()
+        dates = list({str(row[0]) for row in params if row[0] is not None})
+        if not dates:
+            return (0, None, None)
+
+        sql = f"""
+        SELECT COUNT(*), MIN(d), MAX(d)
+        FROM (SELECT DISTINCT CAST(unnest(?) AS DATE) AS d) batch
+        WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE t.date = batch.d)
+        """
+        return cur.execute(self._stmt(sql), [dates]).fetchone()
+
+    def _apply_coverage_delta(self, table: str, delta: tuple) -> None:
+        """Fold a _coverage_delta result into table_coverage_rollup after the batch is written"""
+        cur = self._cursor()
+        new_dates, earliest, latest = delta
+        if not new_dates:
+            return
+
+        # UPDATE only: a missing rollup row means the table was never rolled up
+        # (or was reset), and readers fall back to scanning it until rebuilt.
         sql = """
-        CREATE TABLE IF NOT EXISTS source_fingerprints (
-            id INTEGER PRIMARY KEY,
-            provider VARCHAR NOT NULL,
-            dataset_id VARCHAR NOT NULL,
-            target_date DATE NOT NULL,
-            fingerprint_hash VARCHAR NOT NULL,
-            content_type VARCHAR,
-            bytes INTEGER,
-            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            parse_rowcount INTEGER,
-            parse_required_fields_ok BOOLEAN,
-            note TEXT,
-            UNIQUE(provider, dataset_id, target_date, fingerprint_hash)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_source_fingerprints_provider ON source_fingerprints(provider);
-        CREATE INDEX IF NOT EXISTS idx_source_fingerprints_dataset ON source_fingerprints(dataset_id);
-        CREATE INDEX IF NOT EXISTS idx_source_fingerprints_date ON source_fingerprints(target_date);
-        CREATE INDEX IF NOT EXISTS idx_source_fingerprints_hash ON source_fingerprints(fingerprint_hash);
-
-        CREATE SEQUENCE IF NOT EXISTS source_fingerprints_id_seq START 1;
+        UPDATE table_coverage_rollup
+        SET earliest_date = LEAST(earliest_date, ?),
+            latest_date = GREATEST(latest_date, ?),
+            date_count = date_count + ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE table_name = ?
         """
+        cur.execute(self._stmt(sql), [earliest, latest, new_dates, table])
 
-        self.con.execute(sql)
-        logger.info("Created source_fingerprints table")
+    def get_coverage_rollup(self) -> dict[str, tuple]:
+        """Return {table_name: (earliest_date, latest_date, date_count)} from the rollup"""
+        rows = self.con.execute(
+            "SELECT table_name, earliest_date, latest_date, date_count FROM table_coverage_rollup"
+        ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def _create_fingerprint_drift_rollup_table(self):
+        """
+        Create the 30-day fingerprint drift rollup
+
+        One row per (provider, dataset_id, fetched day, fingerprint hash) with
+        sufficient statistics, so drift signals aggregate a handful of rows
+        instead of rescanning source_fingerprints. Backfilled when empty.
+        """
+        self.con.execute(_FINGERPRINT_DRIFT_ROLLUP_DDL)
+        self._backfill_fingerprint_drift_rollup()
+        logger.info("Created fingerprint_drift_30d table")
+
+    def _backfill_fingerprint_drift_rollup(self):
+        """Rebuild the drift rollup from source_fingerprints when it is empty"""
+        if not self.con.execute("SELECT 1 FROM fingerprint_drift_30d LIMIT 1").fetchone():
+            self.rebuild_fingerprint_drift_rollup()
+
+    def rebuild_fingerprint_drift_rollup(self, days: int = 30) -> None:
+        """Recompute fingerprint_drift_30d from the last `days` of source_fingerprints"""
+        try:
+            self.con.execute("DELETE FROM fingerprint_drift_30d")
+            sql = """
+            INSERT INTO fingerprint_drift_30d
+            SELECT provider, dataset_id, CAST(fetched_at AS DATE), fingerprint_hash,
+                   MAX(fetched_at),
+                   COUNT(parse_rowcount),
+                   COALESCE(SUM(parse_rowcount), 0),
+                   COUNT(*) FILTER (WHERE parse_required_fields_ok = FALSE)
+            FROM source_fingerprints
+            WHERE fetched_at >= current_date - to_days(CAST(? AS INTEGER))
+            GROUP BY ALL
+            """
+            self.con.execute(sql, [days])
+            invalidate_cache("source_fingerprints")
+        except Exception as e:
+            logger.error(f"Error rebuilding fingerprint drift rollup: {e}")
+            raise
+
+    def prune_fingerprint_drift_rollup(self, days: int = 30) -> None:
+        """Drop drift rollup rows that have aged out of the window"""
+        self.con.execute(
+            "DELETE FROM fingerprint_drift_30d WHERE fetched_day < current_date - to_days(CAST(? AS INTEGER))",
+            [days]
+        )
+
+    def _fold_fingerprints_into_drift_rollup(self, fingerprints: list[tuple]) -> None:
+        """
+        Add newly stored fingerprints to their fingerprint_drift_30d buckets
+
+        Each item is (provider, dataset_id, fingerprint_hash, fetched_at,
+        parse_rowcount, parse_required_fields_ok), the shape the fingerprint
+        INSERT returns.
+        """
+        cur = self._cursor()
+        sql = """
+        INSERT INTO fingerprint_drift_30d (
+            provider, dataset_id, fetched_day, fingerprint_hash,
+            last_fetched, rowcount_n, sum_rowcount, parse_failures
+        ) VALUES (?, ?, CAST(? AS DATE), ?, ?, ?, ?, ?)
+        ON CONFLICT (provider, dataset_id, fetched_day, fingerprint_hash)
+        DO UPDATE SET
+            last_fetched = GREATEST(fingerprint_drift_30d.last_fetched, EXCLUDED.last_fetched),
+            rowcount_n = fingerprint_drift_30d.rowcount_n + EXCLUDED.rowcount_n,
+            sum_rowcount = fingerprint_drift_30d.sum_rowcount + EXCLUDED.sum_rowcount,
+            parse_failures = fingerprint_drift_30d.parse_failures + EXCLUDED.parse_failures
+        """
+        cur.executemany(self._stmt(sql), [
+            (
+                provider,
+                dataset_id,
+                fetched_at,
+                fingerprint_hash,
+                fetched_at,
+                0 if parse_rowcount is None else 1,
+                parse_rowcount or 0,
+                1 if parse_required_fields_ok is False else 0,
+            )
+            for provider, dataset_id, fingerprint_hash, fetched_at, parse_rowcount, parse_required_fields_ok
+            in fingerprints
+        ])
 
     def insert_source_fingerprint(
         self,
@@ -2327,38 +3156,106 @@ class DatabaseManager:
         Returns:
             fingerprint_hash (SHA256)
         """
-        import hashlib
-
-        # Compute fingerprint hash
         fingerprint_hash = hashlib.sha256(content).hexdigest()
+        self._insert_fingerprint_rows([(
+            provider, dataset_id, target_date, fingerprint_hash, content_type,
+            len(content), parse_rowcount, parse_required_fields_ok, note,
+        )])
+        logger.info(f"Inserted fingerprint for {provider}/{dataset_id} on {target_date}: {fingerprint_hash[:16]}...")
+        return fingerprint_hash
+
+    def insert_source_fingerprint_streaming(
+        self,
+        provider: str,
+        dataset_id: str,
+        target_date: str | date,
+        chunks: Iterable[bytes],
+        content_type: str,
+        parse_rowcount: int,
+        parse_required_fields_ok: bool,
+        note: Optional[str] = None
+    ) -> str:
+        """
+        Insert a source fingerprint record, hashing content as it is read
 
-        try:
-            fingerprint_id = self.con.execute("SELECT nextval('source_fingerprints_id_seq')").fetchone()[0]
-            sql = """
-            INSERT INTO source_fingerprints (
-                id, provider, dataset_id, target_date, fingerprint_hash,
-                content_type, bytes, parse_rowcount, parse_required_fields_ok, note
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (provider, dataset_id, target_date, fingerprint_hash)
-            DO NOTHING
-            """
+        Same as insert_source_fingerprint, but takes the payload as an
+        iterable of byte chunks (e.g. a response's iter_content() or a file
+        read in blocks), so a large download never has to be held whole in
+        memory just to be fingerprinted.
 
-            self.con.execute(sql, [
-                fingerprint_id,
-                provider,
-                dataset_id,
-                target_date,
-                fingerprint_hash,
-                content_type,
-                len(content),
-                parse_rowcount,
-                parse_required_fields_ok,
-                note
-            ])
+        Returns:
+            fingerprint_hash (SHA256)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+        fingerprint_hash = digest.hexdigest()
+        self._insert_fingerprint_rows([(
+            provider, dataset_id, target_date, fingerprint_hash, content_type,
+            size, parse_rowcount, parse_required_fields_ok, note,
+        )])
+        logger.info(f"Inserted fingerprint for {provider}/{dataset_id} on {target_date}: {fingerprint_hash[:16]}...")
+        return fingerprint_hash
+
+    def insert_source_fingerprints_many(self, records: list[dict]) -> list[str]:
+        """
+        Insert several source fingerprint records in one statement
+
+        Each record carries the insert_source_fingerprint arguments as keys
+        (note optional). Returns the fingerprint hashes in input order.
+        """
+        if not records:
+            return []
+
+        rows = [
+            (
+                r['provider'],
+                r['dataset_id'],
+                r['target_date'],
+                hashlib.sha256(r['content']).hexdigest(),
+                r['content_type'],
+                len(r['content']),
+                r['parse_rowcount'],
+                r['parse_required_fields_ok'],
+                r.get('note'),
+            )
+            for r in records
+        ]
+        self._insert_fingerprint_rows(rows)
+        logger.info(f"Inserted {len(rows)} source fingerprints")
+        return [row[3] for row in rows]
 
-            logger.info(f"Inserted fingerprint for {provider}/{dataset_id} on {target_date}: {fingerprint_hash[:16]}...")
-            return fingerprint_hash
+    def _insert_fingerprint_rows(self, rows: list[tuple]) -> None:
+        """
+        Store fingerprint rows (skipping exact repeats) and fold the new ones
+        into the drift rollup
 
+        Rows are (provider, dataset_id, target_date, fingerprint_hash,
+        content_type, bytes, parse_rowcount, parse_required_fields_ok, note).
+        One multi-row INSERT allocates ids inline and RETURNs only the rows it
+        actually stored, so the rollup is folded in a single executemany.
+        """
+        cur = self._cursor()
+        values = ", ".join(
+            ["(nextval('source_fingerprints_id_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(rows)
+        )
+        sql = f"""
+        INSERT INTO source_fingerprints (
+            id, provider, dataset_id, target_date, fingerprint_hash,
+            content_type, bytes, parse_rowcount, parse_required_fields_ok, note
+        ) VALUES {values}
+        ON CONFLICT (provider, dataset_id, target_date, fingerprint_hash)
+        DO NOTHING
+        RETURNING provider, dataset_id, fingerprint_hash, fetched_at, parse_rowcount, parse_required_fields_ok
+        """
+        try:
+            with self._txn():
+                inserted = cur.execute(sql, [value for row in rows for value in row]).fetchall()
+                if inserted:
+                    self._fold_fingerprints_into_drift_rollup(inserted)
+            invalidate_cache("source_fingerprints")
         except Exception as e:
             logger.error(f"Error inserting source fingerprint: {e}")
             raise
@@ -2369,44 +3266,29 @@ class DatabaseManager:
         dataset_id: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 100
-    ) -> list:
-        """Get source fingerprints with filters"""
-        try:
-            sql = """
-            SELECT * FROM source_fingerprints
-            WHERE 1=1
-            """
-
-            params = []
-
-            if provider:
-                sql += " AND provider = ?"
-                params.append(provider)
-
-            if dataset_id:
-                sql += " AND dataset_id = ?"
-                params.append(dataset_id)
-
-            if start_date:
-                sql += " AND target_date >= ?"
-                params.append(start_date)
-
-            if end_date:
-                sql += " AND target_date <= ?"
-                params.append(end_date)
-
-            sql += " ORDER BY fetched_at DESC LIMIT ?"
-            params.append(limit)
-
-            results = self.con.execute(sql, params).fetchall()
-
-            fingerprints = []
-            for row in results:
-                columns = [desc[0] for desc in self.con.description]
-                fingerprints.append(dict(zip(columns, row)))
+        limit: Optional[int] = 100,
+        as_frame: bool = False,
+    ) -> Any:
+        """
+        Get source fingerprints with filters
 
-            return fingerprints
+        With as_frame=True the rows come back as a pandas DataFrame built
+        column-wise by DuckDB instead of a list of dicts. limit=None returns
+        every matching row. Errors are logged and yield an empty list.
+        """
+        cur = self._cursor()
+        try:
+            params = [
+                provider or None,
+                dataset_id or None,
+                start_date or None,
+                end_date or None,
+                int(limit) if limit is not None else None,
+            ]
+            cur = cur.execute(self._stmt(_SQL_SOURCE_FINGERPRINTS), params)
+            if as_frame:
+                return cur.df()
+            return _fetch_dicts(cur)
 
         except Exception as e:
             logger.error(f"Error getting source fingerprints: {e}")
@@ -2425,46 +3307,33 @@ class DatabaseManager:
         Returns:
             Drift info dict if drift detected, None otherwise
         """
+        cur = self._cursor()
         try:
-            # Get previous fingerprints for this provider/dataset
-            sql = """
-            SELECT fingerprint_hash, parse_rowcount, parse_required_fields_ok,
-                   target_date, fetched_at
-            FROM source_fingerprints
-            WHERE provider = ? AND dataset_id = ?
-            ORDER BY fetched_at DESC
-            LIMIT 5
-            """
-
-            results = self.con.execute(sql, [provider, dataset_id]).fetchall()
+            # Newest previous fingerprint and the current hash's rowcount in one round-trip
+            result = cur.execute(
+                self._stmt(_SQL_FINGERPRINT_DRIFT), [provider, dataset_id, current_fingerprint]
+            ).fetchone()
 
-            if not results:
+            if not result:
                 # No previous fingerprints - this is first fetch
                 return None
 
             # Check if fingerprint changed
-            previous_fp = results[0][0]
+            previous_fp, previous_rowcount, current_rowcount = result
 
             if previous_fp != current_fingerprint:
                 # Fingerprint changed - check for regression
-                current_rowcount = self.con.execute(
-                    "SELECT parse_rowcount FROM source_fingerprints WHERE fingerprint_hash = ?",
-                    [current_fingerprint]
-                ).fetchone()
-
-                previous_rowcount = results[0][1]
-
                 drift_info = {
                     'previous_fingerprint': previous_fp[:16] + '...',
                     'current_fingerprint': current_fingerprint[:16] + '...',
                     'previous_rowcount': previous_rowcount,
-                    'current_rowcount': current_rowcount[0] if current_rowcount else None,
+                    'current_rowcount': current_rowcount,
                     'drift_type': 'content_changed'
                 }
 
                 # Check for regression (rowcount drop)
                 if current_rowcount and previous_rowcount:
-                    rowcount_change = current_rowcount[0] - previous_rowcount
+                    rowcount_change = current_rowcount - previous_rowcount
                     if rowcount_change < -0.1 * previous_rowcount:  # More than 10% drop
                         drift_info['regression'] = True
                         drift_info['regression_reason'] = f"Rowcount dropped by {abs(rowcount_change)} rows"
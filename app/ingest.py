@@ -1,8 +1,13 @@
 """
 Data ingestion pipeline with CLI interface
 """
+import importlib
+import json
 import logging
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -10,15 +15,6 @@ import time
 
 from app.config import settings
 from app.db.schema import DatabaseManager
-from app.providers.hnx_yield_curve import HNXYieldCurveProvider
-from app.providers.hnx_ftp_pdf import HNXFTPPDFProvider
-from app.providers.sbv_interbank import SBVInterbankProvider
-from app.providers.abo_market_watch import ABOMarketWatchProvider
-from app.providers.hnx_auction import HNXAuctionProvider
-from app.providers.hnx_trading import HNXTradingProvider
-from app.providers.sbv_policy import SBVPolicyProvider
-from app.providers.fred_global import FREDGlobalProvider
-from app.providers.lai_suat_rates import LaiSuatRatesProvider
 
 # Configure logging
 _handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
@@ -36,6 +32,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Target table for a provider record, keyed by (source, has 'rate' field).
+# ABO returns both yield curve and interbank records; interbank records carry
+# a 'rate' field and must NOT go to gov_yield_curve. SBV records without a
+# rate are not routed.
+_RECORD_TABLES = {
+    ('HNX_YC', False): 'yield_curve',
+    ('HNX_YC', True): 'yield_curve',
+    ('ABO', False): 'yield_curve',
+    ('ABO', True): 'interbank',
+    ('HNX_FTP_PDF', False): 'yield_change',
+    ('HNX_FTP_PDF', True): 'yield_change',
+    ('SBV', True): 'interbank',
+    ('HNX_AUCTION', False): 'auction',
+    ('HNX_AUCTION', True): 'auction',
+    ('HNX_TRADING', False): 'trading',
+    ('HNX_TRADING', True): 'trading',
+    ('SBV_POLICY', False): 'policy',
+    ('SBV_POLICY', True): 'policy',
+    ('FRED', False): 'global',
+    ('FRED', True): 'global',
+    ('LAI_SUAT', False): 'bank_rates',
+    ('LAI_SUAT', True): 'bank_rates',
+}
+
+# Table -> (DatabaseManager insert method, log label), in final flush order
+_TABLE_INSERTERS = {
+    'yield_curve': ('insert_yield_curve', 'yield curve'),
+    'yield_change': ('insert_yield_change_stats', 'yield change stats'),
+    'interbank': ('insert_interbank_rates', 'interbank rate'),
+    'auction': ('insert_auction_results', 'auction result'),
+    'trading': ('insert_secondary_trading', 'secondary trading'),
+    'policy': ('insert_policy_rates', 'policy rate'),
+    'global': ('insert_global_rates', 'global rate'),
+    'bank_rates': ('insert_bank_rates', 'bank rate'),
+}
+
 
 class IngestionPipeline:
     """Main ingestion pipeline orchestrator"""
@@ -55,19 +87,46 @@ class IngestionPipeline:
         "lai_suat_rates",
     ]
 
-    # Provider registry
-    PROVIDERS = {
-        'hnx_yield_curve': HNXYieldCurveProvider,
-        'hnx_ftp_pdf': HNXFTPPDFProvider,
-        'sbv_interbank': SBVInterbankProvider,
-        'abo': ABOMarketWatchProvider,
-        'hnx_auction': HNXAuctionProvider,
-        'hnx_trading': HNXTradingProvider,
-        'sbv_policy': SBVPolicyProvider,
-        'fred_global': FREDGlobalProvider,
-        'lai_suat_rates': LaiSuatRatesProvider,
+    # Provider registry ("module:Class"). Provider modules pull in requests,
+    # bs4, pdfplumber etc., so they are imported on first use, not at import time.
+    PROVIDER_PATHS = {
+        'hnx_yield_curve': 'app.providers.hnx_yield_curve:HNXYieldCurveProvider',
+        'hnx_ftp_pdf': 'app.providers.hnx_ftp_pdf:HNXFTPPDFProvider',
+        'sbv_interbank': 'app.providers.sbv_interbank:SBVInterbankProvider',
+        'abo': 'app.providers.abo_market_watch:ABOMarketWatchProvider',
+        'hnx_auction': 'app.providers.hnx_auction:HNXAuctionProvider',
+        'hnx_trading': 'app.providers.hnx_trading:HNXTradingProvider',
+        'sbv_policy': 'app.providers.sbv_policy:SBVPolicyProvider',
+        'fred_global': 'app.providers.fred_global:FREDGlobalProvider',
+        'lai_suat_rates': 'app.providers.lai_suat_rates:LaiSuatRatesProvider',
     }
 
+    # Resolved provider classes, filled by _get_provider_class
+    _provider_classes: dict = {}
+
+    # Providers fetched concurrently by run_daily/run_backfill. Fetches are
+    # blocking HTTP, so threads overlap the waits; DB writes stay serialized.
+    MAX_PROVIDER_WORKERS = 8
+
+    # Providers that must run on the calling thread (lai_suat_rates reads its
+    # SQLite store and writes through the owner connection), before the pool
+    SERIAL_PROVIDERS = frozenset({"lai_suat_rates"})
+
+    # Routed records buffered per table before a streaming backfill writes them
+    INGEST_FLUSH_ROWS = 10_000
+
+    @classmethod
+    def _get_provider_class(cls, provider_name: str):
+        """Import (once) and return the provider class registered under provider_name"""
+        provider_class = cls._provider_classes.get(provider_name)
+        if provider_class is None:
+            if provider_name not in cls.PROVIDER_PATHS:
+                raise ValueError(f"Unknown provider: {provider_name}")
+            module_name, class_name = cls.PROVIDER_PATHS[provider_name].split(':')
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+            cls._provider_classes[provider_name] = provider_class
+        return provider_class
+
     def __init__(self, db_path: Optional[str] = None, db_manager: Optional[DatabaseManager] = None):
         """Initialize pipeline with database connection (own or injected)."""
         self._owns_db_manager = db_manager is None
@@ -79,6 +138,8 @@ class IngestionPipeline:
             self.db_manager = DatabaseManager(self.db_path)
             self.db_manager.connect()
             self.db_manager.initialize_schema()
+        # Serializes provider writes when providers run on worker threads
+        self._db_lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -168,14 +229,7 @@ class IngestionPipeline:
             logger.info("FRED API key not provided, skipping fred_global provider")
             providers = [p for p in providers if p != 'fred_global']
 
-        results = {}
-        for provider_name in providers:
-            try:
-                result = self._run_provider(provider_name, today, today)
-                results[provider_name] = result
-            except Exception as e:
-                logger.error(f"Failed to run provider {provider_name}: {e}")
-                results[provider_name] = {'status': 'error', 'error': str(e)}
+        results = self._run_providers(providers, today, today)
 
         self._print_summary(results)
 
@@ -253,19 +307,57 @@ class IngestionPipeline:
             return
 
         if providers is None:
-            providers = list(self.PROVIDERS.keys())
+            providers = list(self.PROVIDER_PATHS.keys())
+
+        results = self._run_providers(providers, start, end)
 
+        self._print_summary(results)
+        return results
+
+    def _run_providers(self, providers: List[str], start_date: date, end_date: date) -> dict:
+        """
+        Run several providers over the same date range
+
+        SERIAL_PROVIDERS run first on this thread; the rest are submitted to a
+        thread pool so their HTTP fetches overlap. A provider that raises is
+        recorded as {'status': 'error'} without affecting the others.
+
+        Returns:
+            Results keyed by provider name, in the order given
+        """
         results = {}
-        for provider_name in providers:
+
+        def record(provider_name: str, run):
             try:
-                result = self._run_provider(provider_name, start, end)
-                results[provider_name] = result
+                results[provider_name] = run()
             except Exception as e:
                 logger.error(f"Failed to run provider {provider_name}: {e}")
                 results[provider_name] = {'status': 'error', 'error': str(e)}
 
-        self._print_summary(results)
-        return results
+        def run_pooled(provider_name: str) -> dict:
+            # Pool threads are discarded after this call; free their cursor now
+            try:
+                return self._run_provider(provider_name, start_date, end_date)
+            finally:
+                self.db_manager.release_thread_cursor()
+
+        pooled = []
+        for provider_name in providers:
+            if provider_name in self.SERIAL_PROVIDERS:
+                record(provider_name, lambda: self._run_provider(provider_name, start_date, end_date))
+            else:
+                pooled.append(provider_name)
+
+        if pooled:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PROVIDER_WORKERS, len(pooled))) as executor:
+                futures = {
+                    executor.submit(run_pooled, provider_name): provider_name
+                    for provider_name in pooled
+                }
+                for future in as_completed(futures):
+                    record(futures[future], future.result)
+
+        return {provider_name: results[provider_name] for provider_name in providers}
 
     def _run_provider(
         self,
@@ -286,18 +378,16 @@ class IngestionPipeline:
         """
         logger.info(f"Running provider: {provider_name}")
 
-        if provider_name not in self.PROVIDERS:
-            raise ValueError(f"Unknown provider: {provider_name}")
-
-        provider_class = self.PROVIDERS[provider_name]
+        provider_class = self._get_provider_class(provider_name)
 
         # Log ingest run start
-        run_id = self.db_manager.log_ingest_run(
-            provider=provider_name,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
-            status='running'
-        )
+        with self._db_lock:
+            run_id = self.db_manager.log_ingest_run(
+                provider=provider_name,
+                start_date=start_date.strftime('%Y-%m-%d'),
+                end_date=end_date.strftime('%Y-%m-%d'),
+                status='running'
+            )
 
         start_time = time.time()
         total_records = 0
@@ -306,16 +396,17 @@ class IngestionPipeline:
             with provider_class() as provider:
                 # Lai_suat: for daily runs, do incremental sync (SQLite -> DuckDB) in-process.
                 if provider_name == "lai_suat_rates" and start_date == end_date:
-                    result = self._run_lai_suat_incremental(provider, force_scrape=True)
-                    total_records += int(result.get("rows_inserted", 0) or 0)
-
-                    elapsed_time = time.time() - start_time
-                    self.db_manager.update_ingest_run(
-                        run_id=run_id,
-                        status=result.get("status", "completed"),
-                        rows_inserted=total_records,
-                        error_message=result.get("error"),
-                    )
+                    with self._db_lock:
+                        result = self._run_lai_suat_incremental(provider, force_scrape=True)
+                        total_records += int(result.get("rows_inserted", 0) or 0)
+
+                        elapsed_time = time.time() - start_time
+                        self.db_manager.update_ingest_run(
+                            run_id=run_id,
+                            status=result.get("status", "completed"),
+                            rows_inserted=total_records,
+                            error_message=result.get("error"),
+                        )
 
                     return {
                         "status": result.get("status", "completed"),
@@ -328,97 +419,42 @@ class IngestionPipeline:
                         },
                     }
 
-                # Fetch data
+                # Fetch data (backfills stream when the provider supports it)
                 if start_date == end_date:
                     records = provider.fetch(start_date)
+                elif hasattr(provider, 'backfill_iter'):
+                    records = provider.backfill_iter(start_date, end_date)
                 else:
                     records = provider.backfill(start_date, end_date)
 
-                # Separate records by table type
-                yield_curve_records = []
-                yield_change_records = []
-                interbank_records = []
-                auction_records = []
-                trading_records = []
-                policy_records = []
-                global_records = []
-                bank_rates_records = []
-
+                # Bucket records by target table, writing any bucket that
+                # reaches INGEST_FLUSH_ROWS while the provider keeps fetching
+                buckets = defaultdict(list)
+                route = _RECORD_TABLES.get
+                flush_rows = self.INGEST_FLUSH_ROWS
                 for record in records:
-                    if 'source' in record:
-                        source = record['source']
-
-                        # Route to appropriate table
-                        # ABO can return both yield curve and interbank records.
-                        # Interbank records have a 'rate' field and should NOT be inserted into gov_yield_curve.
-                        if source == 'ABO' and 'rate' in record:
-                            interbank_records.append(record)
-                        elif source in ['HNX_YC', 'ABO']:
-                            yield_curve_records.append(record)
-                        elif source == 'HNX_FTP_PDF':
-                            yield_change_records.append(record)
-                        elif source in ['SBV'] and 'rate' in record:
-                            interbank_records.append(record)
-                        elif source == 'HNX_AUCTION':
-                            auction_records.append(record)
-                        elif source == 'HNX_TRADING':
-                            trading_records.append(record)
-                        elif source == 'SBV_POLICY':
-                            policy_records.append(record)
-                        elif source == 'FRED':
-                            global_records.append(record)
-                        elif source == 'LAI_SUAT':
-                            bank_rates_records.append(record)
-
-                # Insert into database
-                if yield_curve_records:
-                    count = self.db_manager.insert_yield_curve(yield_curve_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} yield curve records")
-
-                if yield_change_records:
-                    count = self.db_manager.insert_yield_change_stats(yield_change_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} yield change stats records")
-
-                if interbank_records:
-                    count = self.db_manager.insert_interbank_rates(interbank_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} interbank rate records")
-
-                if auction_records:
-                    count = self.db_manager.insert_auction_results(auction_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} auction result records")
-
-                if trading_records:
-                    count = self.db_manager.insert_secondary_trading(trading_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} secondary trading records")
-
-                if policy_records:
-                    count = self.db_manager.insert_policy_rates(policy_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} policy rate records")
-
-                if global_records:
-                    count = self.db_manager.insert_global_rates(global_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} global rate records")
-
-                if bank_rates_records:
-                    count = self.db_manager.insert_bank_rates(bank_rates_records)
-                    total_records += count
-                    logger.info(f"Inserted {count} bank rate records")
+                    table = route((record.get('source'), 'rate' in record))
+                    if table is None:
+                        continue
+                    bucket = buckets[table]
+                    bucket.append(record)
+                    if len(bucket) >= flush_rows:
+                        total_records += self._insert_records(table, bucket)
+                        buckets[table] = []
+
+                for table in _TABLE_INSERTERS:
+                    if buckets.get(table):
+                        total_records += self._insert_records(table, buckets[table])
 
             elapsed_time = time.time() - start_time
 
             # Update ingest run
-            self.db_manager.update_ingest_run(
-                run_id=run_id,
-                status='completed',
-                rows_inserted=total_records
-            )
+            with self._db_lock:
+                self.db_manager.update_ingest_run(
+                    run_id=run_id,
+                    status='completed',
+                    rows_inserted=total_records
+                )
 
             result = {
                 'status': 'completed',
@@ -438,27 +474,36 @@ class IngestionPipeline:
             # Map provider to dataset_id
             dataset_id = f"{provider_name}_data"
 
-            self.db_manager.log_ingest_failure(
-                dataset_id=dataset_id,
-                provider=provider_name,
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d'),
-                error_type=error_type,
-                error_message=str(e),
-                raw_ref=None
-            )
+            with self._db_lock:
+                self.db_manager.log_ingest_failure(
+                    dataset_id=dataset_id,
+                    provider=provider_name,
+                    start_date=start_date.strftime('%Y-%m-%d'),
+                    end_date=end_date.strftime('%Y-%m-%d'),
+                    error_type=error_type,
+                    error_message=str(e),
+                    raw_ref=None
+                )
 
-            # Update ingest run with error
-            self.db_manager.update_ingest_run(
-                run_id=run_id,
-                status='failed',
-                rows_inserted=total_records,
-                error_message=str(e)
-            )
+                # Update ingest run with error
+                self.db_manager.update_ingest_run(
+                    run_id=run_id,
+                    status='failed',
+                    rows_inserted=total_records,
+                    error_message=str(e)
+                )
 
             logger.error(f"Provider {provider_name} failed after {elapsed_time:.2f}s: {e}")
             raise
 
+    def _insert_records(self, table: str, records: list[dict]) -> int:
+        """Write one bucket of routed records (one provider writes at a time)"""
+        insert_method, label = _TABLE_INSERTERS[table]
+        with self._db_lock:
+            count = getattr(self.db_manager, insert_method)(records)
+        logger.info(f"Inserted {count} {label} records")
+        return count
+
     def run_probe(self, providers: Optional[List[str]] = None, output_file: str = 'reports/provider_probe.json'):
         """
         Probe provider capabilities and generate JSON report
@@ -470,13 +515,10 @@ class IngestionPipeline:
         Returns:
             Probe results dictionary
         """
-        import json
-        from datetime import timedelta
-
         logger.info("Starting provider capability probe...")
 
         if providers is None:
-            providers = list(self.PROVIDERS.keys())
+            providers = list(self.PROVIDER_PATHS.keys())
 
         probe_results = {
             'probe_timestamp': datetime.now().isoformat(),
@@ -491,7 +533,7 @@ class IngestionPipeline:
         for provider_name in providers:
             logger.info(f"Probing {provider_name}...")
 
-            provider_class = self.PROVIDERS[provider_name]
+            provider_class = self._get_provider_class(provider_name)
             provider_info = {
                 'provider_name': provider_name,
                 'class_name': provider_class.__name__,
@@ -663,7 +705,7 @@ class IngestionPipeline:
             return
 
         if providers is None:
-            providers = list(self.PROVIDERS.keys())
+            providers = list(self.PROVIDER_PATHS.keys())
 
         # Generate date chunks
         chunks = self._generate_date_chunks(start, end, chunk)
@@ -900,7 +942,6 @@ class IngestionPipeline:
             Tuple of (stress_index, regime_bucket, components_dict)
         """
         from app.analytics.stress_model import BondYStressModel
-        import json
 
         stress_model = BondYStressModel(self.db_manager)
         stress_index, regime_bucket, components = stress_model.compute_stress_index(target_date)
@@ -952,7 +993,7 @@ def main():
     daily_parser.add_argument(
         '--providers',
         nargs='+',
-        choices=list(IngestionPipeline.PROVIDERS.keys()),
+        choices=list(IngestionPipeline.PROVIDER_PATHS.keys()),
         help='Providers to run (default: all)'
     )
 
@@ -971,7 +1012,7 @@ def main():
     backfill_parser.add_argument(
         '--providers',
         nargs='+',
-        choices=list(IngestionPipeline.PROVIDERS.keys()),
+        choices=list(IngestionPipeline.PROVIDER_PATHS.keys()),
         help='Providers to run (default: all)'
     )
 
@@ -990,7 +1031,7 @@ def main():
     chunked_parser.add_argument(
         '--providers',
         nargs='+',
-        choices=list(IngestionPipeline.PROVIDERS.keys()),
+        choices=list(IngestionPipeline.PROVIDER_PATHS.keys()),
         help='Providers to run (default: all)'
     )
     chunked_parser.add_argument(
@@ -1009,7 +1050,7 @@ def main():
     resume_parser.add_argument(
         '--providers',
         nargs='+',
-        choices=list(IngestionPipeline.PROVIDERS.keys()),
+        choices=list(IngestionPipeline.PROVIDER_PATHS.keys()),
         help='Providers to retry (default: all with failures)'
     )
 
@@ -1018,7 +1059,7 @@ def main():
     probe_parser.add_argument(
         '--providers',
         nargs='+',
-        choices=list(IngestionPipeline.PROVIDERS.keys()),
+        choices=list(IngestionPipeline.PROVIDER_PATHS.keys()),
         help='Providers to probe (default: all)'
     )
     probe_parser.add_argument(
@@ -14,7 +14,8 @@ from fastapi.responses import RedirectResponse, JSONResponse
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from app.config import settings
+from app.auth import is_admin_route, verify_admin_auth
+from app.config import _apply_backwards_compatibility, settings
 from app.db.schema import DatabaseManager
 from app.ingest import IngestionPipeline
 from app.api import routes
@@ -40,6 +41,7 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info("Starting application...")
+    _apply_backwards_compatibility()
 
     # Initialize database
     db_manager = DatabaseManager(settings.db_path)
@@ -90,6 +92,20 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Paths served by the backend itself; never redirected to the frontend.
+_NON_UI_PREFIXES = (
+    "/api",
+    "/healthz",
+    "/readyz",
+    "/metrics",
+    "/static",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/report",
+)
+
+
 # Redirect legacy (Jinja) UI routes to the Next.js frontend by default.
 # This keeps the backend as API/DB/ingest engine, and makes http://127.0.0.1:3002 the canonical UI.
 @app.middleware("http")
@@ -101,17 +117,7 @@ async def legacy_ui_redirect_middleware(request: Request, call_next):
         return await call_next(request)
 
     path = request.url.path or "/"
-    if (
-        path.startswith("/api")
-        or path.startswith("/healthz")
-        or path.startswith("/readyz")
-        or path.startswith("/metrics")
-        or path.startswith("/static")
-        or path.startswith("/docs")
-        or path.startswith("/openapi.json")
-        or path.startswith("/redoc")
-        or path.startswith("/report")
-    ):
+    if path.startswith(_NON_UI_PREFIXES):
         return await call_next(request)
 
     accept = request.headers.get("accept", "")
@@ -120,6 +126,19 @@ async def legacy_ui_redirect_middleware(request: Request, call_next):
 
     return await call_next(request)
 
+# Optional Basic auth for /admin/* and /api/admin/* (ADMIN_AUTH_ENABLED).
+# Non-admin paths return before touching any auth code.
+@app.middleware("http")
+async def admin_auth_middleware(request: Request, call_next):
+    if not is_admin_route(request.url.path):
+        return await call_next(request)
+
+    error = await verify_admin_auth(request)
+    if error:
+        return JSONResponse(status_code=error.status_code, content={"detail": error.detail}, headers=error.headers)
+
+    return await call_next(request)
+
 # CORS (needed for embedded Lai_suat Next.js UI on a different local port)
 app.add_middleware(
     CORSMiddleware,
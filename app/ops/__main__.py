@@ -9,6 +9,7 @@ Usage:
     python -m app.ops verify-backup --in <file>
     python -m app.ops list-backups
     python -m app.ops seed-demo --days 180
+    python -m app.ops rebuild-coverage
 """
 import argparse
 import logging
@@ -374,6 +375,19 @@ def cmd_seed_demo(args):
     print(f"\nTo enable demo mode banner, set: DEMO_MODE=true")
 
 
+def cmd_rebuild_coverage(args):
+    """Recompute table_coverage_rollup from the underlying tables"""
+    db = DatabaseManager(args.db)
+    db.connect()
+    try:
+        db.initialize_schema()
+        rebuilt = db.rebuild_coverage_rollup()
+    finally:
+        db.close()
+
+    print(f"✓ Rebuilt coverage rollup for {rebuilt} tables")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Ops CLI for VN Bond Lab')
     parser.add_argument('--db', default=settings.db_path, help='Database path')
@@ -422,6 +436,10 @@ def main():
     seed_parser.add_argument('--db', default=argparse.SUPPRESS, help='Database path')
     seed_parser.set_defaults(func=cmd_seed_demo)
 
+    # Rebuild-coverage command
+    rebuild_parser = subparsers.add_parser('rebuild-coverage', help='Recompute the table coverage rollup')
+    rebuild_parser.set_defaults(func=cmd_rebuild_coverage)
+
     args = parser.parse_args()
 
     if not args.command:
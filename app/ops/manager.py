@@ -151,6 +151,14 @@ class OpsManager:
             sql = f"INSERT INTO {table_name} SELECT * FROM read_csv_auto('{input_path}')"
             con.execute(sql)
 
+            # Bulk import bypasses the rollup maintenance in DatabaseManager;
+            # drop the stale row so readers scan until the next schema init
+            # (or `python -m app.ops rebuild-coverage`) rebuilds it.
+            try:
+                con.execute("DELETE FROM table_coverage_rollup WHERE table_name = ?", [table_name])
+            except duckdb.CatalogException:
+                pass
+
             logger.info(f"Imported data into {table_name} from {input_path}")
 
         finally:
@@ -7,7 +7,7 @@ import certifi
 import ssl
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app import config
@@ -90,6 +90,23 @@ class BaseProvider:
         """
         raise NotSupportedError(f"{self.name} does not support backfill()")
 
+    def backfill_iter(self, start_date: date, end_date: date) -> Iterator[Dict[str, Any]]:
+        """
+        Backfill data for a date range, yielding records as they are fetched
+
+        Providers that fetch day by day override this so callers can write
+        records while later days are still downloading; the default just
+        iterates backfill().
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Yields:
+            Dictionaries containing the data
+        """
+        yield from self.backfill(start_date, end_date)
+
     @retry(
         stop=stop_after_attempt(config.settings.max_retries),
         wait=wait_exponential(multiplier=1, min=2, max=10),
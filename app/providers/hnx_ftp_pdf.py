@@ -4,7 +4,7 @@ Fetches yield change statistics from HNX FTP server
 """
 import logging
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 import io
 import re
@@ -98,22 +98,36 @@ class HNXFTPPDFProvider(BaseProvider):
         Returns:
             List of all yield change statistics records
         """
+        return list(self.backfill_iter(start_date, end_date))
+
+    def backfill_iter(self, start_date: date, end_date: date) -> Iterator[Dict[str, Any]]:
+        """
+        Backfill yield change statistics for a date range, yielding each day's records
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Yields:
+            Yield change statistics records
+        """
         logger.info(f"Backfilling HNX FTP PDFs from {start_date} to {end_date}")
 
-        all_records = []
+        total = 0
         current_date = start_date
 
         while current_date <= end_date:
             try:
                 records = self.fetch(current_date)
-                all_records.extend(records)
             except Exception as e:
                 logger.debug(f"Skipping {current_date}: {e}")
+            else:
+                total += len(records)
+                yield from records
 
             current_date += timedelta(days=1)
 
-        logger.info(f"Backfill complete: {len(all_records)} total records")
-        return all_records
+        logger.info(f"Backfill complete: {total} total records")
 
     def _parse_pdf(
         self,
@@ -10,7 +10,7 @@ Historical Access Verdict: UNDER INVESTIGATION
 import logging
 import json
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from bs4 import BeautifulSoup
 import re
 import time
@@ -536,25 +536,39 @@ class HNXTradingProvider(BaseProvider):
         Raises:
             NotSupportedError: If historical access not available
         """
+        return list(self.backfill_iter(start_date, end_date))
+
+    def backfill_iter(self, start_date: date, end_date: date) -> Iterator[Dict[str, Any]]:
+        """
+        Backfill trading statistics for a date range, yielding each day's records
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Yields:
+            Trading records in range
+        """
         logger.info(f"Backfilling trading statistics from {start_date} to {end_date}")
 
-        all_records = []
+        total = 0
         current_date = start_date
 
         while current_date <= end_date:
             logger.info(f"Fetching trading statistics for {current_date}")
             try:
                 records = self.fetch(current_date)
-                all_records.extend(records)
             except Exception as e:
                 logger.error(f"Failed to fetch {current_date}: {e}")
+            else:
+                total += len(records)
+                yield from records
 
             if settings.rate_limit_seconds and settings.rate_limit_seconds > 0:
                 time.sleep(float(settings.rate_limit_seconds))
             current_date += timedelta(days=1)
 
-        logger.info(f"Backfill complete: {len(all_records)} total records")
-        return all_records
+        logger.info(f"Backfill complete: {total} total records")
 
     def _fetch_segment_rows(self, action: str, target_date: date) -> tuple[list[dict], Optional[str], Optional[str]]:
         """
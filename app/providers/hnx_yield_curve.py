@@ -8,7 +8,7 @@ Historical Access Verdict: HISTORICAL SUPPORTED (by date)
 """
 import logging
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from bs4 import BeautifulSoup
 import re
 import time
@@ -120,6 +120,17 @@ class HNXYieldCurveProvider(BaseProvider):
         """
         Backfill yield curve data for a date range
 
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        """
+        return list(self.backfill_iter(start_date, end_date))
+
+    def backfill_iter(self, start_date: date, end_date: date) -> Iterator[Dict[str, Any]]:
+        """
+        Backfill yield curve data for a date range, yielding each day's records
+
         Args:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
@@ -127,13 +138,16 @@ class HNXYieldCurveProvider(BaseProvider):
         """
         logger.info(f"Backfilling HNX yield curve from {start_date} to {end_date}")
 
-        all_records: list[dict] = []
+        total = 0
         current_date = start_date
         while current_date <= end_date:
             try:
-                all_records.extend(self.fetch(current_date))
+                records = self.fetch(current_date)
             except Exception as e:
                 logger.warning(f"Failed to fetch yield curve for {current_date}: {e}")
+            else:
+                total += len(records)
+                yield from records
 
             # Respect a light rate limit to be polite to HNX.
             if settings.rate_limit_seconds and settings.rate_limit_seconds > 0:
@@ -141,8 +155,7 @@ class HNXYieldCurveProvider(BaseProvider):
 
             current_date += timedelta(days=1)
 
-        logger.info(f"Backfill complete: {len(all_records)} total yield curve records")
-        return all_records
+        logger.info(f"Backfill complete: {total} total yield curve records")
 
     def discover_endpoints(self) -> Dict[str, Any]:
         """
@@ -166,7 +166,7 @@ class YieldCurveDayGap(DataQualityRule):
             LIMIT 30
             """
 
-            results = db_manager.con.execute(sql, [str(target_date)]).fetchall()
+            results = db_manager._cursor().execute(sql, [str(target_date)]).fetchall()
 
             if not results:
                 return False, 'ERROR', 'No yield curve data found in last 30 days', {}
@@ -210,7 +210,7 @@ class InterbankTenorCoverage(DataQualityRule):
             if not ib_data:
                 # SBV publishes an "applied date" which can lag the run date (weekends/holidays).
                 # Treat missing exact-date data as WARN and fall back to the latest available <= target_date.
-                latest = db_manager.con.execute(
+                latest = db_manager._cursor().execute(
                     "SELECT MAX(date) FROM interbank_rates WHERE date <= ?",
                     [str(target_date)],
                 ).fetchone()
@@ -369,7 +369,7 @@ class NumericParseCheck(DataQualityRule):
             WHERE date = ? AND ({' OR '.join(conditions)})
             """
 
-            result = db_manager.con.execute(sql, [str(target_date)]).fetchone()
+            result = db_manager._cursor().execute(sql, [str(target_date)]).fetchone()
 
             if result and result[0] > 0:
                 return False, 'WARN', f'Found {result[0]} records with invalid numeric values', {
@@ -411,7 +411,7 @@ class NegativeValuesCheck(DataQualityRule):
             WHERE date = ? AND ({' OR '.join(conditions)})
             """
 
-            result = db_manager.con.execute(sql, [str(target_date)]).fetchone()
+            result = db_manager._cursor().execute(sql, [str(target_date)]).fetchone()
 
             if result and result[0] > 0:
                 return False, 'ERROR', f'Found {result[0]} records with negative values', {
@@ -489,7 +489,7 @@ class SourceDriftDetection(DataQualityRule):
             LIMIT 2
             """
 
-            results = db_manager.con.execute(sql, [self.provider, self.dataset_id, str(target_date)]).fetchall()
+            results = db_manager._cursor().execute(sql, [self.provider, self.dataset_id, str(target_date)]).fetchall()
 
             if not results:
                 return True, 'INFO', 'No fingerprints recorded yet (first fetch)', {}
@@ -4,13 +4,30 @@ Data Quality Runner
 Executes DQ rules for a date and dataset, saves results to database.
 Implements gate policy (ERROR blocks compute, WARN allows with banner).
 """
+import json
 import logging
 from datetime import date
 from typing import Dict, Any, List, Optional
+
+from app.cache import invalidate as invalidate_cache
 from .rules import get_rules_for_dataset, get_all_datasets
 
 logger = logging.getLogger(__name__)
 
+# get_dq_results: $1/$2 target_date bounds, $3 dataset, $4 severity (NULL = any), $5 limit
+_SQL_DQ_RESULTS = """
+SELECT r.id, r.target_date, r.dataset_id, r.rule_code,
+       r.severity, r.passed, r.message, r.details_json,
+       r.created_at
+FROM dq_results r
+WHERE ($1::DATE IS NULL OR r.target_date >= $1)
+  AND ($2::DATE IS NULL OR r.target_date <= $2)
+  AND ($3::VARCHAR IS NULL OR r.dataset_id = $3)
+  AND ($4::VARCHAR IS NULL OR r.severity = $4)
+ORDER BY r.created_at DESC
+LIMIT $5
+"""
+
 
 class DataQualityRunner:
     """Runs data quality checks and implements gate policy"""
@@ -162,12 +179,11 @@ class DataQualityRunner:
             LIMIT 1
             """
 
-            result = self.db.con.execute(sql, [str(target_date)]).fetchone()
+            result = self.db._cursor().execute(sql, [str(target_date)]).fetchone()
 
             if not result:
                 return None
 
-            import json
             return {
                 'run_id': result[0],
                 'run_at': str(result[1]),
@@ -202,38 +218,15 @@ class DataQualityRunner:
             List of DQ result dictionaries
         """
         try:
-            sql = """
-            SELECT r.id, r.target_date, r.dataset_id, r.rule_code,
-                   r.severity, r.passed, r.message, r.details_json,
-                   r.created_at
-            FROM dq_results r
-            WHERE 1=1
-            """
-
-            params = []
-
-            if start_date:
-                sql += " AND r.target_date >= ?"
-                params.append(str(start_date))
+            params = [
+                str(start_date) if start_date else None,
+                str(end_date) if end_date else None,
+                dataset_id or None,
+                severity or None,
+                limit,
+            ]
+            results = self.db._cursor().execute(_SQL_DQ_RESULTS, params).fetchall()
 
-            if end_date:
-                sql += " AND r.target_date <= ?"
-                params.append(str(end_date))
-
-            if dataset_id:
-                sql += " AND r.dataset_id = ?"
-                params.append(dataset_id)
-
-            if severity:
-                sql += " AND r.severity = ?"
-                params.append(severity)
-
-            sql += " ORDER BY r.created_at DESC LIMIT ?"
-            params.append(limit)
-
-            results = self.db.con.execute(sql, params).fetchall()
-
-            import json
             output = []
             for row in results:
                 output.append({
@@ -257,12 +250,13 @@ class DataQualityRunner:
     def _create_dq_run(self, target_date: date) -> int:
         """Create a new DQ run record and return its ID"""
         try:
-            run_id = self.db.con.execute("SELECT nextval('dq_runs_id_seq')").fetchone()[0]
             sql = """
             INSERT INTO dq_runs (id, target_date, status, summary_json)
-            VALUES (?, ?, 'IN_PROGRESS', 'null')
+            VALUES (nextval('dq_runs_id_seq'), ?, 'IN_PROGRESS', 'null')
+            RETURNING id
             """
-            self.db.con.execute(sql, [run_id, str(target_date)])
+            run_id = self.db._cursor().execute(sql, [str(target_date)]).fetchone()[0]
+            invalidate_cache("dq_runs")
             return int(run_id)
 
         except Exception as e:
@@ -272,7 +266,6 @@ class DataQualityRunner:
     def _update_dq_run(self, run_id: int, status: str, summary: Dict[str, Any]):
         """Update DQ run with final status"""
         try:
-            import json
             sql = """
             UPDATE dq_runs
             SET status = ?,
@@ -280,7 +273,8 @@ class DataQualityRunner:
             WHERE id = ?
             """
 
-            self.db.con.execute(sql, [status, json.dumps(summary), run_id])
+            self.db._cursor().execute(sql, [status, json.dumps(summary), run_id])
+            invalidate_cache("dq_runs")
 
         except Exception as e:
             logger.error(f"Error updating DQ run: {e}")
@@ -298,11 +292,9 @@ class DataQualityRunner:
     ) -> int:
         """Save a DQ result and return its ID"""
         try:
-            import json
-            result_id = self.db.con.execute("SELECT nextval('dq_results_id_seq')").fetchone()[0]
             sql = """
             INSERT INTO dq_results (id, target_date, dataset_id, rule_code, severity, passed, message, details_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (nextval('dq_results_id_seq'), ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT (target_date, dataset_id, rule_code)
             DO UPDATE SET
                 severity = EXCLUDED.severity,
@@ -313,8 +305,7 @@ class DataQualityRunner:
             RETURNING id
             """
 
-            result = self.db.con.execute(sql, [
-                result_id,
+            result = self.db._cursor().execute(sql, [
                 str(target_date),
                 dataset_id,
                 rule_code,
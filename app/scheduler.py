@@ -93,6 +93,7 @@ class TaskScheduler:
                 # Run ingestion
                 pipeline = IngestionPipeline(self.db)
                 pipeline.run_daily()
+                self.db.prune_fingerprint_drift_rollup()
 
                 # Compute analytics
                 analytics = TransmissionAnalytics(self.db)
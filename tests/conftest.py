@@ -31,6 +31,24 @@ def temp_db():
     shutil.rmtree(temp_dir)
 
 
+@pytest.fixture
+def baseline_db(tmp_path):
+    """
+    Connected DatabaseManager on a file holding the original (pre-migration)
+    schema from fixtures/baseline_schema.sql; initialize_schema() not yet run
+    """
+    db = DatabaseManager(str(tmp_path / "baseline.duckdb"))
+    db.connect()
+    schema_sql = (Path(__file__).parent / "fixtures" / "baseline_schema.sql").read_text(encoding="utf-8")
+    for line in schema_sql.splitlines():
+        if line and not line.startswith("--"):
+            db.con.execute(line)
+
+    yield db
+
+    db.close()
+
+
 @pytest.fixture
 def sample_yield_curve_data():
     """Sample yield curve data for testing"""
@@ -0,0 +1,105 @@
+-- Schema as created by initialize_schema() before schema_migrations existed:
+-- every *_json column TEXT, no notification_events.channel_type, status indexes
+-- still present. Upgrade tests load this into an empty file. One statement per line.
+
+CREATE SEQUENCE alert_thresholds_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 10 NO CYCLE;
+CREATE SEQUENCE alerts_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE dq_results_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE dq_runs_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE ingest_failures_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE ingest_runs_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE notification_channels_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE notification_events_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE report_artifacts_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE source_fingerprints_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+CREATE SEQUENCE transmission_alerts_id_seq INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 NO CYCLE;
+
+CREATE TABLE alert_thresholds(id INTEGER PRIMARY KEY, alert_code VARCHAR NOT NULL UNIQUE, enabled BOOLEAN DEFAULT(CAST('t' AS BOOLEAN)), severity VARCHAR NOT NULL, params_json VARCHAR, updated_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE alerts(id INTEGER PRIMARY KEY, rule_code VARCHAR NOT NULL, severity VARCHAR NOT NULL, message VARCHAR, details_json VARCHAR, triggered_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE bank_rates(date DATE NOT NULL, product_group VARCHAR NOT NULL, series_code VARCHAR NOT NULL, bank_name VARCHAR NOT NULL, term_months INTEGER DEFAULT(-1) NOT NULL, term_label VARCHAR, rate_min_pct DOUBLE, rate_max_pct DOUBLE, rate_pct DOUBLE, source_url VARCHAR, source_priority INTEGER, scraped_at TIMESTAMP, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), "source" VARCHAR NOT NULL, CHECK((product_group IN ('deposit', 'loan'))), UNIQUE(date, series_code, bank_name, term_months));
+CREATE TABLE bondy_stress_daily(date DATE NOT NULL UNIQUE, stress_index DOUBLE, regime_bucket VARCHAR, driver_json VARCHAR, computed_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE daily_snapshots(date DATE NOT NULL UNIQUE, baseline_date DATE, snapshot_json VARCHAR, snapshot_text VARCHAR, generated_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), source_components_json VARCHAR);
+CREATE TABLE dq_results(id INTEGER PRIMARY KEY, target_date DATE NOT NULL, dataset_id VARCHAR NOT NULL, rule_code VARCHAR NOT NULL, severity VARCHAR NOT NULL, passed BOOLEAN NOT NULL, message VARCHAR, details_json VARCHAR, created_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(target_date, dataset_id, rule_code));
+CREATE TABLE dq_runs(id INTEGER PRIMARY KEY, run_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), target_date DATE NOT NULL, status VARCHAR NOT NULL, total_rules INTEGER, passed_rules INTEGER, failed_rules INTEGER, summary_json VARCHAR);
+CREATE TABLE global_rates_daily(date DATE NOT NULL, series_id VARCHAR NOT NULL, series_name VARCHAR NOT NULL, "value" DOUBLE, "source" VARCHAR NOT NULL, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, series_id, "source"));
+CREATE TABLE gov_auction_results(date DATE NOT NULL, instrument_type VARCHAR NOT NULL, tenor_label VARCHAR NOT NULL, tenor_days INTEGER NOT NULL, amount_offered DOUBLE, amount_sold DOUBLE, bid_to_cover DOUBLE, cut_off_yield DOUBLE, avg_yield DOUBLE, "source" VARCHAR NOT NULL, raw_file VARCHAR, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, instrument_type, tenor_label, "source"));
+CREATE TABLE gov_secondary_trading(date DATE NOT NULL, segment VARCHAR NOT NULL, bucket_label VARCHAR NOT NULL, segment_kind VARCHAR, segment_code VARCHAR, bucket_kind VARCHAR, bucket_code VARCHAR, bucket_display VARCHAR, volume DOUBLE, "value" DOUBLE, avg_yield DOUBLE, "source" VARCHAR NOT NULL, raw_file VARCHAR, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, segment, bucket_label, "source"));
+CREATE TABLE gov_yield_change_stats(date DATE NOT NULL, bucket_label VARCHAR NOT NULL, currency VARCHAR, volume_domestic DOUBLE, volume_foreign DOUBLE, weight_domestic DOUBLE, weight_foreign DOUBLE, yield_min_domestic DOUBLE, yield_max_domestic DOUBLE, yield_min_foreign DOUBLE, yield_max_foreign DOUBLE, "source" VARCHAR NOT NULL, raw_file VARCHAR, UNIQUE(date, bucket_label, "source"));
+CREATE TABLE gov_yield_curve(date DATE NOT NULL, tenor_label VARCHAR NOT NULL, tenor_days INTEGER NOT NULL, spot_rate_continuous DOUBLE, par_yield DOUBLE, spot_rate_annual DOUBLE, "source" VARCHAR NOT NULL, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, tenor_label, "source"));
+CREATE TABLE ingest_failures(id INTEGER PRIMARY KEY, dataset_id VARCHAR NOT NULL, provider VARCHAR NOT NULL, start_date DATE NOT NULL, end_date DATE NOT NULL, error_type VARCHAR NOT NULL, error_message VARCHAR, raw_ref VARCHAR, created_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE ingest_runs(id INTEGER PRIMARY KEY, provider VARCHAR NOT NULL, start_date DATE, end_date DATE, status VARCHAR NOT NULL, rows_inserted INTEGER DEFAULT(0), error_message VARCHAR, started_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), ended_at TIMESTAMP);
+CREATE TABLE interbank_rates(date DATE NOT NULL, tenor_label VARCHAR NOT NULL, rate DOUBLE NOT NULL, "source" VARCHAR NOT NULL, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, tenor_label, "source"));
+CREATE TABLE notification_channels(id INTEGER PRIMARY KEY, channel_type VARCHAR NOT NULL, enabled BOOLEAN DEFAULT(CAST('f' AS BOOLEAN)), config_json VARCHAR, created_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), updated_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE notification_events(id INTEGER PRIMARY KEY, date DATE NOT NULL, alert_code VARCHAR NOT NULL, channel_id INTEGER NOT NULL, status VARCHAR NOT NULL, error_message VARCHAR, sent_at TIMESTAMP, created_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE policy_rates(date DATE NOT NULL, rate_name VARCHAR NOT NULL, rate DOUBLE NOT NULL, "source" VARCHAR NOT NULL, raw_file VARCHAR, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, rate_name, "source"));
+CREATE TABLE report_artifacts(id INTEGER PRIMARY KEY, report_type VARCHAR NOT NULL, date DATE NOT NULL, file_path VARCHAR NOT NULL, file_size BIGINT, status VARCHAR NOT NULL, error_message VARCHAR, generated_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(report_type, date));
+CREATE TABLE source_fingerprints(id INTEGER PRIMARY KEY, provider VARCHAR NOT NULL, dataset_id VARCHAR NOT NULL, target_date DATE NOT NULL, fingerprint_hash VARCHAR NOT NULL, content_type VARCHAR, bytes INTEGER, fetched_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), parse_rowcount INTEGER, parse_required_fields_ok BOOLEAN, note VARCHAR, UNIQUE(provider, dataset_id, target_date, fingerprint_hash));
+CREATE TABLE transmission_alerts(id INTEGER PRIMARY KEY, date DATE NOT NULL, alert_type VARCHAR NOT NULL, severity VARCHAR NOT NULL, message VARCHAR, metric_value DOUBLE, threshold DOUBLE, source_data VARCHAR, created_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP));
+CREATE TABLE transmission_daily_metrics(date DATE NOT NULL, metric_name VARCHAR NOT NULL, metric_value DOUBLE, metric_value_text VARCHAR, source_components VARCHAR, computed_at TIMESTAMP DEFAULT(CURRENT_TIMESTAMP), UNIQUE(date, metric_name));
+
+CREATE INDEX idx_alert_thresholds_code ON alert_thresholds(alert_code);
+CREATE INDEX idx_alert_thresholds_enabled ON alert_thresholds(enabled);
+CREATE INDEX idx_alerts_rule_code ON alerts(rule_code);
+CREATE INDEX idx_alerts_severity ON alerts(severity);
+CREATE INDEX idx_alerts_triggered_at ON alerts(triggered_at);
+CREATE INDEX idx_bank_rates_bank ON bank_rates(bank_name);
+CREATE INDEX idx_bank_rates_date ON bank_rates(date);
+CREATE INDEX idx_bank_rates_series ON bank_rates(series_code);
+CREATE INDEX idx_bank_rates_source ON bank_rates("source");
+CREATE INDEX idx_bondy_stress_bucket ON bondy_stress_daily(regime_bucket);
+CREATE INDEX idx_bondy_stress_date ON bondy_stress_daily(date);
+CREATE INDEX idx_daily_snapshots_baseline ON daily_snapshots(baseline_date);
+CREATE INDEX idx_daily_snapshots_date ON daily_snapshots(date);
+CREATE INDEX idx_dq_results_dataset ON dq_results(dataset_id);
+CREATE INDEX idx_dq_results_severity ON dq_results(severity);
+CREATE INDEX idx_dq_results_target_date ON dq_results(target_date);
+CREATE INDEX idx_dq_runs_status ON dq_runs(status);
+CREATE INDEX idx_dq_runs_target_date ON dq_runs(target_date);
+CREATE INDEX idx_global_rates_date ON global_rates_daily(date);
+CREATE INDEX idx_global_rates_series ON global_rates_daily(series_id);
+CREATE INDEX idx_global_rates_source ON global_rates_daily("source");
+CREATE INDEX idx_gov_auction_results_date ON gov_auction_results(date);
+CREATE INDEX idx_gov_auction_results_source ON gov_auction_results("source");
+CREATE INDEX idx_gov_auction_results_type ON gov_auction_results(instrument_type);
+CREATE INDEX idx_gov_secondary_trading_date ON gov_secondary_trading(date);
+CREATE INDEX idx_gov_secondary_trading_segment ON gov_secondary_trading(segment);
+CREATE INDEX idx_gov_secondary_trading_source ON gov_secondary_trading("source");
+CREATE INDEX idx_yield_change_stats_date ON gov_yield_change_stats(date);
+CREATE INDEX idx_yield_change_stats_source ON gov_yield_change_stats("source");
+CREATE INDEX idx_gov_yield_curve_date ON gov_yield_curve(date);
+CREATE INDEX idx_gov_yield_curve_source ON gov_yield_curve("source");
+CREATE INDEX idx_ingest_failures_created_at ON ingest_failures(created_at);
+CREATE INDEX idx_ingest_failures_dataset ON ingest_failures(dataset_id);
+CREATE INDEX idx_ingest_failures_provider ON ingest_failures(provider);
+CREATE INDEX idx_interbank_rates_date ON interbank_rates(date);
+CREATE INDEX idx_interbank_rates_source ON interbank_rates("source");
+CREATE INDEX idx_interbank_rates_tenor ON interbank_rates(tenor_label);
+CREATE INDEX idx_notification_channels_enabled ON notification_channels(enabled);
+CREATE INDEX idx_notification_channels_type ON notification_channels(channel_type);
+CREATE INDEX idx_notification_events_alert ON notification_events(alert_code);
+CREATE INDEX idx_notification_events_channel ON notification_events(channel_id);
+CREATE INDEX idx_notification_events_date ON notification_events(date);
+CREATE INDEX idx_notification_events_status ON notification_events(status);
+CREATE INDEX idx_policy_rates_date ON policy_rates(date);
+CREATE INDEX idx_policy_rates_name ON policy_rates(rate_name);
+CREATE INDEX idx_policy_rates_source ON policy_rates("source");
+CREATE INDEX idx_report_artifacts_date ON report_artifacts(date);
+CREATE INDEX idx_report_artifacts_status ON report_artifacts(status);
+CREATE INDEX idx_report_artifacts_type ON report_artifacts(report_type);
+CREATE INDEX idx_source_fingerprints_dataset ON source_fingerprints(dataset_id);
+CREATE INDEX idx_source_fingerprints_date ON source_fingerprints(target_date);
+CREATE INDEX idx_source_fingerprints_hash ON source_fingerprints(fingerprint_hash);
+CREATE INDEX idx_source_fingerprints_provider ON source_fingerprints(provider);
+CREATE INDEX idx_transmission_alerts_created_at ON transmission_alerts(created_at);
+CREATE INDEX idx_transmission_alerts_date ON transmission_alerts(date);
+CREATE INDEX idx_transmission_alerts_severity ON transmission_alerts(severity);
+CREATE INDEX idx_transmission_alerts_type ON transmission_alerts(alert_type);
+CREATE INDEX idx_transmission_metrics_computed_at ON transmission_daily_metrics(computed_at);
+CREATE INDEX idx_transmission_metrics_date ON transmission_daily_metrics(date);
+CREATE INDEX idx_transmission_metrics_name ON transmission_daily_metrics(metric_name);
+
+CREATE VIEW v_bank_rates_latest AS SELECT * FROM bank_rates WHERE (date = (SELECT max(date) FROM bank_rates)) ORDER BY product_group, series_code, bank_name, term_months;
+CREATE VIEW v_bondy_stress_latest AS SELECT date, stress_index, regime_bucket, driver_json, computed_at FROM bondy_stress_daily WHERE (date = (SELECT max(date) FROM bondy_stress_daily));
+CREATE VIEW v_bondy_stress_timeseries AS SELECT date, stress_index, regime_bucket, computed_at FROM bondy_stress_daily ORDER BY date DESC;
+CREATE VIEW v_transmission_latest AS SELECT date, metric_name, metric_value, metric_value_text, source_components, computed_at FROM transmission_daily_metrics WHERE (date = (SELECT max(date) FROM transmission_daily_metrics)) ORDER BY metric_name;
+CREATE VIEW v_transmission_timeseries AS SELECT date, metric_name, metric_value, metric_value_text, computed_at FROM transmission_daily_metrics ORDER BY metric_name, date;
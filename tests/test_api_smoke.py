@@ -272,6 +272,34 @@ class TestCoverageAPI:
             assert 'latest_date' in data[table]
             assert 'date_count' in data[table]
 
+    def test_coverage_reports_seeded_and_empty_tables(self, client: TestClient):
+        """Seeded tables report their date span; untouched tables report no data"""
+        data = client.get("/api/admin/coverage").json()
+
+        today = date.today().isoformat()
+        assert data['gov_yield_curve']['has_data'] is True
+        assert data['gov_yield_curve']['earliest_date'] == today
+        assert data['gov_yield_curve']['date_count'] == 1
+
+        assert data['gov_yield_change_stats'] == {
+            'earliest_date': None,
+            'latest_date': None,
+            'date_count': 0,
+            'has_data': False
+        }
+
+    def test_coverage_refreshes_after_insert(self, client: TestClient, temp_db):
+        """Cached coverage is invalidated when a covered table is written"""
+        assert client.get("/api/admin/coverage").json()['gov_yield_change_stats']['has_data'] is False
+
+        temp_db.insert_yield_change_stats([
+            {'date': '2024-01-15', 'bucket_label': '1Y', 'source': 'HNX_FTP_PDF'}
+        ])
+
+        data = client.get("/api/admin/coverage").json()
+        assert data['gov_yield_change_stats']['has_data'] is True
+        assert data['gov_yield_change_stats']['latest_date'] == '2024-01-15'
+
 class TestDashboardFreshnessAPI:
     def test_dashboard_metrics_includes_freshness(self, client: TestClient):
         response = client.get("/api/dashboard/metrics")
@@ -1,10 +1,11 @@
 """
 Tests for database schema and operations
 """
+import json
 import pytest
-from datetime import date
+from datetime import date, datetime
 
-from app.db.schema import DatabaseManager
+from app.db.schema import DatabaseManager, _to_datetime
 
 
 def test_database_initialization(temp_db):
@@ -61,6 +62,38 @@ def test_yield_curve_upsert(temp_db):
     assert result[0] == 5.50
 
 
+def test_upsert_batch_with_duplicate_keys_keeps_last(temp_db):
+    """A batch repeating a conflict key behaves like row-by-row upserts"""
+    rows = [
+        {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 4.0, 'source': 'SBV'},
+        {'date': '2024-01-15', 'tenor_label': '1W', 'rate': 4.2, 'source': 'SBV'},
+        {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 4.1, 'source': 'SBV'},
+    ]
+
+    assert temp_db.insert_interbank_rates(rows) == 3
+
+    result = temp_db.con.execute(
+        "SELECT tenor_label, rate FROM interbank_rates ORDER BY tenor_label"
+    ).fetchall()
+    assert result == [('1W', 4.2), ('ON', 4.1)]
+
+
+def test_upsert_in_small_batches(temp_db):
+    """Chunked upserts store every row once, later chunks winning on conflict"""
+    rows = [
+        {'date': f'2024-01-{day:02d}', 'tenor_label': 'ON', 'rate': float(day), 'source': 'SBV'}
+        for day in range(1, 6)
+    ]
+    rows.append({'date': '2024-01-01', 'tenor_label': 'ON', 'rate': 9.0, 'source': 'SBV'})
+
+    temp_db.insert_interbank_rates(rows, batch_size=2)
+
+    result = temp_db.con.execute(
+        "SELECT COUNT(*), MAX(rate) FILTER (WHERE date = '2024-01-01') FROM interbank_rates"
+    ).fetchone()
+    assert result == (5, 9.0)
+
+
 def test_insert_interbank_rates(temp_db, sample_interbank_data):
     """Test inserting interbank rate data"""
     count = temp_db.insert_interbank_rates(sample_interbank_data)
@@ -82,6 +115,26 @@ def test_get_latest_yield_curve(temp_db, sample_yield_curve_data):
     assert result[0]['tenor_label'] == '2Y'
 
 
+def test_latest_yield_curve_prefers_hnx(temp_db):
+    """Latest picks the newest HNX date over newer ABO data, and HNX rows per tenor"""
+    def row(day, tenor, days, rate, source):
+        return {'date': day, 'tenor_label': tenor, 'tenor_days': days,
+                'spot_rate_annual': rate, 'source': source}
+
+    temp_db.insert_yield_curve([
+        row('2024-01-15', '2Y', 730, 4.0, 'HNX_YC'),
+        row('2024-01-15', '2Y', 730, 4.2, 'ABO'),
+        row('2024-01-15', '5Y', 1825, 4.6, 'ABO'),
+        row('2024-01-16', '2Y', 730, 4.3, 'ABO'),
+    ])
+
+    latest = temp_db.get_latest_yield_curve()
+    assert [(r['tenor_label'], r['source']) for r in latest] == [('2Y', 'HNX_YC'), ('5Y', 'ABO')]
+    assert str(latest[0]['date']) == '2024-01-15'
+
+    explicit = temp_db.get_latest_yield_curve('2024-01-16')
+    assert [(r['tenor_label'], r['spot_rate_annual']) for r in explicit] == [('2Y', 4.3)]
+
 def test_get_interbank_rates(temp_db, sample_interbank_data):
     """Test retrieving interbank rates with filters"""
     temp_db.insert_interbank_rates(sample_interbank_data)
@@ -96,6 +149,21 @@ def test_get_interbank_rates(temp_db, sample_interbank_data):
     assert result[0]['tenor_label'] == 'ON'
 
 
+def test_interbank_rates_canonicalize_across_sources(temp_db):
+    """One row per (date, tenor): SBV wins over ABO, which wins over others"""
+    temp_db.insert_interbank_rates([
+        {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 4.0, 'source': 'ABO'},
+        {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 4.1, 'source': 'SBV'},
+        {'date': '2024-01-15', 'tenor_label': '1W', 'rate': 4.5, 'source': 'OTHER'},
+        {'date': '2024-01-15', 'tenor_label': '1W', 'rate': 4.4, 'source': 'ABO'},
+    ])
+
+    result = temp_db.get_interbank_rates()
+    assert [(r['tenor_label'], r['source'], r['rate']) for r in result] == [
+        ('1W', 'ABO', 4.4),
+        ('ON', 'SBV', 4.1),
+    ]
+
 def test_ingest_run_logging(temp_db):
     """Test logging of ingest runs"""
     run_id = temp_db.log_ingest_run(
@@ -122,3 +190,789 @@ def test_ingest_run_logging(temp_db):
 
     assert result[0] == 'completed'
     assert result[1] == 100
+
+
+def test_coverage_rollup_tracks_inserts(temp_db, sample_yield_curve_data):
+    """Incremental rollup matches a full recompute after overlapping batches"""
+    temp_db.insert_yield_curve(sample_yield_curve_data)
+    # Re-upserting the same dates must not inflate date_count
+    temp_db.insert_yield_curve(sample_yield_curve_data)
+    temp_db.insert_yield_curve([
+        {'date': '2023-12-29', 'tenor_label': '1Y', 'tenor_days': 365,
+         'spot_rate_annual': 4.0, 'source': 'HNX_YC'}
+    ])
+
+    incremental = temp_db.get_coverage_rollup()['gov_yield_curve']
+    temp_db.rebuild_coverage_rollup(['gov_yield_curve'])
+    rebuilt = temp_db.get_coverage_rollup()['gov_yield_curve']
+
+    assert incremental == rebuilt
+    assert str(incremental[0]) == '2023-12-29'
+    assert temp_db.get_coverage_rollup()['policy_rates'] == (None, None, 0)
+
+
+def test_failed_batch_rolls_back(temp_db, sample_yield_curve_data):
+    """A batch that fails midway leaves neither rows nor rollup changes behind"""
+    before = temp_db.get_coverage_rollup()['gov_yield_curve']
+    bad_batch = sample_yield_curve_data + [
+        {'date': 'not-a-date', 'tenor_label': '1Y', 'spot_rate_annual': 4.0, 'source': 'HNX_YC'}
+    ]
+
+    with pytest.raises(Exception):
+        temp_db.insert_yield_curve(bad_batch)
+
+    assert temp_db.con.execute("SELECT COUNT(*) FROM gov_yield_curve").fetchone()[0] == 0
+    assert temp_db.get_coverage_rollup()['gov_yield_curve'] == before
+
+    # The connection is usable again after the rollback
+    assert temp_db.insert_yield_curve(sample_yield_curve_data) == len(sample_yield_curve_data)
+
+
+def test_ingest_run_ids_skip_rows_written_outside_sequence(temp_db):
+    """Ids written without the sequence (legacy MAX(id)+1, imports) are not reused"""
+    temp_db.con.execute(
+        "INSERT INTO ingest_runs (id, provider, status) VALUES (1, 'legacy', 'completed')"
+    )
+
+    # The colliding id resyncs the sequence and the insert is retried
+    run_id = temp_db.log_ingest_run(provider='test', start_date=None, end_date=None, status='running')
+    assert run_id == 2
+    assert temp_db.log_ingest_run(provider='test', start_date=None, end_date=None, status='running') == 3
+
+    # Schema init resyncs the sequence up front as well
+    temp_db.con.execute(
+        "INSERT INTO ingest_runs (id, provider, status) VALUES (100, 'legacy', 'completed')"
+    )
+    temp_db.initialize_schema()
+    assert temp_db.log_ingest_run(provider='test', start_date=None, end_date=None, status='running') == 101
+
+
+def test_ingest_failure_ids_come_from_sequence(temp_db):
+    """log_ingest_failure returns sequence ids and steps over legacy rows"""
+    args = ('bank_rates', 'sbv', '2024-01-01', '2024-01-31', 'timeout', 'read timed out')
+    assert temp_db.log_ingest_failure(*args) == 1
+
+    temp_db.con.execute(
+        "INSERT INTO ingest_failures (id, dataset_id, provider, start_date, end_date, error_type) "
+        "VALUES (2, 'legacy', 'sbv', '2024-01-01', '2024-01-31', 'parse')"
+    )
+    assert temp_db.log_ingest_failure(*args) == 3
+    assert len(temp_db.get_ingest_failures()) == 3
+
+
+def test_pending_resumes_group_failed_chunks(temp_db):
+    """Failures group per chunk; dataset_id optionally narrows the result"""
+    temp_db.log_ingest_failure('bank_rates', 'sbv', '2024-01-01', '2024-01-31', 'timeout', 'x')
+    temp_db.log_ingest_failure('bank_rates', 'sbv', '2024-01-01', '2024-01-31', 'timeout', 'y')
+    temp_db.log_ingest_failure('policy_rates', 'sbv', '2024-02-01', '2024-02-29', 'parse', 'z')
+
+    pending = temp_db.get_pending_resumes()
+    assert [(p['dataset_id'], p['fail_count']) for p in pending] == [('policy_rates', 1), ('bank_rates', 2)]
+
+    only_bank = temp_db.get_pending_resumes('bank_rates')
+    assert len(only_bank) == 1
+    assert (only_bank[0]['provider'], only_bank[0]['fail_count']) == ('sbv', 2)
+
+def test_to_datetime_parses_iso_strings():
+    """ISO strings (including a 'Z' suffix) parse; datetimes and None pass through"""
+    assert _to_datetime('2024-01-15T10:00:00') == datetime(2024, 1, 15, 10, 0)
+    assert _to_datetime('2024-01-15T10:00:00Z').utcoffset().total_seconds() == 0
+    now = datetime.now()
+    assert _to_datetime(now) is now
+    assert _to_datetime(None) is None
+
+def test_scaling_normalization_runs_once(temp_db):
+    """Scaling fixes are recorded in schema_migrations and skipped on later inits"""
+    applied = {
+        row[0] for row in temp_db.con.execute("SELECT name FROM schema_migrations").fetchall()
+    }
+    assert {'normalize_abo_yield_curve_scaling', 'normalize_transmission_yield_scaling'} <= applied
+
+    temp_db.insert_yield_curve([
+        {'date': '2024-01-15', 'tenor_label': '5Y', 'tenor_days': 1825,
+         'spot_rate_annual': 4141.0, 'source': 'ABO'}
+    ])
+    temp_db.initialize_schema()
+
+    rate = temp_db.con.execute(
+        "SELECT spot_rate_annual FROM gov_yield_curve WHERE source = 'ABO'"
+    ).fetchone()[0]
+    assert rate == 4141.0
+
+
+def test_normalize_records_fills_missing_keys(temp_db):
+    """Dict records may omit optional columns; those are bound as NULL"""
+    keys = ['date', 'tenor_label', 'rate']
+    complete = [{'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 2.5}]
+    partial = complete + [{'date': '2024-01-16', 'tenor_label': '1W'}]
+
+    assert temp_db._normalize_records(complete, keys) == [('2024-01-15', 'ON', 2.5)]
+    assert temp_db._normalize_records(partial, keys)[1] == ('2024-01-16', '1W', None)
+    assert temp_db._normalize_records(complete, ['rate']) == [(2.5,)]
+
+
+def test_column_migration_upgrades_legacy_table(tmp_path):
+    """Older tables gain missing columns once; the migration is then recorded"""
+    db = DatabaseManager(str(tmp_path / "legacy.duckdb"))
+    db.connect()
+    try:
+        db.con.execute("""
+            CREATE TABLE transmission_daily_metrics (
+                date DATE NOT NULL,
+                metric_name VARCHAR NOT NULL,
+                metric_value DOUBLE,
+                source_components TEXT,
+                computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(date, metric_name)
+            )
+        """)
+        db.initialize_schema()
+
+        columns = {
+            row[1] for row in db.con.execute("PRAGMA table_info('transmission_daily_metrics')").fetchall()
+        }
+        assert 'metric_value_text' in columns
+        assert db.con.execute(
+            "SELECT 1 FROM schema_migrations WHERE name = 'transmission_daily_metrics_v2_columns'"
+        ).fetchone()
+    finally:
+        db.close()
+
+
+def test_get_bank_rates_as_frame(temp_db):
+    """as_frame returns the same rows as the dict path"""
+    temp_db.insert_bank_rates([
+        {'date': '2024-01-15', 'product_group': 'deposit', 'series_code': 'deposit_online',
+         'bank_name': 'VCB', 'term_months': 12, 'rate_pct': 4.7, 'source': 'test'},
+        {'date': '2024-01-16', 'product_group': 'deposit', 'series_code': 'deposit_online',
+         'bank_name': 'VCB', 'term_months': 12, 'rate_pct': 4.8, 'source': 'test'},
+    ])
+
+    records = temp_db.get_bank_rates(bank_name='VCB')
+    frame = temp_db.get_bank_rates(bank_name='VCB', as_frame=True)
+
+    assert list(frame.columns) == list(records[0].keys())
+    assert frame['rate_pct'].tolist() == [r['rate_pct'] for r in records] == [4.8, 4.7]
+
+
+def test_latest_bank_rate_averages(temp_db):
+    """Averages are taken on each product group's own latest date"""
+    base = {'series_code': 's', 'source': 'test'}
+    temp_db.insert_bank_rates([
+        {**base, 'date': '2024-01-15', 'product_group': 'deposit', 'bank_name': 'A', 'term_months': 12, 'rate_pct': 4.0},
+        {**base, 'date': '2024-01-16', 'product_group': 'deposit', 'bank_name': 'A', 'term_months': 12, 'rate_pct': 5.0},
+        {**base, 'date': '2024-01-16', 'product_group': 'deposit', 'bank_name': 'B', 'term_months': 12, 'rate_pct': 6.0},
+        {**base, 'date': '2024-01-10', 'product_group': 'loan', 'bank_name': 'A', 'term_months': -1,
+         'rate_min_pct': 8.0, 'rate_max_pct': 10.0},
+        {**base, 'date': '2024-01-10', 'product_group': 'loan', 'bank_name': 'B', 'term_months': -1, 'rate_min_pct': 7.0},
+    ])
+
+    assert temp_db.get_latest_bank_rate_averages() == {
+        'latest_date': '2024-01-16',
+        'deposit_avg_12m': 5.5,
+        'loan_avg': 8.0,
+    }
+    assert temp_db.get_latest_bank_rate_averages(deposit_term_months=6)['deposit_avg_12m'] is None
+
+
+def test_connect_applies_runtime_settings(temp_db):
+    """DuckDB knobs from settings are applied to every new connection"""
+    preserve, threshold = temp_db.con.execute(
+        "SELECT current_setting('preserve_insertion_order'), current_setting('checkpoint_threshold')"
+    ).fetchone()
+    assert preserve is False
+    assert threshold == '953.6 MiB'  # 1GB as DuckDB reports it
+
+
+def test_worker_threads_write_through_own_cursors(temp_db, sample_yield_curve_data, sample_interbank_data):
+    """Inserts from other threads use per-thread cursors and are visible once committed"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yc = pool.submit(temp_db.insert_yield_curve, sample_yield_curve_data)
+        ib = pool.submit(temp_db.insert_interbank_rates, sample_interbank_data)
+        assert yc.result() == len(sample_yield_curve_data)
+        assert ib.result() == len(sample_interbank_data)
+        worker_cursor = pool.submit(temp_db._cursor).result()
+
+    assert worker_cursor is not temp_db.con
+    assert temp_db._cursor() is temp_db.con
+    assert temp_db.con.execute("SELECT COUNT(*) FROM gov_yield_curve").fetchone()[0] == len(sample_yield_curve_data)
+    assert temp_db.con.execute("SELECT COUNT(*) FROM interbank_rates").fetchone()[0] == len(sample_interbank_data)
+
+
+def test_release_thread_cursor_frees_worker_cursors(temp_db):
+    """Workers that release their cursor leave none registered across many short-lived pools"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def work(_):
+        try:
+            return temp_db.get_interbank_rates()
+        finally:
+            temp_db.release_thread_cursor()
+
+    for _ in range(20):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(work, range(8)))
+
+    assert temp_db._cursors == []
+    temp_db.release_thread_cursor()  # owner thread has no cursor of its own
+    assert temp_db._cursor() is temp_db.con
+
+
+def test_upsert_via_csv_staging(temp_db):
+    """Large upserts staged through CSV keep NULLs, empty strings and last-wins semantics"""
+    keys = ['date', 'tenor_label', 'rate', 'source', 'fetched_at']
+    temp_db.insert_interbank_rates([
+        {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 1.0, 'source': 'SBV'},
+    ])
+    rows = [
+        ('2024-01-15', 'ON', 2.5, 'SBV', datetime(2024, 1, 15, 9, 30)),
+        ('2024-01-15', '1W', None, 'SBV', None),
+        ('2024-01-15', '1W', 3.25, 'SBV', None),
+        ('2024-01-16', 'ON', 0.1 + 0.2, '', None),
+    ]
+
+    temp_db._bulk_upsert(
+        'interbank_rates', keys, ('date', 'tenor_label', 'source'), rows, copy_threshold=1
+    )
+
+    result = temp_db.con.execute(
+        "SELECT CAST(date AS VARCHAR), tenor_label, rate, source, fetched_at "
+        "FROM interbank_rates ORDER BY date, tenor_label"
+    ).fetchall()
+    assert result == [
+        ('2024-01-15', '1W', 3.25, 'SBV', None),
+        ('2024-01-15', 'ON', 2.5, 'SBV', datetime(2024, 1, 15, 9, 30)),
+        ('2024-01-16', 'ON', 0.1 + 0.2, '', None),
+    ]
+
+
+def test_get_bank_rates_filters(temp_db):
+    """Each optional filter narrows the static query; unset filters are ignored"""
+    base = {'series_code': 'deposit_online', 'product_group': 'deposit', 'source': 'test'}
+    temp_db.insert_bank_rates([
+        {**base, 'date': '2024-01-15', 'bank_name': 'VCB', 'term_months': 6, 'rate_pct': 4.0},
+        {**base, 'date': '2024-01-15', 'bank_name': 'VCB', 'term_months': 12, 'rate_pct': 4.5},
+        {**base, 'date': '2024-01-16', 'bank_name': 'ACB', 'term_months': 12, 'rate_pct': 4.6},
+    ])
+
+    assert len(temp_db.get_bank_rates()) == 3
+    assert len(temp_db.get_bank_rates(series_code='', bank_name='')) == 3
+    assert [r['rate_pct'] for r in temp_db.get_bank_rates(term_months=12)] == [4.6, 4.5]
+    assert [r['bank_name'] for r in temp_db.get_bank_rates(start_date='2024-01-16')] == ['ACB']
+    assert len(temp_db.get_bank_rates(bank_name='VCB', end_date='2024-01-15', limit=1)) == 1
+    assert temp_db.get_bank_rates(product_group='loan') == []
+
+
+def test_row_upserts_dedupe_to_last_record(temp_db):
+    """executemany-based upserts also keep only the last record per conflict key"""
+    count = temp_db.insert_policy_rates([
+        {'date': '2024-01-15', 'rate_name': 'refinancing', 'rate': 4.0, 'source': 'SBV'},
+        {'date': '2024-01-15', 'rate_name': 'refinancing', 'rate': 4.5, 'source': 'SBV'},
+        {'date': '2024-01-15', 'rate_name': 'rediscount', 'rate': 3.0, 'source': 'SBV'},
+    ])
+
+    assert count == 3
+    rows = temp_db.con.execute(
+        "SELECT rate_name, rate FROM policy_rates ORDER BY rate_name"
+    ).fetchall()
+    assert rows == [('rediscount', 3.0), ('refinancing', 4.5)]
+
+
+def test_upsert_skips_unchanged_rows(temp_db):
+    """Re-ingesting identical values leaves the row (and fetched_at) untouched"""
+    row = {'date': '2024-01-15', 'tenor_label': 'ON', 'rate': 2.5, 'source': 'SBV',
+           'fetched_at': '2024-01-15T09:00:00'}
+    temp_db.insert_interbank_rates([row])
+    temp_db.insert_interbank_rates([{**row, 'fetched_at': '2024-01-16T09:00:00'}])
+
+    fetched_at = temp_db.con.execute("SELECT CAST(fetched_at AS VARCHAR) FROM interbank_rates").fetchone()[0]
+    assert fetched_at == '2024-01-15 09:00:00'
+
+    temp_db.insert_interbank_rates([{**row, 'rate': 2.6, 'fetched_at': '2024-01-17T09:00:00'}])
+    assert temp_db.con.execute(
+        "SELECT rate, CAST(fetched_at AS VARCHAR) FROM interbank_rates"
+    ).fetchone() == (2.6, '2024-01-17 09:00:00')
+
+
+def test_transmission_alert_ids_allocated_in_one_range(temp_db):
+    """Each alert gets its own sequence id, and replacing a day keeps ids increasing"""
+    alerts = [
+        {'alert_type': 'ALERT_STRESS_HIGH', 'severity': 'HIGH', 'message': 'stress'},
+        {'alert_type': 'ALERT_LIQUIDITY_SPIKE', 'severity': 'MEDIUM', 'message': 'liquidity'},
+    ]
+    assert temp_db.insert_transmission_alerts('2024-01-15', alerts) == 2
+    assert temp_db.insert_transmission_alerts('2024-01-15', alerts) == 2
+
+    ids = [row[0] for row in temp_db.con.execute(
+        "SELECT id FROM transmission_alerts ORDER BY id"
+    ).fetchall()]
+    assert ids == [3, 4]
+
+
+def test_failed_alert_replace_keeps_previous_alerts(temp_db):
+    """A replace that fails midway leaves the day's earlier alerts untouched"""
+    alerts = [{'alert_type': 'ALERT_STRESS_HIGH', 'severity': 'HIGH', 'message': 'stress'}]
+    temp_db.insert_transmission_alerts('2024-01-15', alerts)
+
+    bad = [{'alert_type': 'ALERT_STRESS_HIGH', 'severity': 'HIGH', 'message': 'stress',
+            'metric_value': 'not-a-number'}]
+    with pytest.raises(Exception):
+        temp_db.insert_transmission_alerts('2024-01-15', bad)
+
+    rows = temp_db.con.execute("SELECT alert_type FROM transmission_alerts").fetchall()
+    assert rows == [('ALERT_STRESS_HIGH',)]
+
+
+def test_transmission_metric_payload_shapes(temp_db):
+    """Scalars, text and dict payloads map to value/value_text/source columns"""
+    from collections import OrderedDict
+
+    count = temp_db.insert_transmission_metrics('2024-01-15', {
+        'transmission_score': 55.0,
+        'regime_bucket': 'B2',
+        'level_2y': {'value': 4.1, 'value_text': None, 'sources': {'curve': 'HNX_YC'}},
+        'level_5y': OrderedDict(value=4.5),
+        'bad_value': [1, 2],
+    })
+    assert count == 4
+
+    rows = dict(
+        (row[0], row[1:]) for row in temp_db.con.execute(
+            "SELECT metric_name, metric_value, metric_value_text, source_components "
+            "FROM transmission_daily_metrics"
+        ).fetchall()
+    )
+    assert rows['transmission_score'] == (55.0, None, '{}')
+    assert rows['regime_bucket'] == (None, 'B2', '{}')
+    assert rows['level_2y'] == (4.1, None, '{"curve": "HNX_YC"}')
+    assert rows['level_5y'] == (4.5, None, '{}')
+
+
+def test_list_getters_project_fixed_columns(temp_db):
+    """List getters return the documented columns in a fixed order"""
+    temp_db.log_ingest_run(provider='test', start_date=None, end_date=None, status='running')
+    temp_db.insert_transmission_metrics('2024-01-15', {'transmission_score': 55.0})
+
+    assert list(temp_db.get_ingest_runs()[0]) == [
+        'id', 'provider', 'start_date', 'end_date', 'status',
+        'rows_inserted', 'error_message', 'started_at', 'ended_at',
+    ]
+    assert list(temp_db.get_transmission_metrics()[0]) == [
+        'date', 'metric_name', 'metric_value', 'metric_value_text', 'source_components', 'computed_at',
+    ]
+
+
+def test_empty_batches_are_noops(temp_db):
+    """Empty inputs return 0 without opening a transaction"""
+    for insert in (temp_db.insert_yield_curve, temp_db.insert_interbank_rates,
+                   temp_db.insert_auction_results, temp_db.insert_secondary_trading,
+                   temp_db.insert_policy_rates, temp_db.insert_global_rates):
+        assert insert([]) == 0
+    assert temp_db.insert_transmission_metrics('2024-01-15', {}) == 0
+    assert temp_db.insert_transmission_alerts('2024-01-15', []) == 0
+
+
+def test_plain_connection_can_share_open_database(temp_db):
+    """Runtime knobs are SET after connect, not passed as connect config, so
+    other plain connections to the same file (ops export/backup) still open"""
+    import duckdb
+
+    other = duckdb.connect(str(temp_db.db_path))
+    try:
+        assert other.execute("SELECT COUNT(*) FROM ingest_runs").fetchone() == (0,)
+    finally:
+        other.close()
+
+
+def test_filtered_getters_apply_optional_filters(temp_db):
+    """Each optional filter narrows the result; omitted ones leave it unfiltered"""
+    for day in ('2024-01-15', '2024-01-16', '2024-01-17'):
+        temp_db.insert_transmission_metrics(day, {'transmission_score': 50.0, 'level_2y': 4.0})
+    temp_db.insert_global_rates([
+        {'date': '2024-01-15', 'series_id': 'DGS10', 'series_name': 'UST 10Y', 'value': 4.1, 'source': 'FRED'},
+        {'date': '2024-01-16', 'series_id': 'DGS2', 'series_name': 'UST 2Y', 'value': 4.3, 'source': 'FRED'},
+    ])
+
+    assert len(temp_db.get_transmission_metrics()) == 6
+    assert len(temp_db.get_transmission_metrics(metric_name='level_2y')) == 3
+    assert len(temp_db.get_transmission_metrics(start_date='2024-01-16', end_date='2024-01-16')) == 2
+    assert len(temp_db.get_transmission_metrics(limit=1)) == 1
+
+    assert [r['series_id'] for r in temp_db.get_global_rates()] == ['DGS2', 'DGS10']
+    assert [r['series_id'] for r in temp_db.get_global_rates(series_id='DGS10')] == ['DGS10']
+    assert temp_db.get_global_rates(end_date='2024-01-14') == []
+
+
+def test_default_alert_thresholds_seed_missing_only(temp_db):
+    """Defaults are seeded once with distinct ids; re-init restores only missing codes"""
+    seeded = temp_db.get_alert_thresholds()
+    assert len(seeded) == 9
+    assert len({row['id'] for row in seeded}) == 9
+
+    temp_db.upsert_alert_threshold('ALERT_AUCTION_WEAK', enabled=False, severity='LOW', params={'btc_max': 1.0})
+    temp_db.con.execute("DELETE FROM alert_thresholds WHERE alert_code = 'ALERT_POLICY_CHANGE'")
+    temp_db.initialize_schema()
+
+    by_code = {row['alert_code']: row for row in temp_db.get_alert_thresholds()}
+    assert len(by_code) == 9
+    assert by_code['ALERT_AUCTION_WEAK']['enabled'] is False
+    assert by_code['ALERT_POLICY_CHANGE']['id'] > max(row['id'] for row in seeded)
+
+
+def test_alert_and_channel_upserts_update_in_place(temp_db):
+    """Repeated upserts keep one row per key and its original id"""
+    threshold_id = next(
+        row['id'] for row in temp_db.get_alert_thresholds() if row['alert_code'] == 'ALERT_AUCTION_WEAK'
+    )
+    temp_db.upsert_alert_threshold('ALERT_AUCTION_WEAK', enabled=False, severity='LOW', params={'btc_max': 1.0})
+    rows = [r for r in temp_db.get_alert_thresholds() if r['alert_code'] == 'ALERT_AUCTION_WEAK']
+    assert len(rows) == 1
+    assert rows[0]['id'] == threshold_id
+    assert rows[0]['severity'] == 'LOW'
+
+    temp_db.upsert_notification_channel('email', enabled=False, config={'to': 'a@example.com'})
+    temp_db.upsert_notification_channel('email', enabled=True, config={'to': 'b@example.com'})
+    rows = temp_db.con.execute(
+        "SELECT enabled, config_json FROM notification_channels WHERE channel_type = 'email'"
+    ).fetchall()
+    assert len(rows) == 1
+    assert rows[0][0] is True
+    assert 'b@example.com' in rows[0][1]
+
+    first = temp_db.insert_report_artifact('daily', date(2024, 1, 15), '/tmp/a.pdf', 10, 'success')
+    second = temp_db.insert_report_artifact('daily', date(2024, 1, 15), '/tmp/b.pdf', 20, 'success')
+    assert first == second
+
+
+def test_iter_bondy_stress_streams_in_batches(temp_db):
+    """iter_bondy_stress yields the same rows as get_bondy_stress across batches"""
+    for day in range(1, 6):
+        temp_db.insert_bondy_stress(f"2024-01-0{day}", 10.0 * day, "S1", "[]")
+
+    streamed = list(temp_db.iter_bondy_stress(batch_size=2))
+    assert streamed == temp_db.get_bondy_stress()
+    assert [r['date'] for r in streamed] == [date(2024, 1, d) for d in range(5, 0, -1)]
+    assert len(temp_db.get_bondy_stress(start_date='2024-01-02', end_date='2024-01-04')) == 3
+    assert len(temp_db.get_bondy_stress(limit=2)) == 2
+
+
+def test_single_row_getters_return_dict_or_none(temp_db):
+    """get_report_artifact returns a column dict for a hit and None for a miss"""
+    assert temp_db.get_report_artifact('daily', '2024-01-15') is None
+    artifact_id = temp_db.insert_report_artifact('daily', date(2024, 1, 15), '/tmp/a.pdf', 10, 'success')
+
+    artifact = temp_db.get_report_artifact('daily', '2024-01-15')
+    assert artifact['id'] == artifact_id
+    assert artifact['file_path'] == '/tmp/a.pdf'
+    assert temp_db.get_daily_snapshot('2024-01-15') is None
+
+
+def test_json_columns_migrated_from_text(temp_db):
+    """Older TEXT *_json columns are retyped to JSON with their indexes kept"""
+    temp_db.insert_bondy_stress("2024-01-15", 40.0, "S1", '[{"driver": "level"}]')
+    temp_db.con.execute("DROP INDEX idx_bondy_stress_date")
+    temp_db.con.execute("DROP INDEX idx_bondy_stress_bucket")
+    temp_db.con.execute("ALTER TABLE bondy_stress_daily ALTER COLUMN driver_json TYPE TEXT")
+    temp_db.con.execute("DELETE FROM schema_migrations WHERE name = 'json_column_types_bondy_stress_daily'")
+
+    temp_db.initialize_schema()
+
+    assert temp_db.con.execute(
+        "SELECT typeof(driver_json) FROM bondy_stress_daily"
+    ).fetchone()[0] == 'JSON'
+    indexes = {
+        row[0] for row in temp_db.con.execute(
+            "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'bondy_stress_daily'"
+        ).fetchall()
+    }
+    assert {'idx_bondy_stress_date', 'idx_bondy_stress_bucket'} <= indexes
+    assert temp_db.get_bondy_stress()[0]['driver_json'] == '[{"driver": "level"}]'
+
+
+def test_baseline_upgrade_converts_every_json_column(baseline_db):
+    """A file from the original schema gets every *_json column retyped on first start"""
+    from app.db.schema import _JSON_COLUMNS
+
+    baseline_db.con.execute(
+        "INSERT INTO alerts (id, rule_code, severity, message, details_json) "
+        "VALUES (nextval('alerts_id_seq'), 'R', 'INFO', 'm', '{\"k\": 1}')"
+    )
+    baseline_db.con.execute(
+        "INSERT INTO dq_runs (id, target_date, status, total_rules, passed_rules, failed_rules, summary_json) "
+        "VALUES (nextval('dq_runs_id_seq'), DATE '2024-01-15', 'PASS', 1, 1, 0, 'not json')"
+    )
+
+    baseline_db.initialize_schema()
+
+    types = {
+        (table, column): data_type
+        for table, column, data_type in baseline_db.con.execute(
+            "SELECT table_name, column_name, data_type FROM duckdb_columns()"
+        ).fetchall()
+    }
+    for table, columns in _JSON_COLUMNS.items():
+        for column in columns:
+            expected = 'VARCHAR' if table == 'dq_runs' else 'JSON'
+            assert types[(table, column)] == expected, (table, column)
+
+    applied = {name for (name,) in baseline_db.con.execute("SELECT name FROM schema_migrations").fetchall()}
+    assert 'json_column_types_dq_results' in applied
+    assert 'json_column_types_dq_runs' not in applied
+    assert baseline_db.con.execute("SELECT details_json FROM alerts").fetchone()[0] == '{"k": 1}'
+
+    baseline_db.con.execute("UPDATE dq_runs SET summary_json = '{}'")
+    baseline_db.initialize_schema()
+    assert baseline_db.con.execute(
+        "SELECT data_type FROM duckdb_columns() WHERE table_name = 'dq_runs' AND column_name = 'summary_json'"
+    ).fetchone()[0] == 'JSON'
+
+
+def test_has_notification_been_sent(temp_db):
+    """Only a 'sent' event for the same date/alert/channel counts as sent"""
+    assert temp_db.has_notification_been_sent('2024-01-15', 'ALERT_AUCTION_WEAK', 1) is False
+    temp_db.insert_notification_event('2024-01-15', 'ALERT_AUCTION_WEAK', 1, 'failed', 'smtp down')
+    assert temp_db.has_notification_been_sent('2024-01-15', 'ALERT_AUCTION_WEAK', 1) is False
+    temp_db.insert_notification_event('2024-01-15', 'ALERT_AUCTION_WEAK', 1, 'sent')
+    assert temp_db.has_notification_been_sent('2024-01-15', 'ALERT_AUCTION_WEAK', 1) is True
+    assert temp_db.has_notification_been_sent('2024-01-15', 'ALERT_AUCTION_WEAK', 2) is False
+
+
+def test_streaming_fingerprint_matches_in_memory(temp_db):
+    """Chunked hashing yields the same fingerprint and size as hashing the whole payload"""
+    payload = b'<html>' + b'x' * 100_000 + b'</html>'
+    expected = temp_db.insert_source_fingerprint(
+        'sbv', 'policy_rates', '2024-01-15', payload, 'text/html', 3, True
+    )
+    chunks = (payload[i:i + 4096] for i in range(0, len(payload), 4096))
+    streamed = temp_db.insert_source_fingerprint_streaming(
+        'sbv', 'policy_rates', '2024-01-16', chunks, 'text/html', 3, True
+    )
+
+    assert streamed == expected
+    sizes = {row['target_date']: row['bytes'] for row in temp_db.get_source_fingerprints(provider='sbv')}
+    assert sizes == {date(2024, 1, 15): len(payload), date(2024, 1, 16): len(payload)}
+
+
+def test_check_fingerprint_drift(temp_db):
+    """Drift compares against the newest prior fingerprint and flags rowcount drops"""
+    assert temp_db.check_fingerprint_drift('sbv', 'policy_rates', '2024-01-15', 'a' * 64) is None
+
+    old_hash = temp_db.insert_source_fingerprint(
+        'sbv', 'policy_rates', '2024-01-15', b'old', 'text/html', 100, True
+    )
+    assert temp_db.check_fingerprint_drift('sbv', 'policy_rates', '2024-01-15', old_hash) is None
+
+    new_hash = temp_db.insert_source_fingerprint(
+        'sbv', 'policy_rates', '2024-01-16', b'new', 'text/html', 50, True
+    )
+    temp_db.con.execute(
+        "UPDATE source_fingerprints SET fetched_at = fetched_at - INTERVAL 1 DAY WHERE fingerprint_hash = ?",
+        [old_hash],
+    )
+    drift = temp_db.check_fingerprint_drift('sbv', 'policy_rates', '2024-01-16', new_hash)
+    assert drift is None
+
+    drift = temp_db.check_fingerprint_drift('sbv', 'policy_rates', '2024-01-17', old_hash)
+    assert drift['previous_rowcount'] == 50
+    assert drift['current_rowcount'] == 100
+    assert 'regression' not in drift
+
+
+def test_notification_event_records_channel_type(temp_db):
+    """Events carry their channel's type so listings need no join"""
+    temp_db.upsert_notification_channel('telegram', enabled=True, config={})
+    channel_id = temp_db.get_notification_channels()[0]['id']
+
+    temp_db.insert_notification_event('2024-01-15', 'ALERT_AUCTION_WEAK', channel_id, 'sent')
+    temp_db.insert_notification_event('2024-01-15', 'ALERT_AUCTION_WEAK', 999, 'failed')
+
+    rows = temp_db.con.execute(
+        "SELECT channel_id, channel_type FROM notification_events ORDER BY id"
+    ).fetchall()
+    assert rows == [(channel_id, 'telegram'), (999, None)]
+
+
+def test_get_source_fingerprints_filters_and_frame(temp_db):
+    """Fingerprint filters compose, and as_frame returns the same rows as a DataFrame"""
+    temp_db.insert_source_fingerprint('sbv', 'policy_rates', '2024-01-15', b'a', 'text/html', 1, True)
+    temp_db.insert_source_fingerprint('sbv', 'interbank', '2024-01-16', b'b', 'text/html', 1, True)
+    temp_db.insert_source_fingerprint('hnx', 'yield_curve', '2024-01-16', b'c', 'text/html', 1, True)
+
+    assert len(temp_db.get_source_fingerprints()) == 3
+    assert len(temp_db.get_source_fingerprints(provider='sbv')) == 2
+    assert len(temp_db.get_source_fingerprints(provider='sbv', start_date='2024-01-16')) == 1
+    assert len(temp_db.get_source_fingerprints(limit=1)) == 1
+
+    frame = temp_db.get_source_fingerprints(dataset_id='yield_curve', as_frame=True)
+    assert list(frame['provider']) == ['hnx']
+
+
+def test_enabled_only_filters(temp_db):
+    """enabled_only toggles the static enabled filter for thresholds and channels"""
+    temp_db.upsert_alert_threshold('ALERT_AUCTION_WEAK', enabled=False, severity='LOW', params={})
+    all_codes = {r['alert_code'] for r in temp_db.get_alert_thresholds()}
+    enabled_codes = {r['alert_code'] for r in temp_db.get_alert_thresholds(enabled_only=True)}
+    assert 'ALERT_AUCTION_WEAK' in all_codes - enabled_codes
+
+    temp_db.upsert_notification_channel('email', enabled=False, config={})
+    temp_db.upsert_notification_channel('telegram', enabled=True, config={})
+    assert [r['channel_type'] for r in temp_db.get_notification_channels()] == ['telegram']
+    assert len(temp_db.get_notification_channels(enabled_only=False)) == 2
+
+
+def test_batch_notification_events_and_fingerprints(temp_db):
+    """Batch writers return ids/hashes in order, skip repeated fingerprints and fold the rollup once"""
+    event_ids = temp_db.insert_notification_events_many([
+        {'date': '2024-01-15', 'alert_code': 'ALERT_AUCTION_WEAK', 'channel_id': 1, 'status': 'sent'},
+        {'date': '2024-01-15', 'alert_code': 'ALERT_POLICY_CHANGE', 'channel_id': 1, 'status': 'failed',
+         'error_message': 'timeout'},
+    ])
+    assert len(set(event_ids)) == 2
+    assert temp_db.insert_notification_events_many([]) == []
+    assert temp_db.has_notification_been_sent('2024-01-15', 'ALERT_AUCTION_WEAK', 1)
+
+    record = {'provider': 'sbv', 'dataset_id': 'policy_rates', 'target_date': '2024-01-15',
+              'content': b'a', 'content_type': 'text/html', 'parse_rowcount': 10,
+              'parse_required_fields_ok': True}
+    hashes = temp_db.insert_source_fingerprints_many([
+        record, record, {**record, 'content': b'b', 'parse_required_fields_ok': False},
+    ])
+    assert hashes[0] == hashes[1] != hashes[2]
+    assert len(temp_db.get_source_fingerprints()) == 2
+
+    rollup = temp_db.con.execute(
+        "SELECT sum(rowcount_n), sum(parse_failures) FROM fingerprint_drift_30d"
+    ).fetchone()
+    assert rollup == (2, 1)
+
+
+def test_inline_sequence_inserts_return_ids(temp_db):
+    """Writers that draw ids inside the INSERT return the stored row's id"""
+    first = temp_db.insert_alert('RULE_A', 'HIGH', 'first')
+    second = temp_db.insert_alert('RULE_A', 'HIGH', 'second', details={'k': 1})
+    assert second == first + 1
+    assert temp_db.con.execute(
+        "SELECT message FROM alerts WHERE id = ?", [second]
+    ).fetchone()[0] == 'second'
+
+    run_id = temp_db.insert_dq_run('2024-01-15T10:00:00', 'PASS', 3, 3, 0)
+    assert temp_db.con.execute("SELECT status FROM dq_runs WHERE id = ?", [run_id]).fetchone()[0] == 'PASS'
+
+
+def test_bondy_stress_views(temp_db):
+    """The latest view returns only the newest day; the timeseries view every day"""
+    assert temp_db.con.execute("SELECT * FROM v_bondy_stress_latest").fetchall() == []
+    for day in ("2024-01-15", "2024-01-17", "2024-01-16"):
+        temp_db.insert_bondy_stress(day, 40.0, "S1", "[]")
+
+    latest = temp_db.con.execute("SELECT date FROM v_bondy_stress_latest").fetchall()
+    assert latest == [(date(2024, 1, 17),)]
+    assert temp_db.con.execute("SELECT count(*) FROM v_bondy_stress_timeseries").fetchone()[0] == 3
+
+
+def test_transmission_metrics_as_tuples(temp_db):
+    """as_tuples returns the same rows as named tuples"""
+    temp_db.insert_transmission_metrics('2024-01-15', {'transmission_score': 50.0, 'level_2y': 4.0})
+
+    dicts = temp_db.get_transmission_metrics()
+    tuples = temp_db.get_transmission_metrics(as_tuples=True)
+    assert [t._asdict() for t in tuples] == dicts
+    assert {t.metric_name: t.metric_value for t in tuples} == {'transmission_score': 50.0, 'level_2y': 4.0}
+
+
+def test_turnover_threshold_legacy_key_migrated(temp_db):
+    """A stored zscore_max param on ALERT_TURNOVER_DROP is renamed to z_max on init"""
+    temp_db.upsert_alert_threshold('ALERT_TURNOVER_DROP', enabled=False, severity='LOW', params={'zscore_max': -2.0})
+    temp_db.initialize_schema()
+
+    row = next(r for r in temp_db.get_alert_thresholds() if r['alert_code'] == 'ALERT_TURNOVER_DROP')
+    assert row['enabled'] is False
+    assert json.loads(row['params_json']) == {'z_max': -2.0}
+
+
+def test_failed_migration_rolls_back_alone(temp_db):
+    """A migration that fails is rolled back and unrecorded; the next one still applies"""
+    def broken():
+        temp_db.con.execute("INSERT INTO alerts (id, rule_code, severity, message) VALUES (9001, 'X', 'INFO', 'm')")
+        try:
+            temp_db.con.execute("SELECT CAST('nope' AS INTEGER)")
+        except Exception:
+            return False
+        return True
+
+    def working():
+        temp_db.con.execute("INSERT INTO alerts (id, rule_code, severity, message) VALUES (9002, 'Y', 'INFO', 'm')")
+        return True
+
+    assert temp_db._apply_migration('test_broken', broken) is True
+    assert temp_db._apply_migration('test_working', working) is True
+
+    assert temp_db.con.execute("SELECT id FROM alerts WHERE id > 9000").fetchall() == [(9002,)]
+    applied = {name for (name,) in temp_db.con.execute("SELECT name FROM schema_migrations").fetchall()}
+    assert 'test_working' in applied and 'test_broken' not in applied
+
+
+def test_bulk_upsert_bind_error_rolls_back(temp_db, sample_interbank_data):
+    """A batch that cannot be bound raises its own error and leaves the connection usable"""
+    bad = [{**sample_interbank_data[0], 'rate': 'not-a-rate'}]
+
+    with pytest.raises(Exception) as exc_info:
+        temp_db.insert_interbank_rates(sample_interbank_data[1:] + bad)
+    assert 'transaction is aborted' not in str(exc_info.value)
+
+    assert temp_db.con.execute("SELECT count(*) FROM interbank_rates").fetchone()[0] == 0
+    assert temp_db.insert_interbank_rates(sample_interbank_data) == len(sample_interbank_data)
+
+
+def test_upgrade_keeps_duplicate_notification_channels(baseline_db):
+    """Upgrading a database with several channels of one type keeps them all"""
+    baseline_db.con.execute("""
+        INSERT INTO notification_channels (id, channel_type, enabled, config_json)
+        SELECT nextval('notification_channels_id_seq'), channel_type, enabled, config_json
+        FROM (VALUES
+            (1, 'email', true, '{"to": "a@example.com"}'),
+            (2, 'email', false, '{"to": "b@example.com"}'),
+            (3, 'webhook', true, '{"url": "https://example.com/hook"}')
+        ) AS v(n, channel_type, enabled, config_json)
+        ORDER BY n
+    """)
+
+    baseline_db.initialize_schema()
+
+    rows = baseline_db.con.execute("SELECT id, channel_type FROM notification_channels ORDER BY id").fetchall()
+    assert rows == [(1, 'email'), (2, 'email'), (3, 'webhook')]
+    assert 'ALERT_AUCTION_WEAK' in {r['alert_code'] for r in baseline_db.get_alert_thresholds()}
+
+    baseline_db.con.execute(
+        "INSERT INTO notification_channels (id, channel_type, enabled) VALUES (nextval('notification_channels_id_seq'), 'email', true)"
+    )
+    assert len(baseline_db.get_notification_channels(enabled_only=False)) == 4
+
+
+def test_unique_channel_type_index_is_dropped(temp_db):
+    """Databases that got the unique channel_type index lose it on the next start"""
+    temp_db.con.execute(
+        "CREATE UNIQUE INDEX idx_notification_channels_type_unique ON notification_channels(channel_type)"
+    )
+    temp_db.con.execute("DELETE FROM schema_migrations WHERE name = 'drop_notification_channels_unique_type'")
+
+    temp_db.initialize_schema()
+
+    assert not temp_db.con.execute(
+        "SELECT 1 FROM duckdb_indexes() WHERE index_name = 'idx_notification_channels_type_unique'"
+    ).fetchone()
+
+
+def test_bulk_upsert_keeps_literal_csv_null_marker(temp_db):
+    """A string equal to the CSV NULL marker is stored as-is whatever the batch size"""
+    keys = ['date', 'tenor_label', 'rate', 'source']
+    rows = [('2024-01-15', '\\N', 2.5, 'SBV'), ('2024-01-15', 'ON', 1.0, '\\N')]
+
+    temp_db._bulk_upsert('interbank_rates', keys, ('date', 'tenor_label', 'source'), rows, copy_threshold=1)
+
+    result = temp_db.con.execute(
+        "SELECT tenor_label, source FROM interbank_rates ORDER BY rate"
+    ).fetchall()
+    assert result == [('ON', '\\N'), ('\\N', 'SBV')]
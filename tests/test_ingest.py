@@ -0,0 +1,109 @@
+"""
+Tests for the ingestion pipeline orchestration
+"""
+import threading
+from datetime import date
+
+import pytest
+
+from app.ingest import IngestionPipeline
+
+
+def _fake_provider(records=None, error=None, seen_threads=None):
+    """Provider class returning fixed records (or raising) from backfill()"""
+
+    class FakeProvider:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def backfill(self, start_date, end_date):
+            if seen_threads is not None:
+                seen_threads.add(threading.get_ident())
+            if error:
+                raise RuntimeError(error)
+            return [dict(r) for r in records]
+
+    return FakeProvider
+
+
+def test_run_backfill_runs_providers_concurrently(temp_db, sample_yield_curve_data, monkeypatch):
+    """Providers run on pool threads; one failing provider does not stop the others"""
+    seen_threads = set()
+    yield_curve = [{**r, 'source': 'HNX_YC'} for r in sample_yield_curve_data]
+    monkeypatch.setattr(IngestionPipeline, '_provider_classes', {
+        'hnx_yield_curve': _fake_provider(yield_curve, seen_threads=seen_threads),
+        'broken': _fake_provider(error='upstream down', seen_threads=seen_threads),
+    })
+
+    pipeline = IngestionPipeline(db_manager=temp_db)
+    results = pipeline.run_backfill('2024-01-15', '2024-01-16', providers=['hnx_yield_curve', 'broken'])
+
+    assert list(results) == ['hnx_yield_curve', 'broken']
+    assert results['hnx_yield_curve']['rows_inserted'] == 3
+    assert results['broken'] == {'status': 'error', 'error': 'upstream down'}
+    assert threading.get_ident() not in seen_threads
+
+    statuses = dict(temp_db.con.execute("SELECT provider, status FROM ingest_runs").fetchall())
+    assert statuses == {'hnx_yield_curve': 'completed', 'broken': 'failed'}
+    assert temp_db._cursors == []
+
+
+def test_provider_classes_resolve_lazily(monkeypatch):
+    """Provider classes are imported on first lookup and cached"""
+    monkeypatch.setattr(IngestionPipeline, '_provider_classes', {})
+
+    provider_class = IngestionPipeline._get_provider_class('fred_global')
+
+    assert provider_class.__name__ == 'FREDGlobalProvider'
+    assert IngestionPipeline._provider_classes == {'fred_global': provider_class}
+    with pytest.raises(ValueError, match='Unknown provider'):
+        IngestionPipeline._get_provider_class('nope')
+
+
+def test_run_provider_routes_records_by_source(temp_db, sample_yield_curve_data, sample_interbank_data, monkeypatch):
+    """ABO rate records go to interbank, other ABO records to the yield curve; SBV without rate is dropped"""
+    records = (
+        [{**r, 'source': 'ABO'} for r in sample_yield_curve_data]
+        + [{**r, 'source': 'ABO'} for r in sample_interbank_data]
+        + [{'date': '2024-01-15', 'source': 'SBV'}, {'date': '2024-01-15', 'source': 'UNKNOWN'}]
+    )
+    monkeypatch.setattr(IngestionPipeline, '_provider_classes', {'abo': _fake_provider(records)})
+
+    pipeline = IngestionPipeline(db_manager=temp_db)
+    results = pipeline.run_backfill('2024-01-15', '2024-01-16', providers=['abo'])
+
+    assert results['abo']['rows_inserted'] == len(sample_yield_curve_data) + len(sample_interbank_data)
+    counts = temp_db.con.execute(
+        "SELECT (SELECT count(*) FROM gov_yield_curve), (SELECT count(*) FROM interbank_rates)"
+    ).fetchone()
+    assert counts == (len(sample_yield_curve_data), len(sample_interbank_data))
+
+
+def test_run_provider_flushes_streamed_backfill(temp_db, sample_yield_curve_data, monkeypatch):
+    """Records from backfill_iter are written in INGEST_FLUSH_ROWS batches while the provider streams"""
+    rows_seen = []
+
+    class StreamingProvider:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def backfill_iter(self, start_date, end_date):
+            for r in sample_yield_curve_data:
+                rows_seen.append(temp_db.con.execute("SELECT count(*) FROM gov_yield_curve").fetchone()[0])
+                yield {**r, 'source': 'HNX_YC'}
+
+    monkeypatch.setattr(IngestionPipeline, '_provider_classes', {'hnx_yield_curve': StreamingProvider})
+    monkeypatch.setattr(IngestionPipeline, 'INGEST_FLUSH_ROWS', 2)
+
+    pipeline = IngestionPipeline(db_manager=temp_db)
+    result = pipeline._run_provider('hnx_yield_curve', date(2024, 1, 15), date(2024, 1, 16))
+
+    assert result['rows_inserted'] == 3
+    assert rows_seen == [0, 0, 2]
+    assert temp_db.con.execute("SELECT count(*) FROM gov_yield_curve").fetchone()[0] == 3
@@ -285,6 +285,10 @@ class TestMonitoringAPIs:
         assert "last_ingest" in data
         assert "last_dq" in data
         assert "slo_30d" in data
+        assert data["last_ingest"]["status"] == "success"
+        assert data["last_dq"]["status"] == "PASS"
+        assert data["slo_30d"]["total_days"] == 1
+        assert data["slo_30d"]["dq_success_rate"] == 100.0
 
     def test_monitoring_providers_api(self, temp_db):
         """Test that /api/admin/monitoring/providers returns provider stats"""
@@ -330,6 +334,41 @@ class TestMonitoringAPIs:
         data = response.json()
         assert "drifts" in data
 
+    def test_monitoring_drift_api_aggregates_rollup(self, temp_db):
+        """Drift signals come from the rollup and ignore duplicate fingerprints"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.api import routes
+
+        for content, rowcount, ok in (
+            (b"v1", 100, True),
+            (b"v1", 100, True),  # duplicate, not stored
+            (b"v2", 80, False),
+        ):
+            temp_db.insert_source_fingerprint(
+                provider="TEST_PROVIDER",
+                dataset_id="test_dataset",
+                target_date=date(2024, 1, 15),
+                content=content,
+                content_type="text/html",
+                parse_rowcount=rowcount,
+                parse_required_fields_ok=ok,
+            )
+
+        original_db = routes.db_manager
+        routes.set_db_manager(temp_db)
+        try:
+            response = TestClient(app).get("/api/admin/monitoring/drift")
+        finally:
+            routes.set_db_manager(original_db)
+
+        assert response.status_code == 200
+        drifts = response.json()["drifts"]
+        assert len(drifts) == 1
+        assert drifts[0]["fingerprint_changes"] == 1
+        assert drifts[0]["avg_rowcount"] == 90.0
+        assert drifts[0]["parse_failures"] == 1
+
     def test_monitoring_apis_return_json(self, temp_db):
         """Test that monitoring APIs return valid JSON"""
         from fastapi.testclient import TestClient
@@ -356,6 +395,137 @@ class TestMonitoringAPIs:
             assert isinstance(data, dict)
 
 
+class TestNotificationAPIs:
+    """Test notification channel admin APIs"""
+
+    def test_email_password_masked_on_every_read(self, temp_db):
+        """Masking the password must not alter the cached parsed config"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.schema import db_manager
+
+        db_manager.__dict__.update(temp_db.__dict__)
+
+        temp_db.upsert_notification_channel(
+            "email",
+            True,
+            {"smtp_server": "smtp.example.com", "to_addr": "b@example.com", "password": "s3cret"},
+        )
+
+        client = TestClient(app)
+        for _ in range(2):
+            response = client.get("/api/admin/notifications")
+            assert response.status_code == 200
+            channels = response.json()
+            assert channels[0]["config"]["password"] == "******"
+
+        stored = temp_db.get_notification_channels(enabled_only=False)[0]["config_json"]
+        assert json.loads(stored)["password"] == "s3cret"
+
+    def test_notification_events_filters(self, temp_db):
+        """Event listing filters by alert code and channel and carries channel_type"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.schema import db_manager
+
+        db_manager.__dict__.update(temp_db.__dict__)
+
+        temp_db.upsert_notification_channel("telegram", True, {})
+        channel_id = temp_db.get_notification_channels()[0]["id"]
+        temp_db.insert_notification_events_many([
+            {"date": "2024-01-15", "alert_code": "ALERT_AUCTION_WEAK", "channel_id": channel_id, "status": "sent"},
+            {"date": "2024-01-15", "alert_code": "ALERT_POLICY_CHANGE", "channel_id": channel_id, "status": "sent"},
+        ])
+
+        client = TestClient(app)
+        events = client.get("/api/admin/notifications/events").json()
+        assert len(events) == 2
+        assert {e["channel_type"] for e in events} == {"telegram"}
+
+        events = client.get(
+            "/api/admin/notifications/events", params={"alert_code": "ALERT_POLICY_CHANGE"}
+        ).json()
+        assert [e["alert_code"] for e in events] == ["ALERT_POLICY_CHANGE"]
+        assert client.get(
+            "/api/admin/notifications/events", params={"channel_id": channel_id + 1}
+        ).json() == []
+
+
+class TestQualityAPIs:
+    """Test data quality admin APIs"""
+
+    def test_dq_latest_reflects_new_run(self, temp_db):
+        """A cached NOT_RUN status must not hide a DQ run made through the API"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.schema import db_manager
+
+        db_manager.__dict__.update(temp_db.__dict__)
+
+        client = TestClient(app)
+        target = "2024-01-15"
+
+        response = client.get(f"/api/admin/quality/latest?date={target}")
+        assert response.status_code == 200
+        assert response.json()["status"] == "NOT_RUN"
+
+        response = client.post(f"/api/admin/quality/run?date={target}")
+        assert response.status_code == 200
+
+        response = client.get(f"/api/admin/quality/latest?date={target}")
+        assert response.status_code == 200
+        assert response.json()["status"] != "NOT_RUN"
+
+    def test_dq_latest_reflects_run_outside_api(self, temp_db):
+        """A cached NOT_RUN status is dropped when the runner writes dq_runs directly"""
+        from datetime import date
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.schema import db_manager
+        from app.quality import DataQualityRunner
+
+        db_manager.__dict__.update(temp_db.__dict__)
+
+        client = TestClient(app)
+        target = "2024-01-15"
+
+        response = client.get(f"/api/admin/quality/latest?date={target}")
+        assert response.json()["status"] == "NOT_RUN"
+
+        # The scheduler's daily ingest runs DQ without going through the endpoints
+        DataQualityRunner(temp_db).run_dq_for_date(target_date=date(2024, 1, 15))
+
+        response = client.get(f"/api/admin/quality/latest?date={target}")
+        assert response.status_code == 200
+        assert response.json()["status"] != "NOT_RUN"
+
+    def test_dq_run_range_covers_every_date_in_order(self, temp_db):
+        """Range runs return one result per day, in date order"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.schema import db_manager
+
+        db_manager.__dict__.update(temp_db.__dict__)
+        cursors_before = len(db_manager._cursors)
+
+        client = TestClient(app)
+        response = client.post(
+            "/api/admin/quality/run-range?start_date=2024-01-10&end_date=2024-01-20"
+        )
+
+        assert response.status_code == 200
+        runs = response.json()["runs"]
+        assert [r["date"] for r in runs] == [f"2024-01-{d}" for d in range(10, 21)]
+        assert len({r["result"]["run_id"] for r in runs}) == len(runs)
+
+        count = temp_db.con.execute(
+            "SELECT COUNT(DISTINCT target_date) FROM dq_runs WHERE status != 'IN_PROGRESS'"
+        ).fetchone()[0]
+        assert count == len(runs)
+        # Range workers release their cursors when each date is done
+        assert len(db_manager._cursors) == cursors_before
+
+
 class TestMetricsEndpointMetricNames:
     """Test that /metrics endpoint returns expected metric names"""
 
@@ -488,6 +658,56 @@ class TestEnvMappingAuth:
                 assert 'BASIC_AUTH' in record.message
 
 
+class TestAdminAuth:
+    """Test Basic auth verification for admin routes"""
+
+    @staticmethod
+    def _verify(header):
+        import asyncio
+        from starlette.requests import Request
+        from app.auth import verify_admin_auth
+
+        headers = [(b"authorization", header.encode())] if header else []
+        request = Request({"type": "http", "headers": headers})
+        return asyncio.run(verify_admin_auth(request))
+
+    def test_credentials_checked_when_enabled(self, monkeypatch):
+        """Valid credentials pass; wrong or malformed credentials get 401"""
+        import base64
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "admin_auth_enabled", True)
+        monkeypatch.setattr(settings, "admin_user", "ops")
+        monkeypatch.setattr(settings, "admin_password", "s3cret:with-colon")
+
+        def basic(value):
+            return "Basic " + base64.b64encode(value.encode()).decode()
+
+        assert self._verify(basic("ops:s3cret:with-colon")) is None
+        assert self._verify(basic("ops:wrong")).status_code == 401
+        assert self._verify(basic("other:s3cret:with-colon")).status_code == 401
+        assert self._verify(basic("no-separator")).status_code == 401
+        assert self._verify("Basic !!!not-base64").status_code == 401
+        assert self._verify(None).status_code == 401
+
+    def test_middleware_guards_only_admin_routes(self, monkeypatch):
+        """Admin paths need credentials when enabled; other paths are untouched"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "admin_auth_enabled", True)
+        monkeypatch.setattr(settings, "admin_user", "ops")
+        monkeypatch.setattr(settings, "admin_password", "s3cret")
+
+        client = TestClient(app)
+        response = client.get("/api/admin/coverage")
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Basic"
+
+        assert client.get("/healthz").status_code == 200
+
+
 class TestReadyzContract:
     """Test /readyz endpoint returns expected contract"""
 
@@ -181,3 +181,64 @@ class TestPDFGeneration:
 
         except ImportError:
             pytest.skip("ReportLab not available")
+
+
+class TestStressComputeRangeAPI:
+    """Test /api/admin/stress/compute-range candidate selection"""
+
+    def test_skip_existing_excludes_stored_dates(self, temp_db):
+        """Dates already in bondy_stress_daily are not pending when skip_existing=True"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.api import routes
+
+        original_db = routes.db_manager
+        routes.set_db_manager(temp_db)
+        try:
+            for day in ("2024-01-15", "2024-01-16", "2024-01-17"):
+                temp_db.insert_transmission_metrics(day, {"transmission_score": 55.0})
+            temp_db.insert_bondy_stress("2024-01-16", 40.0, "S1", "[]")
+
+            client = TestClient(app)
+            response = client.post(
+                "/api/admin/stress/compute-range",
+                params={"start_date": "2024-01-15", "end_date": "2024-01-17", "max_dates": 0},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total_candidate_dates"] == 3
+            assert data["pending_dates"] == 2
+
+            response = client.post(
+                "/api/admin/stress/compute-range",
+                params={"start_date": "2024-01-16", "end_date": "2024-01-16", "max_dates": 0},
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total_candidate_dates"] == 1
+            assert data["pending_dates"] == 0
+
+            response = client.post(
+                "/api/admin/stress/compute-range",
+                params={"start_date": "2024-01-20", "end_date": "2024-01-20", "max_dates": 0},
+            )
+            assert response.status_code == 200
+            assert response.json()["total_candidate_dates"] == 0
+        finally:
+            routes.set_db_manager(original_db)
+
+    def test_invalid_date_is_rejected(self, temp_db):
+        """Malformed dates are a client error, not a server error"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        client = TestClient(app)
+        response = client.post("/api/admin/stress/compute", params={"target_date": "15/01/2024"})
+        assert response.status_code == 400
+
+        response = client.post(
+            "/api/admin/stress/compute-range",
+            params={"start_date": "2024-01-15", "end_date": "not-a-date"},
+        )
+        assert response.status_code == 400